@@ -1,8 +1,8 @@
 import streamlit as st
 import json
-import os
 from backend.resume_parser import parse_resume
-from backend.resume_matcher import match_resume_to_job
+from backend.resume_matcher import MATCH_PROFILE, match_resume_to_job, resume_sections
+from backend.summarization import DEFAULT_SUMMARIZER, SUMMARIZERS
 
 # Configure page
 st.set_page_config(page_title="AI Resume Screener", layout="wide")
@@ -12,21 +12,22 @@ st.title("📄 AI Resume Screener")
 # Define tabs
 tabs = ["Resume Parsing", "Resume Matching", "Experience Scoring", "Interview Evaluation"]
 selected_tab = st.sidebar.radio("Select Feature", tabs)
+summary_backends = list(SUMMARIZERS)
+summary_backend = st.sidebar.selectbox(
+    "Summary quality", summary_backends,
+    index=summary_backends.index(DEFAULT_SUMMARIZER) if DEFAULT_SUMMARIZER in summary_backends else 0,
+    help="Extractive is instant; distilbart and bart are slower abstractive models",
+)
 
 if selected_tab == "Resume Parsing":
     st.subheader("📑 Resume Parsing")
     uploaded_file = st.file_uploader("Upload Resume", type=["pdf", "docx"])
     
     if uploaded_file:
-        temp_dir = "temp"
-        os.makedirs(temp_dir, exist_ok=True)
-        temp_path = os.path.join(temp_dir, uploaded_file.name)
-        
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
         st.write("Processing...")
-        parsed_data = parse_resume(temp_path)
+        # Parsed straight from the upload buffer, no temp file
+        parsed_data = parse_resume(uploaded_file.getbuffer(), file_name=uploaded_file.name,
+                                   summarizer=summary_backend)
         
         if "error" in parsed_data:
             st.error(parsed_data["error"])
@@ -58,8 +59,6 @@ if selected_tab == "Resume Parsing":
             # Download button
             json_data = json.dumps(parsed_data, indent=4)
             st.download_button("Download JSON", json_data, "resume_data.json", "application/json")
-        
-        os.remove(temp_path)
 
 elif selected_tab == "Resume Matching":
     st.subheader("🔍 Resume Matching")
@@ -68,14 +67,12 @@ elif selected_tab == "Resume Matching":
     job_desc = st.text_area("Paste Job Description")
     
     if uploaded_file and job_desc:
-        temp_path = os.path.join("temp", uploaded_file.name)
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        parsed_data = parse_resume(temp_path)
+        # Only what matching reads is extracted; no summary is generated
+        parsed_data = parse_resume(uploaded_file.getbuffer(), file_name=uploaded_file.name,
+                                   fields=MATCH_PROFILE)
         
         if "error" not in parsed_data:
-            match_result = match_resume_to_job(parsed_data["text"], job_desc)
+            match_result = match_resume_to_job(parsed_data["text"], job_desc, resume_sections(parsed_data))
             
             st.subheader("Matching Results")
             cols = st.columns(2)
@@ -89,6 +86,4 @@ elif selected_tab == "Resume Matching":
                 if match_result['matched_skills'][0] == "No Matching Skills Found":
                     st.warning("No skills matched")
                 else:
-                    st.write(", ".join(match_result['matched_skills']))
-        
-        os.remove(temp_path)
\ No newline at end of file
+                    st.write(", ".join(match_result['matched_skills']))
\ No newline at end of file
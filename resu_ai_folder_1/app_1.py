@@ -1,71 +1,148 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, url_for
 import os
-from backend.resume_parser import parse_resume
-from backend.resume_matcher import match_resume_to_job
-import numpy as np
+import json
+import time
+from backend.resume_parser import PROFILES, parse_resume
+from backend.resume_matcher import match_resume_to_job, resume_sections
+from backend.async_api import analysis_result
+from backend.models import model_stats
+from backend.instrumentation import collect_timings, configure_logging, render_prometheus
+from backend.jobs import JobQueue, QueueFull
+from backend.summarization import SUMMARIZERS
 import sys
 import io
 
 # Fix encoding for Windows
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+configure_logging()
+
 app = Flask(__name__, static_folder="static", static_url_path="/static")
 
-UPLOAD_FOLDER = "uploads"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-def convert_numpy_types(obj):
-    if isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(i) for i in obj]
-    elif isinstance(obj, (np.float32, np.float64)):
-        return float(obj)
-    elif isinstance(obj, (np.int32, np.int64)):
-        return int(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    else:
-        return obj
+# Resumes are processed off the request thread by a bounded worker pool
+job_queue = JobQueue(
+    workers=int(os.environ.get("RESUAI_JOB_WORKERS", "2")),
+    max_pending=int(os.environ.get("RESUAI_JOB_QUEUE_SIZE", "16")),
+)
 
 @app.route("/static/<path:filename>")
 def static_files(filename):
     return app.send_static_file(filename)
 
+@app.route("/models")
+def models():
+    return jsonify(model_stats())
+
+@app.route("/metrics")
+def metrics():
+    # Prometheus scrape target: per-stage latency/CPU/memory histograms
+    gauges = {
+        "resuai_jobs_pending": job_queue.pending(),
+        "resuai_process_rss_mb": model_stats()["process_rss_mb"],
+    }
+    return Response(render_prometheus(gauges), mimetype="text/plain; version=0.0.4")
+
+def analyze_resume(data: bytes, file_name: str, job_description: str = "", summarizer: str = None,
+                   include_stages: bool = False, profile: str = None) -> dict:
+    """Parse (and optionally match) an upload held in memory, timing each stage"""
+    timings = {}
+    with collect_timings() as stages:
+        start = time.perf_counter()
+        parsed_data = parse_resume(data, file_name=file_name, summarizer=summarizer, fields=profile)
+        timings["parse_seconds"] = round(time.perf_counter() - start, 3)
+        if "error" in parsed_data:
+            return parsed_data
+
+        if job_description:
+            start = time.perf_counter()
+            match_result = match_resume_to_job(parsed_data["text"], job_description,
+                                               resume_sections(parsed_data))
+            timings["match_seconds"] = round(time.perf_counter() - start, 3)
+            parsed_data.update(match_result)
+
+    return analysis_result(parsed_data, timings, stages, include_stages)
+
+def _uploaded_resume():
+    if "resume" not in request.files:
+        return None, (jsonify({"error": "No file uploaded"}), 400)
+    resume = request.files["resume"]
+    if resume.filename == "":
+        return None, (jsonify({"error": "No selected file"}), 400)
+    return resume, None
+
+def _requested_summarizer():
+    # Optional per-request summary backend: extractive, distilbart or bart
+    summarizer = request.form.get("summarizer") or None
+    return summarizer if summarizer in SUMMARIZERS else None
+
+def _requested_profile():
+    # Optional parse profile: full (default), fast (no summary) or match
+    profile = request.form.get("profile") or None
+    return profile if profile in PROFILES else None
+
+def _requested_stage_timings() -> bool:
+    return (request.values.get("timings") or "").lower() in ("1", "true", "yes")
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    resume, error = _uploaded_resume()
+    if error:
+        return error
+
+    # Uploads are parsed from memory; nothing is written to disk
+    data = resume.read()
+    job_description = request.form.get("job_description", "")
+    try:
+        job_id = job_queue.submit(analyze_resume, data, resume.filename, job_description,
+                                  _requested_summarizer(), _requested_stage_timings(), _requested_profile())
+    except QueueFull as e:
+        response = jsonify({"error": str(e)})
+        response.headers["Retry-After"] = "5"
+        return response, 503
+
+    return jsonify({
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": url_for("job_status", job_id=job_id),
+        "stream_url": url_for("job_stream", job_id=job_id),
+    }), 202
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job.to_dict())
+
+@app.route("/jobs/<job_id>/stream")
+def job_stream(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+
+    def events():
+        # Server-sent events: a status line now and then, the result at the end
+        while not job.done.wait(timeout=2.0):
+            yield f"data: {json.dumps({'job_id': job.id, 'status': job.status})}\n\n"
+        yield f"data: {json.dumps(job.to_dict())}\n\n"
+
+    return Response(events(), mimetype="text/event-stream")
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     if request.method == "POST":
-        if "resume" not in request.files:
-            return jsonify({"error": "No file uploaded"}), 400
-            
-        resume = request.files["resume"]
-        if resume.filename == "":
-            return jsonify({"error": "No selected file"}), 400
-            
-        file_path = os.path.join(UPLOAD_FOLDER, resume.filename)
-        resume.save(file_path)
-        
+        resume, error = _uploaded_resume()
+        if error:
+            return error
+
         try:
-            parsed_data = parse_resume(file_path)
-            if "error" in parsed_data:
-                return jsonify({"error": parsed_data["error"]}), 400
-                
-            job_description = request.form.get("job_description", "")
-            if job_description:
-                match_result = match_resume_to_job(parsed_data["text"], job_description)
-                parsed_data.update(match_result)
-            
-            clean_data = convert_numpy_types(parsed_data)
-            return jsonify(clean_data)
-            
+            result = analyze_resume(resume.read(), resume.filename, request.form.get("job_description", ""),
+                                    _requested_summarizer(), _requested_stage_timings(), _requested_profile())
+            if "error" in result:
+                return jsonify({"error": result["error"]}), 400
+            return jsonify(result)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
-            
-        finally:
-            if os.path.exists(file_path):
-                os.remove(file_path)
     
     return render_template("index.html")
 
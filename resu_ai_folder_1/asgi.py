@@ -0,0 +1,167 @@
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+from starlette.templating import Jinja2Templates
+
+from backend import async_api
+from backend.async_api import analyze_resume_async
+from backend.config import BASE_DIR
+from backend.instrumentation import configure_logging, render_prometheus
+from backend.jobs import Job
+from backend.models import model_stats
+from backend.resume_parser import PROFILES
+from backend.summarization import SUMMARIZERS
+
+# The Flask app's endpoints on an event loop: one process serves many
+# concurrent uploads, e.g.  uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+configure_logging()
+
+# Uploads being processed at once; further /jobs submissions get a 503
+MAX_ACTIVE_JOBS = int(os.environ.get("RESUAI_ASYNC_MAX_JOBS", "64"))
+JOB_RESULT_TTL = 600.0
+
+templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
+# index.html is shared with the Flask app and uses Flask's url_for signature
+templates.env.globals["url_for"] = lambda endpoint, filename: f"/static/{filename}"
+
+_jobs: Dict[str, Job] = {}
+_tasks: Dict[str, asyncio.Task] = {}
+
+async def _analyze_upload(request: Request):
+    """analyze_resume_async arguments from a multipart upload, or an error response"""
+    form = await request.form()
+    resume = form.get("resume")
+    if resume is None or isinstance(resume, str):
+        return None, JSONResponse({"error": "No file uploaded"}, status_code=400)
+    if not resume.filename:
+        return None, JSONResponse({"error": "No selected file"}, status_code=400)
+
+    # Optional per-request summary backend and parse profile, as in the Flask app
+    summarizer = form.get("summarizer") or None
+    profile = form.get("profile") or None
+    timings = (form.get("timings") or request.query_params.get("timings") or "").lower()
+    return (
+        await resume.read(), resume.filename, form.get("job_description", ""),
+        summarizer if summarizer in SUMMARIZERS else None,
+        timings in ("1", "true", "yes"),
+        profile if profile in PROFILES else None,
+    ), None
+
+def _active_jobs() -> int:
+    return sum(1 for job in _jobs.values() if not job.done.is_set())
+
+def _expire_finished():
+    cutoff = time.time() - JOB_RESULT_TTL
+    for job_id in [job_id for job_id, job in _jobs.items() if job.finished_at and job.finished_at < cutoff]:
+        del _jobs[job_id]
+        _tasks.pop(job_id, None)
+
+async def _run_job(job: Job):
+    job.status = "running"
+    job.started_at = time.time()
+    try:
+        job.result = await job.func(*job.args, **job.kwargs)
+        job.status = "done"
+    except Exception as e:
+        job.error = str(e)
+        job.status = "failed"
+    finally:
+        job.finished_at = time.time()
+        job.done.set()
+
+async def index(request: Request):
+    if request.method == "POST":
+        args, error = await _analyze_upload(request)
+        if error:
+            return error
+
+        try:
+            result = await analyze_resume_async(*args)
+            if "error" in result:
+                return JSONResponse({"error": result["error"]}, status_code=400)
+            return JSONResponse(result)
+        except Exception as e:
+            return JSONResponse({"error": str(e)}, status_code=500)
+
+    return templates.TemplateResponse(request, "index.html")
+
+async def submit_job(request: Request):
+    args, error = await _analyze_upload(request)
+    if error:
+        return error
+
+    _expire_finished()
+    if _active_jobs() >= MAX_ACTIVE_JOBS:
+        return JSONResponse({"error": "Too many resumes are waiting to be processed"}, status_code=503,
+                            headers={"Retry-After": "5"})
+    job = Job(analyze_resume_async, args, {})
+    _jobs[job.id] = job
+    _tasks[job.id] = asyncio.create_task(_run_job(job))
+
+    return JSONResponse({
+        "job_id": job.id,
+        "status": "queued",
+        "status_url": str(request.url_for("job_status", job_id=job.id)),
+        "stream_url": str(request.url_for("job_stream", job_id=job.id)),
+    }, status_code=202)
+
+async def job_status(request: Request):
+    job = _jobs.get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"error": "Unknown job"}, status_code=404)
+    return JSONResponse(job.to_dict())
+
+async def job_stream(request: Request):
+    job_id = request.path_params["job_id"]
+    job = _jobs.get(job_id)
+    if job is None:
+        return JSONResponse({"error": "Unknown job"}, status_code=404)
+
+    async def events():
+        # Server-sent events: a status line now and then, the result at the end
+        while not job.done.is_set():
+            await asyncio.wait([_tasks[job_id]], timeout=2.0)
+            if not job.done.is_set():
+                yield f"data: {json.dumps({'job_id': job.id, 'status': job.status})}\n\n"
+        yield f"data: {json.dumps(job.to_dict())}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+async def models(request: Request):
+    return JSONResponse(model_stats())
+
+async def metrics(request: Request):
+    # Prometheus scrape target, including the stages run in parse workers
+    gauges = {
+        "resuai_jobs_pending": _active_jobs(),
+        "resuai_process_rss_mb": model_stats()["process_rss_mb"],
+    }
+    return Response(render_prometheus(gauges), media_type="text/plain; version=0.0.4")
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    async_api.shutdown()
+
+app = Starlette(
+    routes=[
+        Route("/", index, methods=["GET", "POST"]),
+        Route("/jobs", submit_job, methods=["POST"]),
+        Route("/jobs/{job_id}", job_status, name="job_status"),
+        Route("/jobs/{job_id}/stream", job_stream, name="job_stream"),
+        Route("/models", models),
+        Route("/metrics", metrics),
+        Mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), name="static"),
+    ],
+    lifespan=lifespan,
+)
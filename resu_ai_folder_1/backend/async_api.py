@@ -0,0 +1,293 @@
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from backend.instrumentation import collect_timings, logger, record_stages, stage
+from backend.models import MODEL_CONCURRENCY
+from backend.parse_cache import cache_get, cache_put, content_digest, get_parse_cache
+from backend.resume_matcher import (
+    MATCH_THRESHOLD, encode_texts, get_matched_skills, pool_windows, preprocess_text, resume_sections,
+    window_plan,
+)
+from backend.resume_parser import FIELDS, SUMMARY_SECTIONS, _cache_key, _cacheable, parse_resume, resolve_fields
+from backend.stage_pool import set_stage_threads
+from backend.summarization import DEFAULT_SUMMARIZER, summarize_texts
+
+# Processes extracting text and fields for the async API; 0 extracts in
+# threads of the event loop's default executor instead
+PARSE_WORKERS = int(os.environ.get("RESUAI_ASYNC_PARSE_WORKERS", str(os.cpu_count() or 1)))
+# How long a model call waits for calls from other requests to share its batch
+BATCH_WAIT_MS = float(os.environ.get("RESUAI_BATCH_WAIT_MS", "5"))
+MAX_BATCH = int(os.environ.get("RESUAI_MAX_BATCH", "16"))
+
+class MicroBatcher:
+    """Coalesces calls from concurrent requests into batched model calls.
+
+    Items submitted within max_wait seconds of each other (at most
+    max_batch) go to batch_fn together, which returns one result per item
+    and runs in an executor thread so the event loop keeps serving. While
+    max_concurrency batches are running, new items keep queueing and form
+    the next batch, so batches grow with load instead of queueing up.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch: int = MAX_BATCH,
+                 max_wait: float = BATCH_WAIT_MS / 1000, max_concurrency: int = MODEL_CONCURRENCY):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._running = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending and self._running < self.max_concurrency:
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            self._running += 1
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        # Not run in the caller's context: the batch serves several requests,
+        # so its stages go to the histograms, not to one request's timings
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, contextvars.Context().run, self.batch_fn, [item for item, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._running -= 1
+            if self._pending:
+                self._flush()
+
+_batchers: Dict[Any, MicroBatcher] = {}
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _init_parse_worker():
+    # One worker per core already; stages of a document run inline
+    set_stage_threads(1)
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Process pool the async API extracts documents in, or None for threads"""
+    global _executor
+    if PARSE_WORKERS <= 0:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # Spawned, not forked: the server process runs threads
+                _executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS, initializer=_init_parse_worker,
+                                                mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+def _reset_parse_executor(broken: ProcessPoolExecutor):
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False)
+
+def shutdown():
+    """Stop the parse worker processes, e.g. when the server exits"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _summarize_batch(backend: Optional[str], items: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+    with stage("summarize"):
+        return summarize_texts([text for text, _ in items], [sections for _, sections in items], backend=backend)
+
+def _encode_batch(items: List[List[str]]) -> List[np.ndarray]:
+    # Windows shared between requests (e.g. the same job description) are encoded once
+    windows = list(dict.fromkeys(window for item in items for window in item))
+    embeddings = encode_texts(windows) if windows else None
+    row_of = {window: i for i, window in enumerate(windows)}
+    return [embeddings[[row_of[window] for window in item]] if item else None for item in items]
+
+def _batcher(key: Any, batch_fn: Callable[[List[Any]], List[Any]]) -> MicroBatcher:
+    batcher = _batchers.get(key)
+    if batcher is None:
+        batcher = _batchers[key] = MicroBatcher(batch_fn)
+    return batcher
+
+def get_summary_batcher(summarizer: Optional[str] = None) -> MicroBatcher:
+    """Batcher of (text, sections) -> summary for one summary backend"""
+    backend = summarizer or DEFAULT_SUMMARIZER
+    return _batcher(("summarize", backend), lambda items: _summarize_batch(backend, items))
+
+def get_encode_batcher() -> MicroBatcher:
+    """Batcher of window lists -> their embedding rows"""
+    return _batcher("encode", _encode_batch)
+
+def _parse_in_worker(data: bytes, file_name: Optional[str], fields: FrozenSet[str]) -> Tuple[Dict, Dict]:
+    # The worker's stage timings travel back with the result
+    with collect_timings() as stages:
+        result = parse_resume(data, summarize=False, use_cache=False, file_name=file_name, fields=fields)
+    return result, stages
+
+async def _extract(data: bytes, file_name: Optional[str], fields: FrozenSet[str]) -> Dict[str, str]:
+    loop = asyncio.get_running_loop()
+    executor = get_parse_executor()
+    if executor is None:
+        parse = partial(parse_resume, data, summarize=False, use_cache=False, file_name=file_name, fields=fields)
+        return await loop.run_in_executor(None, contextvars.copy_context().run, parse)
+    try:
+        result, stages = await loop.run_in_executor(executor, _parse_in_worker, data, file_name, fields)
+    except BrokenProcessPool:
+        # A worker died (e.g. a crashing PDF); start a fresh pool for the next upload
+        logger.error("Parse worker died while parsing %s", file_name)
+        _reset_parse_executor(executor)
+        return {"error": "Error parsing resume: parser process crashed"}
+    record_stages(stages)
+    return result
+
+def _cache_lookup(data: bytes, summarizer: Optional[str], fields: FrozenSet[str]) -> Tuple[str, Optional[Dict]]:
+    with stage("cache_lookup"):
+        cache_key = _cache_key(content_digest(data), True, summarizer, fields)
+        return cache_key, cache_get(get_parse_cache(), cache_key)
+
+async def parse_resume_async(data: Union[bytes, bytearray, memoryview], file_name: Optional[str] = None,
+                             summarizer: Optional[str] = None, use_cache: bool = True,
+                             fields: Union[str, Iterable[str], None] = None) -> Dict[str, str]:
+    """parse_resume for in-memory uploads that never blocks the event loop.
+
+    Text and fields are extracted in the parse process pool; the summary is
+    requested from a micro-batcher, so uploads arriving together share one
+    model batch. Results are cached (and returned) like parse_resume's.
+    """
+    try:
+        fields = resolve_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    data = bytes(data)
+    loop = asyncio.get_running_loop()
+
+    cache = get_parse_cache() if use_cache else None
+    if cache:
+        context = contextvars.copy_context()
+        cache_key, cached = await loop.run_in_executor(None, context.run, _cache_lookup, data, summarizer, fields)
+        if cached is not None:
+            return cached
+
+    summarize = "summary" in fields
+    # The summary is built from the text and sections, whether or not they are returned
+    needed = (fields | {"text", *SUMMARY_SECTIONS}) - {"summary"} if summarize else fields
+    parsed = await _extract(data, file_name, frozenset(needed))
+    if "error" in parsed:
+        return parsed
+
+    if summarize:
+        sections = {name: parsed[name] for name in SUMMARY_SECTIONS}
+        parsed["summary"] = await get_summary_batcher(summarizer).submit((parsed["text"], sections))
+
+    parsed = {field: parsed[field] for field in FIELDS if field in fields}
+    if cache and _cacheable(True, summarizer, fields):
+        await loop.run_in_executor(None, cache_put, cache, cache_key, parsed)
+    return parsed
+
+async def match_async(resume_text: str, job_description: str,
+                      resume_sections: Optional[Dict[str, str]] = None) -> Dict:
+    """match_resume_to_job that never blocks the event loop.
+
+    The windows of the resume and job description are encoded through a
+    micro-batcher shared with every other request, while the skills are
+    matched in a thread alongside.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    skills = loop.run_in_executor(None, context.run, get_matched_skills, resume_text, job_description)
+
+    similarity_score = 0.0
+    if preprocess_text(resume_text) and preprocess_text(job_description):
+        try:
+            per_text, windows = await loop.run_in_executor(
+                None, window_plan, [resume_text, job_description], [resume_sections, None]
+            )
+            embeddings = await get_encode_batcher().submit(windows)
+            resume_emb, job_emb = pool_windows(per_text, windows, embeddings)
+            with stage("similarity"):
+                # Pooled rows are unit length, so their dot product is the cosine
+                similarity_score = float(resume_emb @ job_emb)
+        except Exception as e:
+            logger.error("Similarity calculation error: %s", e)
+
+    return {
+        "match": similarity_score >= MATCH_THRESHOLD,
+        "score": similarity_score,
+        "matched_skills": await skills,
+    }
+
+def convert_numpy_types(obj):
+    if isinstance(obj, dict):
+        return {k: convert_numpy_types(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_numpy_types(i) for i in obj]
+    elif isinstance(obj, (np.float32, np.float64)):
+        return float(obj)
+    elif isinstance(obj, (np.int32, np.int64)):
+        return int(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    else:
+        return obj
+
+def analysis_result(parsed_data: Dict, timings: Dict, stages: Dict[str, Dict], include_stages: bool) -> dict:
+    """The response of an analysis: its timings attached, numpy values made JSON-safe"""
+    if include_stages:
+        # Per-stage wall/CPU breakdown of this request (?timings=1)
+        timings["stages"] = stages
+    parsed_data["timings"] = timings
+    return convert_numpy_types(parsed_data)
+
+async def analyze_resume_async(data: bytes, file_name: str, job_description: str = "", summarizer: str = None,
+                               include_stages: bool = False, profile: str = None) -> dict:
+    """Parse (and optionally match) an upload held in memory without blocking the event loop"""
+    timings = {}
+    with collect_timings() as stages:
+        start = time.perf_counter()
+        parsed_data = await parse_resume_async(data, file_name=file_name, summarizer=summarizer, fields=profile)
+        timings["parse_seconds"] = round(time.perf_counter() - start, 3)
+        if "error" in parsed_data:
+            return parsed_data
+
+        if job_description:
+            start = time.perf_counter()
+            match_result = await match_async(parsed_data["text"], job_description, resume_sections(parsed_data))
+            timings["match_seconds"] = round(time.perf_counter() - start, 3)
+            parsed_data.update(match_result)
+
+    # Batched model calls serve several requests at once; they only show up in /metrics
+    return analysis_result(parsed_data, timings, stages, include_stages)
@@ -0,0 +1,244 @@
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from backend.document import get_file_type
+from backend.models import DISABLED_MODELS, EMBEDDER_MODEL, preload
+from backend.stage_pool import set_stage_threads
+from backend.summarization import DEFAULT_SUMMARIZER, SUMMARIZERS
+from backend.vector_index import ResumeIndex
+
+CSV_FIELDS = [
+    "file", "error", "email", "phone", "linkedin", "github", "skills",
+    "work_experience", "education", "projects", "certifications", "summary", "truncated",
+    "match", "score", "matched_skills", "seconds",
+]
+
+def iter_input_files(source: str, extract_dir: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, path) for every resume in a directory tree or ZIP archive.
+
+    ZIP members are extracted one at a time into extract_dir as they are
+    yielded, so a large archive is never unpacked up front.
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not get_file_type(info.filename):
+                    continue
+                yield info.filename, archive.extract(info, extract_dir)
+        return
+
+    for root, _, files in os.walk(source):
+        for file_name in sorted(files):
+            if get_file_type(file_name):
+                path = os.path.join(root, file_name)
+                yield os.path.relpath(path, source), path
+
+def _init_worker(model_names: List[str]):
+    # Each worker process loads its models exactly once, before any file.
+    # There is already one worker per core, so stages of a file run inline.
+    set_stage_threads(1)
+    preload(model_names)
+
+def process_files(items: List[Tuple[str, str]], job_description: Optional[str] = None,
+                  include_text: bool = False, summarizer: Optional[str] = None,
+                  embed: bool = False) -> List[Dict]:
+    """Parse a group of resumes (and match them when a job description is given).
+
+    The group is summarized in shared model batches, so larger groups trade
+    latency of the first result for better CPU throughput. With embed, each
+    parsed resume also carries its "embedding" for the resume index.
+    """
+    from backend.resume_parser import parse_resumes
+    from backend.resume_matcher import encode_long_texts, match_resume_to_job, resume_sections
+
+    start = time.perf_counter()
+    results = parse_resumes([path for _, path in items], summarizer=summarizer)
+    if embed:
+        parsed = [result for result in results if "error" not in result]
+        if parsed:
+            vectors = encode_long_texts([r["text"] for r in parsed], [resume_sections(r) for r in parsed])
+            for result, vector in zip(parsed, vectors):
+                result["embedding"] = vector.tolist()
+    for (name, _), result in zip(items, results):
+        if job_description and "error" not in result:
+            result.update(match_resume_to_job(result["text"], job_description, resume_sections(result)))
+        if not include_text:
+            result.pop("text", None)
+        result["file"] = name
+
+    # Per-file cost is the group's wall time shared out evenly
+    seconds = round((time.perf_counter() - start) / max(len(items), 1), 3)
+    for result in results:
+        result["seconds"] = seconds
+    return results
+
+def process_file(name: str, path: str, job_description: Optional[str] = None,
+                 include_text: bool = False, summarizer: Optional[str] = None) -> Dict:
+    """Parse one resume (and match it when a job description is given)"""
+    return process_files([(name, path)], job_description, include_text, summarizer)[0]
+
+class ResultWriter:
+    """Appends results to a JSON Lines or CSV file as soon as they arrive"""
+
+    def __init__(self, path: str, fmt: str):
+        self.fmt = fmt
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if is_new:
+                self._csv.writeheader()
+
+    def write(self, result: Dict):
+        if self._csv:
+            row = {k: "; ".join(v) if isinstance(v, list) else v for k, v in result.items()}
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def _read_checkpoint(path: Optional[str]) -> Set[str]:
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+def run_batch(source: str, output: str, workers: Optional[int] = None,
+              job_description: Optional[str] = None, checkpoint: Optional[str] = None,
+              fmt: Optional[str] = None, include_text: bool = False,
+              batch_size: int = 4, summarizer: Optional[str] = None,
+              index_dir: Optional[str] = None, progress_every: int = 50,
+              process_fn: Callable[..., List[Dict]] = process_files) -> Dict:
+    """Parse every resume under source across a process pool.
+
+    Files are sent to workers in groups of batch_size so summarization runs
+    batched inference. Results are streamed to output in completion order.
+    Names of successfully parsed files are appended to the checkpoint file,
+    so re-running with the same checkpoint skips them and retries the
+    rest. With index_dir, parsed resumes are also added to the ResumeIndex
+    in that folder as they arrive.
+
+    Workers are spawned, not forked, and run process_fn on each group; a
+    replacement for process_files must be importable by module name.
+    """
+    fmt = fmt or ("csv" if output.lower().endswith(".csv") else "jsonl")
+    workers = workers or os.cpu_count() or 1
+    done = _read_checkpoint(checkpoint)
+
+    summary_model = SUMMARIZERS[summarizer or DEFAULT_SUMMARIZER].model_name
+    model_names = [summary_model] if summary_model and summary_model not in DISABLED_MODELS else []
+    if job_description or index_dir:
+        model_names.append(EMBEDDER_MODEL)
+
+    index = ResumeIndex(index_dir) if index_dir else None
+    writer = ResultWriter(output, fmt)
+    checkpoint_file = open(checkpoint, "a", encoding="utf-8") if checkpoint else None
+    stats = {"processed": 0, "errors": 0, "skipped": 0, "indexed": 0, "worker_seconds": 0.0}
+    start = time.perf_counter()
+
+    def new_pool():
+        # Spawned: forking a process that runs threads (model runtimes,
+        # the stage pool) can copy locks held by another thread
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(model_names,),
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    pool = new_pool()
+    try:
+        with tempfile.TemporaryDirectory() as extract_dir:
+            pending = {}
+            files = iter_input_files(source, extract_dir)
+            exhausted = False
+
+            while pending or not exhausted:
+                # Keep a bounded number of groups in flight instead of
+                # submitting (and extracting) the whole corpus at once
+                while not exhausted and len(pending) < workers * 2:
+                    group = []
+                    while len(group) < batch_size:
+                        try:
+                            name, path = next(files)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        if name in done:
+                            stats["skipped"] += 1
+                            continue
+                        group.append((name, path))
+                    if group:
+                        args = (process_fn, group, job_description, include_text, summarizer, index is not None)
+                        try:
+                            future = pool.submit(*args)
+                        except BrokenProcessPool:
+                            # A worker died (e.g. out of memory); its groups are
+                            # reported as failed below, the rest get a new pool
+                            pool.shutdown(wait=False)
+                            pool = new_pool()
+                            future = pool.submit(*args)
+                        pending[future] = group
+
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    group = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        results = [{"file": name, "error": f"Worker failed: {e}", "seconds": 0.0}
+                                   for name, _ in group]
+                    for _, path in group:
+                        if path.startswith(extract_dir):
+                            # Extracted ZIP members are not needed once parsed
+                            os.remove(path)
+
+                    embedded = [r for r in results if "embedding" in r]
+                    if index is not None and embedded:
+                        index.add(
+                            [r["file"] for r in embedded],
+                            [r.pop("embedding") for r in embedded],
+                            [[s for s in r["skills"] if s != "No Skills Found"] for r in embedded],
+                        )
+                        stats["indexed"] += len(embedded)
+
+                    for result in results:
+                        writer.write(result)
+                        # Failures are not checkpointed, so a re-run retries them
+                        if checkpoint_file and "error" not in result:
+                            checkpoint_file.write(result["file"] + "\n")
+                            checkpoint_file.flush()
+
+                        stats["processed"] += 1
+                        stats["errors"] += "error" in result
+                        stats["worker_seconds"] += result["seconds"]
+                        if progress_every and stats["processed"] % progress_every == 0:
+                            elapsed = time.perf_counter() - start
+                            print(f"{stats['processed']} files, {stats['processed'] / elapsed:.2f} files/s",
+                                  file=sys.stderr)
+    finally:
+        pool.shutdown()
+        writer.close()
+        if checkpoint_file:
+            checkpoint_file.close()
+
+    elapsed = time.perf_counter() - start
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["worker_seconds"] = round(stats["worker_seconds"], 3)
+    stats["files_per_second"] = round(stats["processed"] / elapsed, 3) if elapsed else 0.0
+    stats["mean_seconds_per_file"] = (
+        round(stats["worker_seconds"] / stats["processed"], 3) if stats["processed"] else 0.0
+    )
+    stats["workers"] = workers
+    return stats
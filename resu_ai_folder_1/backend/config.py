@@ -0,0 +1,8 @@
+import os
+
+# Root folder of the app (the directory holding app.py / data / uploads)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Local caches (embeddings, compiled indexes, ...) live under this folder,
+# shared by every front end whatever directory it was started from
+CACHE_DIR = os.environ.get("RESUAI_CACHE_DIR", os.path.join(BASE_DIR, "cache"))
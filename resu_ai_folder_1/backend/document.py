@@ -0,0 +1,442 @@
+import io
+import logging
+import os
+import posixpath
+import re
+import zipfile
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+# A resume can be given as a path, raw bytes / a buffer, or a binary file object
+DocumentSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+# Pages past this are never read (portfolios, scanned books)
+MAX_PDF_PAGES = int(os.environ.get("RESUAI_MAX_PDF_PAGES", "10"))
+# Extraction stops after the page on which this much text has been collected
+MAX_TEXT_CHARS = int(os.environ.get("RESUAI_MAX_TEXT_CHARS", "60000"))
+# A fast-path page with less readable text than this is re-read by pdfplumber
+MIN_READABLE_RATIO = 0.7
+MIN_ALNUM_RATIO = 0.4
+
+# Icon glyphs often come out as C0 control characters
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f]")
+
+@dataclass
+class TextLine:
+    """One visual line of a resume with the layout hints section detection uses"""
+    text: str
+    page: int
+    font_size: Optional[float] = None
+    bold: bool = False
+
+@dataclass
+class ParsedDocument:
+    """Text, per-page text, lines and link annotations of a resume, read in one pass"""
+    file_path: str
+    file_type: str
+    text: str
+    pages: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    lines: List[TextLine] = field(default_factory=list)
+    # True when a page or character budget or an early stop left pages unread
+    truncated: bool = False
+
+@dataclass
+class PageContent:
+    """Lines and link targets of one PDF page"""
+    number: int
+    lines: List[TextLine]
+    links: List[str]
+    # Pages in the whole document, read or not
+    page_count: int = 0
+
+    @property
+    def text(self) -> str:
+        return "\n".join(line.text for line in self.lines)
+
+def get_file_type(file_path: str) -> Optional[str]:
+    """Return the normalized extension if the file type is supported"""
+    ext = os.path.splitext(file_path)[-1].lower()
+    return ext if ext in SUPPORTED_EXTENSIONS else None
+
+def read_source(source: DocumentSource) -> Union[str, bytes, memoryview]:
+    """Paths and buffers pass through; file objects are read into memory once"""
+    if isinstance(source, (str, bytes, memoryview)):
+        return source
+    if isinstance(source, bytearray):
+        return memoryview(source)
+    return source.read()
+
+def detect_file_type(source: DocumentSource, file_name: Optional[str] = None) -> Optional[str]:
+    """Supported extension of a resume, from its name or else its leading bytes"""
+    if file_name or isinstance(source, str):
+        return get_file_type(file_name or source)
+    header = bytes(source[:4])
+    if header == b"%PDF":
+        return ".pdf"
+    if header == b"PK\x03\x04":
+        # DOCX is a ZIP archive with the document body under word/
+        try:
+            with zipfile.ZipFile(io.BytesIO(source)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return ".docx"
+        except zipfile.BadZipFile:
+            # Only the signature of a ZIP file, e.g. a truncated upload
+            return None
+    return None
+
+def _open(source: Union[str, bytes, memoryview]):
+    # pdfplumber and zipfile take either a path or a seekable stream
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+def _pdf_line(line: dict, page_number: int) -> TextLine:
+    chars = line.get("chars") or []
+    font_size = max((c.get("size", 0) for c in chars), default=None)
+    bold_chars = sum("bold" in c.get("fontname", "").lower() for c in chars)
+    return TextLine(line["text"], page_number, font_size, bool(chars) and bold_chars * 2 > len(chars))
+
+def _plumber_page(page, page_number: int, page_count: int) -> PageContent:
+    # One layout pass per page gives both the lines and the page text
+    lines = [_pdf_line(line, page_number) for line in page.extract_text_lines()]
+    links = [link["uri"] for link in page.hyperlinks if link.get("uri")]
+    # Drop the page's cached layout objects, they are not needed again
+    page.close()
+    return PageContent(page_number, lines, links, page_count)
+
+def _same_row(a, b) -> bool:
+    # Vertical overlap of at least half the shorter span (bullets sit higher than text)
+    overlap = min(a[3], b[3]) - max(a[1], b[1])
+    return overlap >= 0.5 * min(a[3] - a[1], b[3] - b[1])
+
+def _fitz_page(page, page_number: int, page_count: int, flags: int) -> PageContent:
+    spans = [
+        span
+        for block in page.get_text("dict", flags=flags)["blocks"]
+        for line in block.get("lines", [])
+        for span in line["spans"]
+        if span["text"].strip()
+    ]
+    # Spans sharing a baseline form one visual line, as pdfplumber's lines do
+    rows: List[List[dict]] = []
+    for span in sorted(spans, key=lambda span: (round(span["bbox"][3]), span["bbox"][0])):
+        if rows and _same_row(rows[-1][0]["bbox"], span["bbox"]):
+            rows[-1].append(span)
+        else:
+            rows.append([span])
+
+    lines = []
+    for row in rows:
+        row.sort(key=lambda span: span["bbox"][0])
+        text = _CONTROL_CHARS.sub("", " ".join(span["text"].strip() for span in row)).strip()
+        if not text:
+            continue
+        chars = sum(len(span["text"]) for span in row)
+        bold_chars = sum(
+            len(span["text"]) for span in row
+            if span["flags"] & 16 or "bold" in span["font"].lower()
+        )
+        lines.append(TextLine(text, page_number, round(max(span["size"] for span in row), 2),
+                              bold_chars * 2 > chars))
+    links = [link["uri"] for link in page.get_links() if link.get("uri")]
+    return PageContent(page_number, lines, links, page_count)
+
+def _is_garbled(text: str) -> bool:
+    """Whether extracted text looks like font-encoding junk rather than words"""
+    chars = [c for c in text if not c.isspace()]
+    if len(chars) < 20:
+        return False
+    readable = sum(c.isprintable() and c != "\ufffd" and not 0xE000 <= ord(c) <= 0xF8FF for c in chars)
+    alnum = sum(c.isalnum() for c in chars)
+    return readable < MIN_READABLE_RATIO * len(chars) or alnum < MIN_ALNUM_RATIO * len(chars)
+
+def iter_pdf_pages(source: Union[str, bytes, memoryview], max_pages: int = MAX_PDF_PAGES) -> Iterator[PageContent]:
+    """Yield PDF pages one at a time, up to max_pages.
+
+    PyMuPDF's text path is used when installed; pages on which it yields
+    garbage are re-read with pdfplumber, which is also the fallback when
+    PyMuPDF is missing. Pages are only read when the consumer asks for them.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        pymupdf = None
+
+    if pymupdf is None:
+        with pdfplumber.open(_open(source)) as pdf:
+            for index, page in enumerate(pdf.pages[:max_pages]):
+                yield _plumber_page(page, index + 1, len(pdf.pages))
+        return
+
+    doc = pymupdf.open(source) if isinstance(source, str) else pymupdf.open(stream=bytes(source), filetype="pdf")
+    # Ligatures such as "fi" are expanded so words match the skill taxonomy
+    flags = pymupdf.TEXTFLAGS_DICT & ~pymupdf.TEXT_PRESERVE_LIGATURES & ~pymupdf.TEXT_PRESERVE_IMAGES
+    plumber = None
+    try:
+        for index in range(min(doc.page_count, max_pages)):
+            page = _fitz_page(doc[index], index + 1, doc.page_count, flags)
+            if _is_garbled(page.text):
+                if plumber is None:
+                    plumber = pdfplumber.open(_open(source))
+                fallback = _plumber_page(plumber.pages[index], index + 1, doc.page_count)
+                page.lines = fallback.lines
+            yield page
+    finally:
+        doc.close()
+        if plumber is not None:
+            plumber.close()
+
+def _load_pdf(source: Union[str, bytes, memoryview], name: str, max_pages: int = MAX_PDF_PAGES,
+              max_chars: int = MAX_TEXT_CHARS,
+              should_stop: Optional[Callable[[List[TextLine]], bool]] = None) -> ParsedDocument:
+    pages = []
+    links = []
+    lines = []
+    chars = 0
+    truncated = False
+    with closing(iter_pdf_pages(source, max_pages)) as page_iter:
+        for page in page_iter:
+            truncated = page.number < page.page_count
+            page_text = page.text
+            lines.extend(page.lines)
+            pages.append(page_text)
+            links.extend(page.links)
+            chars += len(page_text)
+            if chars >= max_chars or (should_stop is not None and should_stop(page.lines)):
+                break
+
+    # Pages are collected in a list and joined once
+    text = "\n".join(page_text for page_text in pages if page_text).strip()
+    return ParsedDocument(name, ".pdf", text, pages, links, lines, truncated)
+
+# WordprocessingML namespaces, in ElementTree's {uri}tag form
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_REL_TYPES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_FIELD_HYPERLINK = re.compile(r'HYPERLINK\s+"([^"]+)"')
+# Parsed styles.xml of recently seen templates, keyed by the entry's CRC and size
+STYLES_CACHE_SIZE = 64
+_styles_cache: Dict[tuple, Dict[str, "_DocxStyle"]] = {}
+
+@dataclass
+class _DocxStyle:
+    heading: bool = False
+    font_size: Optional[float] = None
+    bold: bool = False
+
+@dataclass
+class _DocxParagraph:
+    texts: List[str] = field(default_factory=list)
+    style: Optional[str] = None
+    # (bold, font size) of every run with visible text
+    runs: List[tuple] = field(default_factory=list)
+    run: Optional[list] = None
+    in_properties: bool = False
+
+def _on(elem) -> bool:
+    # Toggle properties like <w:b/> are on unless w:val says otherwise
+    return elem is not None and elem.get(_W + "val", "true") not in ("0", "false", "off")
+
+def _half_points(elem) -> Optional[float]:
+    value = elem.get(_W + "val") if elem is not None else None
+    return int(value) / 2 if value and value.isdigit() else None
+
+def _docx_rels(archive: zipfile.ZipFile, part: str) -> List[tuple]:
+    """(id, type, target, external) of a part's relationships; internal targets as archive paths"""
+    folder, base = posixpath.split(part)
+    rels_path = posixpath.join(folder, "_rels", base + ".rels")
+    if rels_path not in archive.NameToInfo:
+        return []
+    with archive.open(rels_path) as f:
+        root = ElementTree.parse(f).getroot()
+    rels = []
+    for rel in root.iter(_PKG_REL):
+        target, external = rel.get("Target", ""), rel.get("TargetMode") == "External"
+        if not external:
+            target = posixpath.normpath(posixpath.join("/" if target.startswith("/") else folder, target)).lstrip("/")
+        rels.append((rel.get("Id"), rel.get("Type", "").rsplit("/", 1)[-1], target, external))
+    return rels
+
+def _docx_styles(archive: zipfile.ZipFile) -> Dict[str, _DocxStyle]:
+    info = archive.NameToInfo.get("word/styles.xml")
+    if info is None:
+        return {}
+    # Resumes written from the same template share styles.xml byte for byte
+    key = (info.CRC, info.file_size)
+    styles = _styles_cache.get(key)
+    if styles is None:
+        with archive.open(info) as f:
+            root = ElementTree.parse(f).getroot()
+        styles = _styles_cache[key] = {}
+        for elem in root.iterfind(_W + "style"):
+            name = elem.find(_W + "name")
+            name = (name.get(_W + "val", "") if name is not None else "").lower()
+            properties = elem.find(_W + "rPr")
+            styles[elem.get(_W + "styleId")] = _DocxStyle(
+                name.startswith(("heading", "title")),
+                _half_points(properties.find(_W + "sz")) if properties is not None else None,
+                _on(properties.find(_W + "b")) if properties is not None else False,
+            )
+        if len(_styles_cache) > STYLES_CACHE_SIZE:
+            _styles_cache.pop(next(iter(_styles_cache)))
+    return styles
+
+def _docx_line(paragraph: _DocxParagraph, styles: Dict[str, _DocxStyle]) -> TextLine:
+    style = styles.get(paragraph.style) or _DocxStyle()
+    sizes = [size for _, size in paragraph.runs if size is not None]
+    if not sizes and style.font_size is not None:
+        sizes = [style.font_size]
+    # Heading styles count as emphasis just like bold runs
+    bold = style.heading or (bool(paragraph.runs) and all(bold for bold, _ in paragraph.runs))
+    return TextLine("".join(paragraph.texts), 1, max(sizes) if sizes else None, bold)
+
+def iter_docx_paragraphs(archive: zipfile.ZipFile, part: str,
+                         styles: Dict[str, _DocxStyle]) -> Iterator[Tuple[TextLine, List[str]]]:
+    """Paragraphs of one DOCX part in document order, with the links met since the last one.
+
+    The part is read with iterparse and each top-level paragraph or table is
+    dropped once emitted, so memory stays flat however long the document.
+    Table cells and text boxes are paragraphs too and come out in place.
+    """
+    hyperlinks = {
+        rel_id: target for rel_id, rel_type, target, external in _docx_rels(archive, part)
+        if rel_type == "hyperlink" and external
+    }
+    open_paragraphs: List[_DocxParagraph] = []
+    links: List[str] = []
+    fallback_depth = 0
+    with archive.open(part) as f:
+        for event, elem in ElementTree.iterparse(f, events=("start", "end")):
+            tag = elem.tag
+            if tag == _MC_FALLBACK:
+                # Fallback content repeats its mc:Choice sibling for old readers
+                fallback_depth += 1 if event == "start" else -1
+                continue
+            if fallback_depth:
+                continue
+
+            if event == "start":
+                if tag == _W + "p":
+                    open_paragraphs.append(_DocxParagraph())
+                elif not open_paragraphs:
+                    continue
+                elif tag == _W + "pPr":
+                    open_paragraphs[-1].in_properties = True
+                elif tag == _W + "r":
+                    open_paragraphs[-1].run = [False, None, False]
+                elif tag in (_W + "hyperlink", _A + "hlinkClick") and elem.get(_R + "id") in hyperlinks:
+                    links.append(hyperlinks[elem.get(_R + "id")])
+                elif tag == _W + "fldSimple":
+                    links.extend(_FIELD_HYPERLINK.findall(elem.get(_W + "instr", "")))
+                continue
+
+            if tag == _W + "tbl" and not open_paragraphs:
+                elem.clear()
+            if not open_paragraphs:
+                continue
+            paragraph = open_paragraphs[-1]
+            run = paragraph.run
+            if tag == _W + "t":
+                paragraph.texts.append(elem.text or "")
+                if run is not None and (elem.text or "").strip():
+                    run[2] = True
+            elif tag == _W + "tab":
+                paragraph.texts.append("\t")
+            elif tag in (_W + "br", _W + "cr"):
+                paragraph.texts.append("\n")
+            elif tag == _W + "instrText":
+                links.extend(_FIELD_HYPERLINK.findall(elem.text or ""))
+            elif tag == _W + "pStyle" and paragraph.in_properties:
+                paragraph.style = elem.get(_W + "val")
+            elif tag == _W + "pPr":
+                paragraph.in_properties = False
+            elif tag == _W + "rPr" and run is not None and not paragraph.in_properties:
+                char_style = styles.get(elem.find(_W + "rStyle").get(_W + "val")) \
+                    if elem.find(_W + "rStyle") is not None else None
+                bold = elem.find(_W + "b")
+                run[0] = _on(bold) if bold is not None else bool(char_style and char_style.bold)
+                run[1] = _half_points(elem.find(_W + "sz")) or (char_style.font_size if char_style else None)
+            elif tag == _W + "r" and run is not None:
+                if run[2]:
+                    paragraph.runs.append((run[0], run[1]))
+                paragraph.run = None
+            elif tag == _W + "p":
+                open_paragraphs.pop()
+                yield _docx_line(paragraph, styles), links
+                links = []
+                if not open_paragraphs:
+                    elem.clear()
+    if links:
+        yield TextLine("", 1), links
+
+def _load_docx(source: Union[str, bytes, memoryview], name: str,
+               max_chars: int = MAX_TEXT_CHARS) -> ParsedDocument:
+    texts, lines, links = [], [], []
+    truncated = False
+    chars = 0
+    with zipfile.ZipFile(_open(source)) as archive:
+        styles = _docx_styles(archive)
+        body_rels = _docx_rels(archive, "word/document.xml")
+        headers = [target for _, rel_type, target, _ in body_rels if rel_type == "header"]
+        footers = [target for _, rel_type, target, _ in body_rels if rel_type == "footer"]
+
+        # Contact details often live in the page header, so headers come first
+        seen_margin_text = set()
+        for part in headers + ["word/document.xml"] + footers:
+            if part not in archive.NameToInfo:
+                continue
+            margin = part != "word/document.xml"
+            for line, line_links in iter_docx_paragraphs(archive, part, styles):
+                links.extend(line_links)
+                if margin:
+                    # Different first-page/even headers usually repeat the same text
+                    if not line.text.strip() or line.text in seen_margin_text:
+                        continue
+                    seen_margin_text.add(line.text)
+                texts.append(line.text)
+                if line.text.strip():
+                    lines.append(line)
+                    chars += len(line.text) + 1
+                if chars >= max_chars:
+                    truncated = True
+                    break
+            if truncated:
+                break
+
+    text = "\n".join(texts).strip()
+    # DOCX has no real pages, the whole body is reported as one
+    return ParsedDocument(name, ".docx", text, [text], list(dict.fromkeys(links)), lines, truncated)
+
+def load_document(source: DocumentSource, file_name: Optional[str] = None,
+                  max_pages: int = MAX_PDF_PAGES, max_chars: int = MAX_TEXT_CHARS,
+                  should_stop: Optional[Callable[[List[TextLine]], bool]] = None) -> Optional[ParsedDocument]:
+    """Open a resume once and extract everything downstream extractors need.
+
+    source is a path, bytes/memoryview or a binary file object; in-memory
+    sources are parsed without touching the filesystem. file_name (e.g. the
+    uploaded name) decides the format; without it the bytes are sniffed.
+    PDFs are read page by page until max_pages, max_chars or should_stop
+    (called with each page's lines) ends the read; DOCX is streamed
+    paragraph by paragraph until max_chars.
+    """
+    name = file_name or (source if isinstance(source, str) else "<memory>")
+    try:
+        source = read_source(source)
+        file_type = detect_file_type(source, file_name)
+        if file_type == ".pdf":
+            return _load_pdf(source, name, max_pages, max_chars, should_stop)
+        if file_type == ".docx":
+            return _load_docx(source, name, max_chars)
+    except Exception:
+        logger.exception("Could not extract text from %s", name)
+    return None
@@ -0,0 +1,72 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from backend.config import CACHE_DIR
+from backend.sqlite_cache import SQLiteLRU
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_PATH = os.path.join(CACHE_DIR, "embeddings.sqlite3")
+EMBEDDING_CACHE_ENABLED = os.environ.get("RESUAI_EMBEDDING_CACHE", "1") != "0"
+
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def text_key(text: str, model_name: str) -> str:
+    """Content hash of a preprocessed text for a given model"""
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+class EmbeddingCache(SQLiteLRU):
+    """On-disk embedding store keyed by text hash + model, with LRU eviction"""
+    table = "embeddings"
+    extra_columns = "model TEXT NOT NULL, dim INTEGER NOT NULL, "
+    value_column = "vector"
+    index_name = "idx_last_access"
+    label = "Embedding cache"
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(path, max_entries, max_bytes)
+
+    def get_many(self, texts: List[str], model_name: str) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the texts that are present, keyed by text"""
+        keys = {text_key(t, model_name): t for t in texts}
+        with self._lock:
+            rows = self._select("vector", list(keys))
+        return {keys[key]: np.frombuffer(blob, dtype=np.float32) for key, blob in rows}
+
+    def put_many(self, texts: List[str], vectors: np.ndarray, model_name: str):
+        """Store vectors for the given texts and evict the least recently used"""
+        now = time.time()
+        rows = {}
+        for text, vector in zip(texts, vectors):
+            vector = np.asarray(vector, dtype=np.float32)
+            key = text_key(text, model_name)
+            rows[key] = (key, model_name, vector.shape[0], vector.tobytes(), now)
+        if rows:
+            self._put_rows(list(rows.values()))
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Process-wide cache instance, or None when disabled or unavailable"""
+    return EmbeddingCache.shared() if EMBEDDING_CACHE_ENABLED else None
+
+def cache_get_many(cache: EmbeddingCache, texts: List[str], model_name: str) -> Dict[str, np.ndarray]:
+    """cache.get_many, treating a failing cache as holding nothing"""
+    try:
+        return cache.get_many(texts, model_name)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Embedding cache lookup failed: %s", e)
+        return {}
+
+def cache_put_many(cache: EmbeddingCache, texts: List[str], vectors: np.ndarray, model_name: str):
+    """cache.put_many that logs instead of failing the encode it stores"""
+    try:
+        cache.put_many(texts, vectors, model_name)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Embedding cache store failed: %s", e)
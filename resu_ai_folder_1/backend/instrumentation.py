@@ -0,0 +1,180 @@
+import contextvars
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from backend.config import BASE_DIR
+
+logger = logging.getLogger("resuai")
+
+# Per-stage peak memory needs tracemalloc, which slows Python code 2-3x;
+# only turn it on while profiling
+TRACE_MEMORY = os.environ.get("RESUAI_TRACE_MEMORY", "0") == "1"
+
+LOG_LEVEL = os.environ.get("RESUAI_LOG_LEVEL", "INFO").upper()
+# Under the app folder, whatever directory the app was started from
+LOG_FILE = os.environ.get("RESUAI_LOG_FILE", os.path.join(BASE_DIR, "logs", "parser.log"))
+# Libraries that log every heartbeat or request at DEBUG/INFO
+NOISY_LOGGERS = ("pymongo", "urllib3", "filelock", "huggingface_hub", "werkzeug")
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = tuple(float(4 ** n) for n in range(8, 16))  # 64 KiB .. 1 GiB
+
+class Histogram:
+    """Cumulative bucket counts, sum and count of observed values (Prometheus style)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+METRICS = {
+    "resuai_stage_wall_seconds": ("Wall-clock time per pipeline stage", SECONDS_BUCKETS),
+    "resuai_stage_cpu_seconds": ("CPU time of the calling thread per pipeline stage", SECONDS_BUCKETS),
+    "resuai_stage_peak_memory_bytes": ("Peak traced allocation per stage (RESUAI_TRACE_MEMORY=1)", BYTES_BUCKETS),
+}
+_histograms: Dict[Tuple[str, str], Histogram] = {}
+_histograms_lock = threading.Lock()
+
+# Timings of the request running in the current thread / context, if collected
+_request_timings: contextvars.ContextVar[Optional[Dict[str, Dict]]] = contextvars.ContextVar(
+    "resuai_request_timings", default=None
+)
+
+def _histogram(metric: str, stage_name: str) -> Histogram:
+    key = (metric, stage_name)
+    histogram = _histograms.get(key)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(key, Histogram(METRICS[metric][1]))
+    return histogram
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a pipeline stage: wall, CPU and (when traced) peak memory.
+
+    Every stage feeds the process-wide histograms; inside collect_timings()
+    it is also added to that request's breakdown. Stages may nest, each is
+    then reported on its own (an outer stage includes its inner ones).
+    """
+    if TRACE_MEMORY:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # The peak is process-wide, so concurrent stages inflate each other
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        peak = max(0, tracemalloc.get_traced_memory()[1] - base) if TRACE_MEMORY else None
+
+        _histogram("resuai_stage_wall_seconds", name).observe(wall)
+        _histogram("resuai_stage_cpu_seconds", name).observe(cpu)
+        if peak is not None:
+            _histogram("resuai_stage_peak_memory_bytes", name).observe(peak)
+
+        timings = _request_timings.get()
+        if timings is not None:
+            entry = timings.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+            entry["calls"] += 1
+            entry["wall_ms"] = round(entry["wall_ms"] + wall * 1000, 3)
+            entry["cpu_ms"] = round(entry["cpu_ms"] + cpu * 1000, 3)
+            if peak is not None:
+                entry["peak_kb"] = max(entry.get("peak_kb", 0.0), round(peak / 1024, 1))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("stage %s: %.1f ms wall, %.1f ms cpu", name, wall * 1000, cpu * 1000)
+
+def record_stages(timings: Dict[str, Dict]):
+    """Add stage totals measured elsewhere (e.g. in a worker process) to the
+    histograms and, inside collect_timings(), to the current breakdown"""
+    current = _request_timings.get()
+    for name, entry in timings.items():
+        _histogram("resuai_stage_wall_seconds", name).observe(entry["wall_ms"] / 1000)
+        _histogram("resuai_stage_cpu_seconds", name).observe(entry["cpu_ms"] / 1000)
+        if "peak_kb" in entry:
+            _histogram("resuai_stage_peak_memory_bytes", name).observe(entry["peak_kb"] * 1024)
+        if current is not None:
+            merged = current.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+            merged["calls"] += entry["calls"]
+            merged["wall_ms"] = round(merged["wall_ms"] + entry["wall_ms"], 3)
+            merged["cpu_ms"] = round(merged["cpu_ms"] + entry["cpu_ms"], 3)
+            if "peak_kb" in entry:
+                merged["peak_kb"] = max(merged.get("peak_kb", 0.0), entry["peak_kb"])
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, Dict]]:
+    """Gather the stages run inside the block into a {stage: totals} dict"""
+    timings: Dict[str, Dict] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+def _format_bound(bound: float) -> str:
+    return repr(bound) if bound != int(bound) else f"{bound:.1f}"
+
+def render_prometheus(gauges: Optional[Dict[str, float]] = None) -> str:
+    """All stage histograms, plus any extra gauges, in Prometheus text format"""
+    with _histograms_lock:
+        histograms = sorted(_histograms.items())
+    out = []
+    for metric, (help_text, _) in METRICS.items():
+        series = [(stage_name, h) for (name, stage_name), h in histograms if name == metric]
+        if not series:
+            continue
+        out.append(f"# HELP {metric} {help_text}")
+        out.append(f"# TYPE {metric} histogram")
+        for stage_name, histogram in series:
+            counts, total, count = histogram.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_bound(bound)
+                out.append(f'{metric}_bucket{{stage="{stage_name}",le="{le}"}} {cumulative}')
+            out.append(f'{metric}_sum{{stage="{stage_name}"}} {total!r}')
+            out.append(f'{metric}_count{{stage="{stage_name}"}} {count}')
+    for name, value in (gauges or {}).items():
+        out.append(f"# TYPE {name} gauge")
+        out.append(f"{name} {value!r}")
+    return "\n".join(out) + "\n"
+
+def reset_metrics():
+    with _histograms_lock:
+        _histograms.clear()
+
+def configure_logging(level: str = LOG_LEVEL, log_file: Optional[str] = LOG_FILE):
+    """Console (and rotating file) logging for the app, with chatty libraries quieted"""
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handlers.append(RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=1,
+                                            encoding="utf-8"))
+    logging.basicConfig(level=level, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+                        handlers=handlers, force=True)
+    # pymongo's topology heartbeats alone used to fill parser.log at DEBUG
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(max(logging.WARNING, logging.getLogger().level))
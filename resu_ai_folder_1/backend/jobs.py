@@ -0,0 +1,103 @@
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+class Job:
+    def __init__(self, func: Callable[..., Dict], args: tuple, kwargs: dict):
+        self.id = uuid.uuid4().hex
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.status = "queued"
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = threading.Event()
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"job_id": self.id, "status": self.status}
+        timings = {}
+        if self.started_at:
+            timings["queued_seconds"] = round(self.started_at - self.submitted_at, 3)
+        if self.finished_at:
+            timings["run_seconds"] = round(self.finished_at - self.started_at, 3)
+        if timings:
+            data["timings"] = timings
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+class JobQueue:
+    """Bounded work queue served by a fixed pool of worker threads.
+
+    submit() never blocks: when max_pending jobs are already waiting it
+    raises QueueFull so the caller can push back on the client. Finished
+    jobs are kept for result_ttl seconds so they can be polled.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, result_ttl: float = 600.0):
+        self.result_ttl = result_ttl
+        self._queue: "queue.Queue[Job]" = queue.Queue(maxsize=max_pending)
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"resume-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, func: Callable[..., Dict], *args, **kwargs) -> str:
+        job = Job(func, args, kwargs)
+        self._expire_finished()
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            raise QueueFull("Too many resumes are waiting to be processed")
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _expire_finished(self):
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = job.func(*job.args, **job.kwargs)
+                job.status = "done"
+            except Exception as e:
+                job.error = str(e)
+                job.status = "failed"
+            finally:
+                job.finished_at = time.time()
+                job.done.set()
+                self._queue.task_done()
@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Models listed here (comma separated) are never loaded, e.g.
+# RESUAI_DISABLED_MODELS=summarizer skips BART entirely.
+DISABLED_MODELS = {
+    name.strip() for name in os.environ.get("RESUAI_DISABLED_MODELS", "").split(",") if name.strip()
+}
+
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+# "torch" runs the SentenceTransformer, "onnx" the exported (int8) ONNX model
+EMBEDDING_BACKEND = os.environ.get("RESUAI_EMBEDDING_BACKEND", "torch")
+# Registry entry the matcher encodes with
+EMBEDDER_MODEL = "onnx_embedder" if EMBEDDING_BACKEND == "onnx" else "embedder"
+SUMMARIZER_MODEL_NAME = "facebook/bart-large-cnn"
+DISTILLED_SUMMARIZER_MODEL_NAME = "sshleifer/distilbart-cnn-12-6"
+
+# Model inference calls allowed to run at once. Each call already spreads
+# over several cores (torch / onnxruntime intra-op threads), so running
+# more side by side only oversubscribes the CPU.
+MODEL_CONCURRENCY = max(1, int(os.environ.get("RESUAI_MODEL_CONCURRENCY", "1")))
+_INFERENCE_SLOTS = threading.BoundedSemaphore(MODEL_CONCURRENCY)
+
+_LOADERS: Dict[str, Callable[[], Any]] = {}
+_MODELS: Dict[str, Any] = {}
+_STATS: Dict[str, Dict[str, Any]] = {}
+_LOCKS: Dict[str, threading.Lock] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+def _current_rss_mb() -> float:
+    """Resident memory of this process in MB (0.0 when it cannot be read)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak, not the current value, but it is the best
+        # portable approximation available without psutil
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return 0.0
+
+def register_model(name: str, loader: Callable[[], Any]):
+    """Register a zero-argument loader; nothing is loaded until first use"""
+    with _REGISTRY_LOCK:
+        _LOADERS[name] = loader
+        _LOCKS.setdefault(name, threading.Lock())
+
+def get_model(name: str) -> Any:
+    """Return the shared instance of a model, loading it on first use.
+
+    Returns None if the model is disabled or failed to load; the failure is
+    remembered so later calls do not retry the load on every request.
+    """
+    if name in _MODELS:
+        return _MODELS[name]
+    if name not in _LOADERS:
+        raise KeyError(f"Unknown model: {name}")
+
+    with _LOCKS[name]:
+        if name in _MODELS:
+            return _MODELS[name]
+
+        if name in DISABLED_MODELS:
+            _STATS[name] = {"loaded": False, "disabled": True, "load_seconds": 0.0, "rss_mb": 0.0}
+            _MODELS[name] = None
+            return None
+
+        rss_before = _current_rss_mb()
+        start = time.perf_counter()
+        try:
+            model = _LOADERS[name]()
+        except Exception:
+            logger.exception("Model loading error (%s)", name)
+            model = None
+
+        _STATS[name] = {
+            "loaded": model is not None,
+            "disabled": False,
+            "load_seconds": round(time.perf_counter() - start, 3),
+            "rss_mb": round(max(_current_rss_mb() - rss_before, 0.0), 1),
+        }
+        _MODELS[name] = model
+        return model
+
+def is_loaded(name: str) -> bool:
+    """Whether a model has already been loaded in this process"""
+    return _MODELS.get(name) is not None
+
+@contextmanager
+def inference_slot() -> Iterator[None]:
+    """Hold one of the MODEL_CONCURRENCY slots while a model runs"""
+    with _INFERENCE_SLOTS:
+        yield
+
+def preload(names: Iterable[str]):
+    """Eagerly load the given models, e.g. in a worker initializer"""
+    for name in names:
+        get_model(name)
+
+def model_stats() -> Dict[str, Any]:
+    """Load time and resident memory added per model, plus the process total"""
+    models = {}
+    for name in _LOADERS:
+        models[name] = dict(_STATS.get(name) or {
+            "loaded": False, "disabled": name in DISABLED_MODELS, "load_seconds": 0.0, "rss_mb": 0.0,
+        })
+    return {"models": models, "process_rss_mb": round(_current_rss_mb(), 1)}
+
+def _load_summarizer():
+    from transformers import pipeline
+    return pipeline("summarization", model=SUMMARIZER_MODEL_NAME)
+
+def _load_distilled_summarizer():
+    from transformers import pipeline
+    return pipeline("summarization", model=DISTILLED_SUMMARIZER_MODEL_NAME)
+
+def _load_embedder():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+def _load_onnx_embedder():
+    from backend.onnx_embedder import load_onnx_embedder
+    return load_onnx_embedder()
+
+register_model("summarizer", _load_summarizer)
+register_model("distilled_summarizer", _load_distilled_summarizer)
+register_model("embedder", _load_embedder)
+register_model("onnx_embedder", _load_onnx_embedder)
@@ -0,0 +1,193 @@
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from backend.config import CACHE_DIR
+from backend.models import EMBEDDING_MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+# Hugging Face checkpoint behind the SentenceTransformer of the same name
+HF_MODEL_NAME = f"sentence-transformers/{EMBEDDING_MODEL_NAME}"
+ONNX_MODEL_DIR = os.environ.get(
+    "RESUAI_ONNX_MODEL_DIR", os.path.join(CACHE_DIR, "onnx", EMBEDDING_MODEL_NAME)
+)
+# int8 dynamic quantization of the linear layers; set to 0 for float32 ONNX
+ONNX_QUANTIZE = os.environ.get("RESUAI_ONNX_QUANTIZE", "1") != "0"
+# Intra-op threads per session; 0 lets onnxruntime use every core
+ONNX_THREADS = int(os.environ.get("RESUAI_ONNX_THREADS", "0"))
+
+# SentenceTransformer truncates all-MiniLM-L6-v2 inputs at 256 tokens
+MAX_SEQ_LENGTH = 256
+ONNX_OPSET = 14
+
+FP32_FILE = "model.onnx"
+INT8_FILE = "model.int8.onnx"
+INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+# Exported models whose embeddings drift further from PyTorch are rejected
+PARITY_MIN_COSINE = 0.98
+PARITY_TEXTS = [
+    "Senior Python developer with 6 years of experience building Flask and Django APIs.",
+    "Data scientist skilled in machine learning, NLP, TensorFlow and scikit-learn.",
+    "B.Tech in Computer Science, National Institute of Technology, 2019.",
+    "Looking for a DevOps engineer familiar with Docker, Kubernetes and AWS.",
+    "Managed a team of five and delivered the migration to Google Cloud ahead of schedule.",
+]
+
+def cache_key(quantized: bool = ONNX_QUANTIZE) -> str:
+    """Embedding cache namespace of the ONNX vectors (they differ slightly from PyTorch)"""
+    return f"{EMBEDDING_MODEL_NAME}:onnx-{'int8' if quantized else 'fp32'}"
+
+def _mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Mean of token embeddings over real tokens, as the SentenceTransformer pools"""
+    mask = attention_mask[..., None].astype(np.float32)
+    return (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+class OnnxEmbedder:
+    """Drop-in replacement for SentenceTransformer.encode backed by onnxruntime"""
+
+    def __init__(self, model_dir: str = ONNX_MODEL_DIR, quantized: bool = ONNX_QUANTIZE,
+                 threads: int = ONNX_THREADS):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        path = os.path.join(model_dir, INT8_FILE if quantized else FP32_FILE)
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_seq_length = MAX_SEQ_LENGTH
+        self.cache_key = cache_key(quantized)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        tokens = self.tokenizer(
+            texts, padding=True, truncation=True, max_length=MAX_SEQ_LENGTH, return_tensors="np"
+        )
+        feed = {name: tokens[name].astype(np.int64) for name in self.input_names if name in tokens}
+        hidden = self.session.run(None, feed)[0]
+        return _mean_pool(hidden, tokens["attention_mask"])
+
+    def encode(self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        """Encode texts into a (len(texts), dim) float32 array"""
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size, convert_to_numpy, normalize_embeddings)[0]
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        # Batch texts of similar length together to keep padding small
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors = np.zeros((len(texts), 0), dtype=np.float32)
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            batch = self._encode_batch([texts[i] for i in rows])
+            if vectors.shape[1] == 0:
+                vectors = np.zeros((len(texts), batch.shape[1]), dtype=np.float32)
+            vectors[rows] = batch
+
+        if normalize_embeddings:
+            vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        return vectors
+
+def parity_check(reference, candidate, texts: Optional[List[str]] = None) -> Dict[str, float]:
+    """Compare two embedders text by text; cosines near 1.0 mean matching scores barely move.
+
+    score_max_abs_diff is the largest change of any pairwise similarity,
+    i.e. of any resume/job match score computed from these texts.
+    """
+    texts = texts or PARITY_TEXTS
+    ref = np.asarray(reference.encode(texts, normalize_embeddings=True, convert_to_numpy=True), dtype=np.float32)
+    cand = np.asarray(candidate.encode(texts, normalize_embeddings=True, convert_to_numpy=True), dtype=np.float32)
+    cosines = (ref * cand).sum(axis=1)
+    score_diff = np.abs(ref @ ref.T - cand @ cand.T)
+    return {
+        "min_cosine": round(float(cosines.min()), 5),
+        "mean_cosine": round(float(cosines.mean()), 5),
+        "score_max_abs_diff": round(float(score_diff.max()), 5),
+    }
+
+def export_onnx(model_dir: str = ONNX_MODEL_DIR, quantize: bool = True) -> str:
+    """Export the PyTorch model to ONNX (plus an int8 copy) under model_dir.
+
+    Needs torch, transformers and onnxruntime; serving only needs the last
+    two. The export is written to a private temporary folder and renamed
+    into place, so a half-written model is never picked up.
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModel, AutoTokenizer
+
+    # A private folder per export: batch or server workers exporting at the
+    # same time never touch each other's files
+    parent = os.path.dirname(os.path.abspath(model_dir))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(model_dir) + ".", suffix=".tmp", dir=parent)
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(HF_MODEL_NAME)
+        model = AutoModel.from_pretrained(HF_MODEL_NAME).eval()
+        tokenizer.save_pretrained(tmp_dir)
+
+        sample = tokenizer(PARITY_TEXTS[:2], padding=True, return_tensors="pt")
+        fp32_path = os.path.join(tmp_dir, FP32_FILE)
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        with torch.no_grad():
+            torch.onnx.export(
+                model, tuple(sample[name] for name in INPUT_NAMES), fp32_path,
+                input_names=INPUT_NAMES, output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes, opset_version=ONNX_OPSET,
+            )
+        if quantize:
+            quantize_dynamic(fp32_path, os.path.join(tmp_dir, INT8_FILE), weight_type=QuantType.QInt8)
+        _install_export(tmp_dir, model_dir, INT8_FILE if quantize else FP32_FILE)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return model_dir
+
+def _install_export(tmp_dir: str, model_dir: str, model_file: str):
+    """Atomically rename a finished export to model_dir"""
+    try:
+        os.rename(tmp_dir, model_dir)
+        return
+    except OSError:
+        if os.path.exists(os.path.join(model_dir, model_file)):
+            # Another process finished its export first; keep that one
+            return
+    # An older export without the file we need: move it aside, then rename
+    stale_dir = tempfile.mkdtemp(prefix=os.path.basename(model_dir) + ".", suffix=".old",
+                                 dir=os.path.dirname(os.path.abspath(model_dir)))
+    try:
+        os.replace(model_dir, os.path.join(stale_dir, "model"))
+    except FileNotFoundError:
+        pass
+    try:
+        os.rename(tmp_dir, model_dir)
+    except OSError:
+        if not os.path.exists(os.path.join(model_dir, model_file)):
+            raise
+    finally:
+        shutil.rmtree(stale_dir, ignore_errors=True)
+
+def load_onnx_embedder(model_dir: str = ONNX_MODEL_DIR, quantized: bool = ONNX_QUANTIZE) -> OnnxEmbedder:
+    """Load the exported model, exporting and parity-checking it on first use"""
+    if not os.path.exists(os.path.join(model_dir, INT8_FILE if quantized else FP32_FILE)):
+        from sentence_transformers import SentenceTransformer
+
+        export_onnx(model_dir, quantize=quantized)
+        embedder = OnnxEmbedder(model_dir, quantized)
+        parity = parity_check(SentenceTransformer(EMBEDDING_MODEL_NAME), embedder)
+        logger.info("ONNX embedding parity (%s): %s", embedder.cache_key, parity)
+        if parity["min_cosine"] < PARITY_MIN_COSINE:
+            shutil.rmtree(model_dir, ignore_errors=True)
+            raise RuntimeError(
+                f"ONNX export diverges from PyTorch (min cosine {parity['min_cosine']} < {PARITY_MIN_COSINE})"
+            )
+        return embedder
+    return OnnxEmbedder(model_dir, quantized)
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from typing import Dict, Optional, Union
+
+from backend.config import CACHE_DIR
+from backend.sqlite_cache import SQLiteLRU
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_PATH = os.path.join(CACHE_DIR, "parses.sqlite3")
+PARSE_CACHE_ENABLED = os.environ.get("RESUAI_PARSE_CACHE", "1") != "0"
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def content_digest(source: Union[str, bytes, bytearray, memoryview]) -> str:
+    """SHA-256 of a file's bytes (read in blocks) or of an in-memory buffer"""
+    if not isinstance(source, str):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ParseCache(SQLiteLRU):
+    """On-disk store of parse results keyed by content hash, with LRU eviction.
+
+    Results are kept as zlib-compressed JSON; callers build keys that also
+    cover everything else the result depends on (parser version, options).
+    """
+    table = "parses"
+    value_column = "result"
+    index_name = "idx_parses_last_access"
+    label = "Parse cache"
+
+    def __init__(self, path: str = PARSE_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(path, max_entries, max_bytes)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """The cached result for key, or None"""
+        with self._lock:
+            rows = self._select("result", [key])
+        return json.loads(zlib.decompress(rows[0][1])) if rows else None
+
+    def put(self, key: str, result: Dict):
+        """Store a result and evict the least recently used ones"""
+        blob = zlib.compress(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        self._put_rows([(key, blob, time.time())])
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Process-wide cache instance, or None when disabled or unavailable"""
+    return ParseCache.shared() if PARSE_CACHE_ENABLED else None
+
+def cache_get(cache: ParseCache, key: str) -> Optional[Dict]:
+    """cache.get, treating a failing cache (e.g. locked by a batch worker) as a miss"""
+    try:
+        return cache.get(key)
+    except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+        logger.warning("Parse cache lookup failed: %s", e)
+        return None
+
+def cache_put(cache: ParseCache, key: str, result: Dict):
+    """cache.put that logs instead of failing the parse it stores"""
+    try:
+        cache.put(key, result)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Parse cache store failed: %s", e)
@@ -5,6 +5,7 @@ import spacy
 import os
 import json
 from transformers import pipeline
+from backend.skills import skill_names
 from fuzzywuzzy import fuzz
 from google.colab import files  # For file uploads in Google Colab
 
@@ -37,17 +38,8 @@ EDUCATION_KEYWORDS = [ "education", "degree", "university", "college", "bachelor
     "phd", "school", "academic background", "certifications", "academics", 
     "educational qualifications", "academic history"]
 
-# Expanded Skills Database (including science-based skills)
-SKILLS_DATABASE = {
-    # Programming and Software Development
-    "Python", "Java", "C++", "JavaScript", "Node.js", "SQL", "React", "Docker", "Kubernetes",
-    "Flask", "Django", "Git", "REST API", "GraphQL", "Pandas", "NumPy", "Scikit-learn",
-    "PyTorch", "TensorFlow", "OpenCV", "Linux", "Bash", "Jenkins", "Ansible", "Azure",
-    "Google Cloud", "AWS", "Spark", "Hadoop", "Tableau", "Power BI", "Agile", "Scrum", "Kanban",
-    # Other Technical Skills
-    "Machine Learning", "Data Science", "Artificial Intelligence", "Cybersecurity", "Cloud Computing",
-    "Blockchain", "IoT", "Robotics"
-}
+# Skills Database (shared taxonomy in data/skills_taxonomy.json)
+SKILLS_DATABASE = skill_names()
 
 # Initialize Lemmatizer
 lemmatizer = WordNetLemmatizer()
@@ -5,6 +5,7 @@ import spacy
 import os
 import json
 from transformers import pipeline
+from backend.skills import skill_names
 from fuzzywuzzy import fuzz  # For fuzzy matching
 
 # Check if NLTK is installed and download required data
@@ -32,33 +33,8 @@ summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
 WORK_KEYWORDS = ["work experience", "experience", "employment", "professional experience", "career history"]
 EDUCATION_KEYWORDS = ["education", "degree", "university", "college", "bachelor", "master", "phd", "school", "academic background", "certifications"]
 
-# Expanded Skills Database (including science-based skills)
-SKILLS_DATABASE = {
-    # Programming and Software Development
-    "Python", "Java", "C++", "JavaScript", "Node.js", "SQL", "React", "Docker", "Kubernetes",
-    "Flask", "Django", "Git", "REST API", "GraphQL", "Pandas", "NumPy", "Scikit-learn",
-    "PyTorch", "TensorFlow", "OpenCV", "Linux", "Bash", "Jenkins", "Ansible", "Azure",
-    "Google Cloud", "AWS", "Spark", "Hadoop", "Tableau", "Power BI", "Agile", "Scrum", "Kanban",
-
-    # Data Science and Machine Learning
-    "Machine Learning", "Data Science", "Deep Learning", "Natural Language Processing", "NLP",
-    "Computer Vision", "Big Data", "Artificial Intelligence", "Data Structures", "Data Analysis",
-    "Data Visualization", "Statistical Modeling", "Predictive Analytics", "Reinforcement Learning",
-
-    # Physics and Subfields
-    "Physics", "Classical Mechanics", "Quantum Mechanics", "Electromagnetism", "Thermodynamics",
-    "Statistical Mechanics", "Astrophysics", "Cosmology", "Particle Physics", "Nuclear Physics",
-    "Optics", "Solid State Physics", "Plasma Physics", "Fluid Dynamics", "Relativity", "Quantum Field Theory",
-
-    # Mathematics and Subfields
-    "Mathematics", "Linear Algebra", "Calculus", "Differential Equations", "Probability", "Statistics",
-    "Number Theory", "Geometry", "Topology", "Discrete Mathematics", "Numerical Analysis", "Optimization",
-    "Game Theory", "Mathematical Modeling", "Complex Analysis", "Real Analysis", "Abstract Algebra",
-
-    # Other Technical Skills
-    "Cybersecurity", "DevOps", "Cloud Computing", "Blockchain", "IoT", "Robotics", "Embedded Systems",
-    "Signal Processing", "Control Systems", "Biophysics", "Computational Biology", "Bioinformatics"
-}
+# Skills Database (shared taxonomy in data/skills_taxonomy.json)
+SKILLS_DATABASE = skill_names()
 
 # Initialize Lemmatizer
 lemmatizer = WordNetLemmatizer()
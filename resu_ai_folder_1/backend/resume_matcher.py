@@ -1,21 +1,42 @@
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+import os
 import re
-from typing import List, Dict
-
-# Skills Database
-SKILLS_DATABASE = {
-    "Python", "Java", "C++", "JavaScript", "Node.js", "SQL", "React", "Docker", "Kubernetes",
-    "Flask", "Django", "Git", "REST API", "GraphQL", "Pandas", "NumPy", "Scikit-learn",
-    "PyTorch", "TensorFlow", "OpenCV", "Linux", "Bash", "Jenkins", "Ansible", "Azure",
-    "Google Cloud", "AWS", "Spark", "Hadoop", "Tableau", "Power BI", "Agile", "Scrum", "Kanban",
-    "Machine Learning", "Data Science", "Deep Learning", "Natural Language Processing", "NLP",
-    "Computer Vision", "Big Data", "Artificial Intelligence", "Data Structures", "Data Analysis",
-    "Data Visualization", "Statistical Modeling", "Predictive Analytics", "R"
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from backend.embedding_cache import cache_get_many, cache_put_many, get_embedding_cache
+from backend.instrumentation import logger, stage
+from backend.models import EMBEDDER_MODEL, EMBEDDING_MODEL_NAME, get_model, inference_slot
+from backend.skill_index import SkillIndex
+from backend.skills import find_skills, get_taxonomy
+from backend.vector_index import DEFAULT_NPROBE
+
+# Minimum cosine similarity for a resume to count as a match
+MATCH_THRESHOLD = 0.5
+
+# Texts longer than the model window are split into overlapping windows that
+# are pooled back into one vector: "mean", "max", or "section" (windows
+# weighted by the resume section they come from). "truncate" keeps only
+# what fits the first window, as the model does on its own.
+POOLING = os.environ.get("RESUAI_EMBEDDING_POOLING", "mean")
+WINDOW_OVERLAP = 32
+WINDOW_CACHE_SIZE = 1024
+
+# Relative weight of each resume section in "section" pooling
+SECTION_WEIGHTS = {
+    "skills": 1.5,
+    "work_experience": 1.5,
+    "projects": 1.0,
+    "education": 0.75,
+    "certifications": 0.5,
 }
 
-# Load Model
-model = SentenceTransformer('all-MiniLM-L6-v2')
+def _embedding_cache_key() -> str:
+    # ONNX vectors are cached apart from the PyTorch ones they approximate
+    if EMBEDDER_MODEL == "onnx_embedder":
+        from backend.onnx_embedder import cache_key
+        return cache_key()
+    return EMBEDDING_MODEL_NAME
 
 def preprocess_text(text: str) -> str:
     if not text:
@@ -24,52 +45,278 @@ def preprocess_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text).strip().lower()
     return text
 
-def encode_text(text: str):
-    return model.encode(text, convert_to_tensor=True)
+def _get_embedder():
+    # Shared with every other caller in the process, loaded on first use
+    model = get_model(EMBEDDER_MODEL)
+    if model is None:
+        raise RuntimeError("Embedding model is not available")
+    return model
 
-def get_similarity_score(text1: str, text2: str) -> float:
-    text1 = preprocess_text(text1)
-    text2 = preprocess_text(text2)
-    
-    if not text1 or not text2:
+def encode_text(text: str) -> np.ndarray:
+    return encode_texts([text])[0]
+
+def encode_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """Encode many preprocessed texts in batched calls into unit-length rows.
+
+    Texts already in the embedding cache are looked up; only the rest are
+    sent to the transformer, and their vectors are stored for next time.
+    """
+    cache = get_embedding_cache()
+    key = _embedding_cache_key()
+    cached = cache_get_many(cache, texts, key) if cache else {}
+
+    missing = list(dict.fromkeys(t for t in texts if t not in cached))
+    if missing:
+        embedder = _get_embedder()
+        with stage("encode"), inference_slot():
+            vectors = embedder.encode(
+                missing, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+            )
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if cache:
+            cache_put_many(cache, missing, vectors, key)
+        cached.update(zip(missing, vectors))
+
+    return np.stack([cached[t] for t in texts]) if texts else np.zeros((0, 0), dtype=np.float32)
+
+@lru_cache(maxsize=WINDOW_CACHE_SIZE)
+def split_windows(text: str) -> Tuple[str, ...]:
+    """Overlapping slices of a preprocessed text that each fit the model window.
+
+    Cached per text, so matching the same resume or JD again neither
+    re-tokenizes it nor (through the embedding cache) re-encodes it.
+    """
+    model = _get_embedder()
+    window = model.max_seq_length - 2  # room for [CLS] and [SEP]
+    offsets = model.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+    if len(offsets) <= window:
+        return (text,)
+
+    overlap = min(WINDOW_OVERLAP, window // 2)
+    windows = []
+    for start in range(0, len(offsets) - overlap, window - overlap):
+        end = min(start + window, len(offsets))
+        windows.append(text[offsets[start][0]:offsets[end - 1][1]])
+    return tuple(windows)
+
+# parse_resume profile with every field matching reads: the text, plus
+# the sections when they are pooled separately
+MATCH_PROFILE = "fast" if POOLING == "section" else "match"
+
+def resume_sections(parsed: Dict) -> Dict[str, str]:
+    """The sections of a parse_resume result that "section" pooling weighs"""
+    sections = {}
+    for name in SECTION_WEIGHTS:
+        content = parsed.get(name, "")
+        if isinstance(content, (list, tuple)):
+            # parse_resume returns skills as a list of canonical names
+            content = ", ".join(item for item in content if isinstance(item, str) and item != "No Skills Found")
+        sections[name] = content if isinstance(content, str) else ""
+    return sections
+
+def _weighted_windows(text: str, sections: Optional[Dict[str, str]], pooling: str) -> List[Tuple[str, float]]:
+    pieces = []
+    if pooling == "section" and sections:
+        pieces = [
+            (preprocess_text(content), SECTION_WEIGHTS.get(name, 1.0))
+            for name, content in sections.items()
+            if content and content != "No Data"
+        ]
+    pieces = [(piece, weight) for piece, weight in pieces if piece] or [(preprocess_text(text), 1.0)]
+    if pooling == "truncate":
+        return [(piece, weight) for piece, weight in pieces if piece]
+    return [(window, weight) for piece, weight in pieces if piece for window in split_windows(piece)]
+
+def _pool(vectors: np.ndarray, weights: np.ndarray, pooling: str) -> np.ndarray:
+    if pooling == "max":
+        pooled = vectors.max(axis=0)
+    else:
+        pooled = (vectors * weights[:, None]).sum(axis=0) / weights.sum()
+    norm = np.linalg.norm(pooled)
+    return pooled / norm if norm else pooled
+
+def window_plan(texts: List[str], sections: Optional[List[Optional[Dict[str, str]]]] = None,
+                pooling: Optional[str] = None) -> Tuple[List[List[Tuple[str, float]]], List[str]]:
+    """The weighted windows of every text, and the distinct windows to encode"""
+    pooling = pooling or POOLING
+    sections = sections or [None] * len(texts)
+    per_text = [_weighted_windows(text, text_sections, pooling) for text, text_sections in zip(texts, sections)]
+    return per_text, list(dict.fromkeys(window for windows in per_text for window, _ in windows))
+
+def pool_windows(per_text: List[List[Tuple[str, float]]], unique_windows: List[str],
+                 embeddings: np.ndarray, pooling: Optional[str] = None) -> np.ndarray:
+    """One unit-length row per text from the embeddings of unique_windows"""
+    pooling = pooling or POOLING
+    if not unique_windows:
+        return np.zeros((len(per_text), 0), dtype=np.float32)
+    row_of = {window: i for i, window in enumerate(unique_windows)}
+
+    pooled = np.zeros((len(per_text), embeddings.shape[1]), dtype=np.float32)
+    for i, windows in enumerate(per_text):
+        if windows:
+            rows = [row_of[window] for window, _ in windows]
+            weights = np.array([weight for _, weight in windows], dtype=np.float32)
+            pooled[i] = _pool(embeddings[rows], weights, pooling)
+    return pooled
+
+def encode_long_texts(texts: List[str], sections: Optional[List[Optional[Dict[str, str]]]] = None,
+                      pooling: Optional[str] = None, batch_size: int = 32) -> np.ndarray:
+    """Encode texts of any length into unit-length rows.
+
+    Every text is cut into windows; the windows of all texts are encoded in
+    one batched, cached call and pooled into one vector per text. sections
+    (parsed resume sections per text) are only used by "section" pooling,
+    which falls back to plain windows when a text has none. Empty texts get
+    a zero row.
+    """
+    per_text, unique_windows = window_plan(texts, sections, pooling)
+    embeddings = encode_texts(unique_windows, batch_size=batch_size) if unique_windows else None
+    return pool_windows(per_text, unique_windows, embeddings, pooling)
+
+def get_similarity_score(text1: str, text2: str, sections1: Optional[Dict[str, str]] = None) -> float:
+    if not preprocess_text(text1) or not preprocess_text(text2):
         return 0.0
     
     try:
-        emb1 = encode_text(text1)
-        emb2 = encode_text(text2)
-        similarity = cosine_similarity(emb1.reshape(1, -1), emb2.reshape(1, -1))
+        emb1, emb2 = encode_long_texts([text1, text2], [sections1, None])
+        with stage("similarity"):
+            similarity = cosine_similarity(emb1.reshape(1, -1), emb2.reshape(1, -1))
         return float(similarity[0][0])
     except Exception as e:
-        print(f"Similarity calculation error: {e}")
+        logger.error("Similarity calculation error: %s", e)
         return 0.0
 
 def extract_skills_from_text(text: str) -> List[str]:
-    text_lower = text.lower()
-    skills = set()
-    
-    for skill in SKILLS_DATABASE:
-        if re.search(rf'(?<!\w){re.escape(skill.lower())}(?!\w)', text_lower):
-            skills.add(skill)
-    
-    return list(skills)
+    return list(find_skills(text))
 
-def get_matched_skills(resume_text: str, job_description: str) -> List[str]:
-    resume_skills = set(extract_skills_from_text(resume_text))
-    job_skills = set(extract_skills_from_text(job_description))
-    
-    matched = [
-        skill for skill in resume_skills 
-        if skill.lower() in {s.lower() for s in job_skills}
-    ]
-    
+@lru_cache(maxsize=256)
+def _job_skills_for(job_description: str, taxonomy_digest: str) -> frozenset:
+    return frozenset(find_skills(job_description))
+
+def _job_skills(job_description: str) -> frozenset:
+    # A job description is matched against many resumes; extract its skills
+    # once per taxonomy, so a reloaded taxonomy is used right away
+    return _job_skills_for(job_description, get_taxonomy().digest)
+
+def _intersect_skills(resume_skills: List[str], job_skills) -> List[str]:
+    # Both sides are canonical taxonomy names, so plain membership suffices
+    job_skills = job_skills if isinstance(job_skills, (set, frozenset)) else set(job_skills)
+    matched = sorted(skill for skill in resume_skills if skill in job_skills)
     return matched if matched else ["No Matching Skills Found"]
 
-def match_resume_to_job(resume_text: str, job_description: str) -> Dict:
-    similarity_score = get_similarity_score(resume_text, job_description)
+def get_matched_skills(resume_text: str, job_description: str) -> List[str]:
+    with stage("match_skills"):
+        resume_skills = extract_skills_from_text(resume_text)
+        return _intersect_skills(resume_skills, _job_skills(job_description))
+
+def match_resume_to_job(resume_text: str, job_description: str,
+                        resume_sections: Optional[Dict[str, str]] = None) -> Dict:
+    similarity_score = get_similarity_score(resume_text, job_description, resume_sections)
     matched_skills = get_matched_skills(resume_text, job_description)
     
     return {
-        "match": similarity_score >= 0.5,
+        "match": similarity_score >= MATCH_THRESHOLD,
         "score": similarity_score,
         "matched_skills": matched_skills
-    }
\ No newline at end of file
+    }
+
+def similarity_matrix(resumes: List[str], jobs: List[str], batch_size: int = 32) -> np.ndarray:
+    """Cosine similarity of every job (rows) against every resume (columns)"""
+    resume_texts = [preprocess_text(t) for t in resumes]
+    job_texts = [preprocess_text(t) for t in jobs]
+
+    # Encode each distinct non-empty text once, all in a single batched call
+    unique_texts = list(dict.fromkeys(t for t in resume_texts + job_texts if t))
+    scores = np.zeros((len(jobs), len(resumes)), dtype=np.float32)
+    if not unique_texts:
+        return scores
+
+    embeddings = encode_long_texts(unique_texts, batch_size=batch_size)
+    row_of = {text: i for i, text in enumerate(unique_texts)}
+    resume_rows = [i for i, t in enumerate(resume_texts) if t]
+    job_rows = [i for i, t in enumerate(job_texts) if t]
+    if not resume_rows or not job_rows:
+        return scores
+
+    resume_emb = embeddings[[row_of[resume_texts[i]] for i in resume_rows]]
+    job_emb = embeddings[[row_of[job_texts[i]] for i in job_rows]]
+
+    # Embeddings are unit length, so one matrix product gives all cosines
+    with stage("similarity"):
+        scores[np.ix_(job_rows, resume_rows)] = job_emb @ resume_emb.T
+    return scores
+
+def match_many(resumes: List[str], jobs: List[str], top_k: Optional[int] = None,
+               batch_size: int = 32, required_skills: Optional[List[str]] = None,
+               min_skills: Optional[int] = None) -> List[Dict]:
+    """Match N resumes against M job descriptions, ranked per job.
+
+    Returns one entry per job with its top_k resumes (all when top_k is None)
+    ordered by score; indices refer to positions in the input lists. With
+    required_skills, resumes lacking all of them (or fewer than min_skills
+    of them) are dropped before any embedding work.
+    """
+    # Extract skills once per text rather than once per pair
+    resume_skills = [extract_skills_from_text(t) for t in resumes]
+    job_skills = [_job_skills(t) for t in jobs]
+
+    candidates = np.arange(len(resumes))
+    if required_skills:
+        skill_index = SkillIndex()
+        for i, skills in enumerate(resume_skills):
+            skill_index.add(i, skills)
+        candidates = skill_index.query(required_skills, min_skills)
+
+    scores = similarity_matrix([resumes[i] for i in candidates], jobs, batch_size=batch_size)
+
+    results = []
+    for j in range(len(jobs)):
+        order = np.argsort(-scores[j], kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+        ranked = [
+            {
+                "resume_index": int(candidates[c]),
+                "match": bool(scores[j, c] >= MATCH_THRESHOLD),
+                "score": float(scores[j, c]),
+                "matched_skills": _intersect_skills(resume_skills[candidates[c]], job_skills[j]),
+            }
+            for c in order
+        ]
+        results.append({"job_index": j, "results": ranked})
+
+    return results
+
+def resume_embedding(parsed: Dict) -> np.ndarray:
+    """Embedding of a parse_resume result, as used for matching and the resume index"""
+    return encode_long_texts([parsed["text"]], [resume_sections(parsed)])[0]
+
+def search_resumes(job_description: str, index, top_k: int = 10, nprobe: int = DEFAULT_NPROBE,
+                   required_skills: Optional[List[str]] = None, min_skills: Optional[int] = None) -> List[Dict]:
+    """Best-fitting resumes in a ResumeIndex for a job description.
+
+    Hits are ordered by score and carry the resume key, score, match flag
+    and the skills the resume shares with the job description. With
+    required_skills the index's skill postings first narrow the pool to
+    resumes having all (or min_skills) of them, which are then ranked exactly.
+    """
+    candidates = None
+    if required_skills:
+        candidates = index.filter(required_skills, min_skills)
+        if not len(candidates):
+            return []
+
+    query = encode_long_texts([job_description])[0]
+    if not query.size or not query.any():
+        return []
+    job_skills = _job_skills(job_description)
+    hits = index.search(query, top_k, nprobe, candidates=candidates)
+    return [
+        {
+            "file": hit["key"],
+            "match": hit["score"] >= MATCH_THRESHOLD,
+            "score": hit["score"],
+            "matched_skills": _intersect_skills(hit["skills"], job_skills),
+        }
+        for hit in hits
+    ]
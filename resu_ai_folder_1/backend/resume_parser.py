@@ -1,77 +1,24 @@
 import json
-import pdfplumber
-import docx
 import re
-import spacy
-import os
-import zipfile
-from typing import Dict, List, Optional
-from fuzzywuzzy import fuzz
-from transformers import pipeline
-from nltk.stem import WordNetLemmatizer
-import nltk
-import fitz
-
-# Initialize NLTK
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-lemmatizer = WordNetLemmatizer()
-
-# Load NLP model
-nlp = spacy.load("en_core_web_sm")
-
-# Initialize summarizer
-try:
-    summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-except:
-    summarizer = None
-
-# Section Keywords
-WORK_KEYWORDS = [
-    "work experience", "professional experience", "employment history",
-    "work history", "experience", "career", "employment",
-    "professional background", "positions held", "jobs"
-]
-
-EDUCATION_KEYWORDS = [
-    "education", "academic background", "qualifications",
-    "degrees", "university", "college", "schooling",
-    "academics", "educational qualifications", "studies"
-]
-
-# Skills Database
-SKILLS_DATABASE = {
-    "Python", "Java", "C++", "JavaScript", "Node.js", "SQL", "React", "Docker", "Kubernetes",
-    "Flask", "Django", "Git", "REST API", "GraphQL", "Pandas", "NumPy", "Scikit-learn",
-    "PyTorch", "TensorFlow", "OpenCV", "Linux", "Bash", "Jenkins", "Ansible", "Azure",
-    "Google Cloud", "AWS", "Spark", "Hadoop", "Tableau", "Power BI", "Agile", "Scrum", "Kanban",
-    "Machine Learning", "Data Science", "Deep Learning", "Natural Language Processing", "NLP",
-    "Computer Vision", "Big Data", "Artificial Intelligence", "Data Structures", "Data Analysis",
-    "Data Visualization", "Statistical Modeling", "Predictive Analytics", "R"
-}
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from backend.instrumentation import logger, stage
+from backend.document import (
+    MAX_PDF_PAGES, MAX_TEXT_CHARS, DocumentSource, ParsedDocument, detect_file_type, load_document, read_source,
+)
+from backend.parse_cache import cache_get, cache_put, content_digest, get_parse_cache
+from backend.sections import SectionTracker, segment_sections
+from backend.skills import find_skills, get_taxonomy
+from backend.stage_pool import run_stages
+from backend.summarization import (
+    DEFAULT_SUMMARIZER, SUMMARY_NOT_AVAILABLE, summarize_texts, summarize_text, summary_backend,
+)
 
-def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
-    """Extract text from PDF files"""
-    try:
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text.strip()
-    except Exception as e:
-        print(f"PDF Extraction Error: {e}")
-        return None
+# Parsed sections the summary is built from, in this order
+SUMMARY_SECTIONS = ("work_experience", "education", "projects", "certifications")
 
-def extract_text_from_docx(docx_path: str) -> Optional[str]:
-    """Extract text from DOCX files"""
-    try:
-        doc = docx.Document(docx_path)
-        return "\n".join([para.text for para in doc.paragraphs]).strip()
-    except Exception as e:
-        print(f"DOCX Extraction Error: {e}")
-        return None
+# Bump whenever parse_resume output changes; cached results of other
+# versions are then never returned
+PARSER_VERSION = "4"
 
 def clean_text(text: str) -> str:
     """Clean extracted text"""
@@ -89,65 +36,35 @@ def extract_phone(text: str) -> str:
     match = re.findall(r'(\+?\d[\d\s\-().]{7,}\d)', text)
     return match[0] if match else "Not Found"
 
-def extract_hyperlinks_from_pdf(pdf_path: str) -> Dict[str, str]:
+def extract_hyperlinks(document: ParsedDocument) -> Dict[str, str]:
+    """Pick LinkedIn/GitHub URLs out of the document's link annotations"""
     hyperlinks = {}
-    try:
-        doc = fitz.open(pdf_path)
-        for page in doc:
-            links = page.get_links()
-            for l in links:
-                uri = l.get("uri", "")
-                if uri:
-                    if 'linkedin.com' in uri.lower():
-                        hyperlinks['linkedin'] = uri
-                    elif 'github.com' in uri.lower():
-                        hyperlinks['github'] = uri
-    except Exception as e:
-        print(f"PyMuPDF hyperlink extraction error: {e}")
-    return hyperlinks
+    for uri in document.links:
+        if 'linkedin.com' in uri.lower() and 'linkedin' not in hyperlinks:
+            hyperlinks['linkedin'] = uri
+        elif 'github.com' in uri.lower() and 'github' not in hyperlinks:
+            hyperlinks['github'] = uri
 
-def extract_hyperlinks_from_docx(docx_path: str) -> Dict[str, str]:
-    hyperlinks = {}
-    try:
-        # Step 1: From .rels file
-        with zipfile.ZipFile(docx_path) as z:
-            if 'word/_rels/document.xml.rels' in z.namelist():
-                rels = z.read('word/_rels/document.xml.rels').decode('utf-8')
-                linkedin_links = re.findall(r'https?://[^\s"]*linkedin\.com[^\s"]*', rels, re.IGNORECASE)
-                github_links = re.findall(r'https?://[^\s"]*github\.com[^\s"]*', rels, re.IGNORECASE)
-                if linkedin_links:
-                    hyperlinks['linkedin'] = linkedin_links[0]
-                if github_links:
-                    hyperlinks['github'] = github_links[0]
-        
-        # Step 2: Fallback via visible text
-        doc = docx.Document(docx_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
+    # DOCX fallback via visible text
+    if document.file_type == '.docx':
         if 'linkedin' not in hyperlinks:
-            linkedin_matches = re.findall(r'https?://[^\s]*linkedin\.com[^\s]*', text, re.IGNORECASE)
+            linkedin_matches = re.findall(r'https?://[^\s]*linkedin\.com[^\s]*', document.text, re.IGNORECASE)
             if linkedin_matches:
                 hyperlinks['linkedin'] = linkedin_matches[0]
         if 'github' not in hyperlinks:
-            github_matches = re.findall(r'https?://[^\s]*github\.com[^\s]*', text, re.IGNORECASE)
+            github_matches = re.findall(r'https?://[^\s]*github\.com[^\s]*', document.text, re.IGNORECASE)
             if github_matches:
                 hyperlinks['github'] = github_matches[0]
-    
-    except Exception as e:
-        print(f"DOCX hyperlink extraction error: {e}")
+
     return hyperlinks
 
-def extract_social_links(file_path: str) -> Dict[str, str]:
+def extract_social_links(document: ParsedDocument) -> Dict[str, str]:
     """Enhanced social link extraction with multiple fallbacks"""
-    links = {}
-    
     # First try hyperlink extraction
-    if file_path.endswith('.pdf'):
-        links.update(extract_hyperlinks_from_pdf(file_path))
-    elif file_path.endswith('.docx'):
-        links.update(extract_hyperlinks_from_docx(file_path))
+    links = extract_hyperlinks(document)
     
     # If still not found, try advanced text pattern matching
-    text = extract_text_from_pdf(file_path) if file_path.endswith('.pdf') else extract_text_from_docx(file_path)
+    text = document.text
     if text:
         # Improved LinkedIn pattern matching
         linkedin_patterns = [
@@ -193,21 +110,19 @@ def extract_social_links(file_path: str) -> Dict[str, str]:
     
     return links
 
-def debug_social_links(file_path: str):
+def debug_social_links(document: ParsedDocument):
     """Debug function to help identify why links aren't being found"""
     print("\n=== SOCIAL LINK DEBUGGING ===")
     
     # Show raw text extraction
-    text = extract_text_from_pdf(file_path) if file_path.endswith('.pdf') else extract_text_from_docx(file_path)
+    text = document.text
     print("\nExtracted Text Sample (first 500 chars):")
     print(text[:500] + "...")
     
     # Show hyperlink extraction results
     print("\nHyperlink Extraction Results:")
-    if file_path.endswith('.pdf'):
-        print("PDF Hyperlinks:", extract_hyperlinks_from_pdf(file_path))
-    elif file_path.endswith('.docx'):
-        print("DOCX Hyperlinks:", extract_hyperlinks_from_docx(file_path))
+    print("Link annotations:", document.links)
+    print("Social hyperlinks:", extract_hyperlinks(document))
     
     # Show text pattern matches
     print("\nText Pattern Matches:")
@@ -218,131 +133,236 @@ def debug_social_links(file_path: str):
     
 def extract_skills(text: str) -> List[str]:
     """Extract skills from text"""
-    text_lower = text.lower()
-    extracted_skills = set()
-    
-    # Exact matches
-    for skill in SKILLS_DATABASE:
-        if re.search(rf'\b{re.escape(skill.lower())}\b', text_lower):
-            extracted_skills.add(skill)
-    
-    # Handle abbreviations
-    abbrev_mapping = {
-        'nlp': 'Natural Language Processing',
-        'ai': 'Artificial Intelligence',
-        'ml': 'Machine Learning',
-        'ds': 'Data Science'
-    }
-    
-    for abbrev, full_skill in abbrev_mapping.items():
-        if abbrev in text_lower and full_skill in SKILLS_DATABASE:
-            extracted_skills.add(full_skill)
-    
+    # Exact matches and abbreviations are found in the same single scan
+    extracted_skills = find_skills(text)
     return sorted(extracted_skills) if extracted_skills else ["No Skills Found"]
 
-def extract_section(text: str, section_keywords: List[str]) -> str:
-    """Extract specific sections from resume"""
-    lines = text.split('\n')
-    section_lines = []
-    found_section = False
-    
-    for line in lines:
-        clean_line = line.strip()
-        if not clean_line:
-            continue
-            
-        # Check for section headers
-        is_header = any(
-            fuzz.partial_ratio(keyword.lower(), clean_line.lower()) >= 70
-            for keyword in section_keywords
-        ) and len(clean_line.split()) <= 5
-        
-        if is_header and not found_section:
-            found_section = True
-            continue
-            
-        if found_section:
-            # Stop at next section
-            other_sections = WORK_KEYWORDS + EDUCATION_KEYWORDS
-            other_sections = [kw for kw in other_sections if kw not in section_keywords]
-            is_other_header = any(
-                fuzz.partial_ratio(keyword.lower(), clean_line.lower()) >= 70
-                for keyword in other_sections
-            )
-            if is_other_header:
-                break
-                
-            section_lines.append(clean_line)
-    
-    return '\n'.join(section_lines) if section_lines else "No Data"
+def extract_sections(document: ParsedDocument) -> Dict[str, str]:
+    """Extract work, education, projects, certifications and skills sections"""
+    # Works on the document's real lines; the flat cleaned text has none left
+    return segment_sections(document.lines or document.text)
 
 def extract_work_experience(text: str) -> str:
     """Extract work experience section"""
-    return extract_section(text, WORK_KEYWORDS)
+    return segment_sections(text)["work_experience"]
 
 def extract_education(text: str) -> str:
     """Extract education section"""
-    return extract_section(text, EDUCATION_KEYWORDS)
+    return segment_sections(text)["education"]
 
-def generate_resume_summary(text: str) -> str:
-    """Generate AI summary of resume"""
-    if not summarizer:
-        return "Summary not available"
-    
-    # Clean text
-    text = re.sub(r"\S+@\S+", "", text)  # Remove emails
-    text = re.sub(r"\(?\+?\d{1,3}[-.\s]?\d{2,4}[-.\s]?\d{2,4}[-.\s]?\d{4}\)?", "", text)  # Remove phones
-    
+def generate_resume_summary(text: str, sections: Optional[Dict[str, str]] = None,
+                            summarizer: Optional[str] = None) -> str:
+    """Generate AI summary of resume with the chosen backend"""
+    return summarize_text(text, sections, backend=summarizer)
+
+# Every field parse_resume can return, in output order
+FIELDS = ("email", "phone", "linkedin", "github", "skills", "work_experience", "education",
+          "projects", "certifications", "summary", "text", "truncated")
+
+# The stage producing each field
+FIELD_STAGES = {
+    "email": "extract_contacts", "phone": "extract_contacts",
+    "linkedin": "extract_links", "github": "extract_links",
+    "skills": "extract_skills",
+    "work_experience": "extract_sections", "education": "extract_sections",
+    "projects": "extract_sections", "certifications": "extract_sections",
+    "summary": "summarize",
+    "text": "extract_text",
+    "truncated": "extract_text",
+}
+
+# Stages each stage reads from, listed in execution order
+STAGE_DEPENDENCIES = {
+    "extract_text": (),
+    "extract_links": ("extract_text",),
+    "extract_contacts": ("extract_text",),
+    "extract_skills": ("extract_text",),
+    "extract_sections": ("extract_text",),
+    "summarize": ("extract_text", "extract_sections"),
+}
+
+# Named field selections: fast skips the summary model, match is what
+# matching a resume against a job description reads
+PROFILES = {
+    "full": frozenset(FIELDS),
+    "fast": frozenset(FIELDS) - {"summary"},
+    "match": frozenset({"text", "skills"}),
+}
+
+def resolve_fields(fields: Union[str, Iterable[str], None] = None) -> FrozenSet[str]:
+    """A profile name or a collection of field names as a set of fields"""
+    if fields is None:
+        return PROFILES["full"]
+    if isinstance(fields, str):
+        if fields not in PROFILES:
+            raise ValueError(f"Unknown parse profile: {fields}")
+        return PROFILES[fields]
+    fields = frozenset(fields)
+    unknown = fields - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields
+
+def plan_stages(fields: Iterable[str]) -> Tuple[str, ...]:
+    """The stages needed to produce fields, dependencies included, in execution order"""
+    needed = set()
+    pending = [FIELD_STAGES[field] for field in fields]
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(STAGE_DEPENDENCIES[name])
+    return tuple(name for name in STAGE_DEPENDENCIES if name in needed)
+
+def _run_extractors(plan: Tuple[str, ...], document: ParsedDocument, text: str,
+                    summarizer: Optional[str]) -> Dict[str, Dict[str, str]]:
+    """Run the planned stages after text extraction; independent ones run concurrently"""
+    sections: Dict[str, str] = {}
+
+    def links():
+        # Social links come from hyperlinks or text
+        social_links = extract_social_links(document)
+        return {"linkedin": social_links.get('linkedin', 'Not Found'),
+                "github": social_links.get('github', 'Not Found')}
+
+    def contacts():
+        return {"email": extract_email(text), "phone": extract_phone(text)}
+
+    def skills():
+        return {"skills": extract_skills(text)}
+
+    def segment():
+        # All sections come out of a single segmentation pass
+        sections.update(extract_sections(document))
+        return {name: sections[name] for name in SUMMARY_SECTIONS}
+
+    def summary():
+        return {"summary": generate_resume_summary(
+            text, {name: sections[name] for name in SUMMARY_SECTIONS}, summarizer
+        )}
+
+    extractors = {
+        "extract_links": links, "extract_contacts": contacts, "extract_skills": skills,
+        "extract_sections": segment, "summarize": summary,
+    }
+    return run_stages({name: extractors[name] for name in plan if name in extractors}, STAGE_DEPENDENCIES)
+
+def _cache_key(digest: str, summarize: bool, summarizer: Optional[str],
+               fields: FrozenSet[str] = PROFILES["full"]) -> str:
+    # Everything a parse result depends on besides the file bytes
+    variant = (summarizer or DEFAULT_SUMMARIZER) if summarize and "summary" in fields else "no-summary"
+    if fields != PROFILES["full"]:
+        variant += ":" + ",".join(sorted(fields))
+    # Text cut at other page / character budgets gives other results
+    variant += f":{MAX_PDF_PAGES}p:{MAX_TEXT_CHARS}c"
+    return f"{digest}:{PARSER_VERSION}:{get_taxonomy().digest[:16]}:{variant}"
+
+def _cacheable(summarize: bool, summarizer: Optional[str], fields: FrozenSet[str] = PROFILES["full"]) -> bool:
+    # A summary from the extractive fallback (the requested model failed to
+    # load) must not outlive the failure under the requested backend's key
+    if not summarize or "summary" not in fields:
+        return True
+    return summary_backend(summarizer) == (summarizer or DEFAULT_SUMMARIZER)
+
+def parse_resume(source: DocumentSource, debug: bool = False, summarize: bool = True,
+                 summarizer: Optional[str] = None, use_cache: bool = True,
+                 file_name: Optional[str] = None,
+                 fields: Union[str, Iterable[str], None] = None) -> Dict[str, str]:
+    """Main resume parsing function.
+
+    source is a file path, the file's bytes (bytes / memoryview) or a binary
+    file object such as an upload; in-memory sources never touch the disk.
+    file_name names the format of in-memory sources (sniffed if omitted).
+    summarizer picks the summary backend ("extractive", "distilbart" or
+    "bart"); None uses the deployment default (RESUAI_SUMMARIZER). Results
+    are cached by file content, so the same resume uploaded again is not
+    parsed again.
+
+    fields selects the output: a profile ("full", "fast", "match") or a set
+    of field names such as {"text", "skills"}. Only the stages those fields
+    need are run, so e.g. "match" never summarizes or segments sections.
+    """
     try:
-        summary = summarizer(text[:1000], max_length=100, min_length=30, do_sample=False)
-        if summary and isinstance(summary, list) and 'summary_text' in summary[0]:
-            return summary[0]['summary_text']
-    except Exception as e:
-        print(f"Summary generation error: {e}")
-    
-    return "Summary not available"
+        fields = resolve_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    plan = plan_stages(fields if summarize else fields - {"summary"})
 
-def parse_resume(file_path: str) -> Dict[str, str]:
-    """Main resume parsing function"""
     try:
-        # Debug social links first
-        debug_social_links(file_path)
-
-        # Extract social links first (from hyperlinks or text)
-        social_links = extract_social_links(file_path)
-
-        # Extract text content
-        if file_path.endswith('.pdf'):
-            text = extract_text_from_pdf(file_path)
-        elif file_path.endswith('.docx'):
-            text = extract_text_from_docx(file_path)
-        else:
+        with stage("open"):
+            source = read_source(source)
+            file_type = detect_file_type(source, file_name)
+        if not file_type:
             return {"error": "Unsupported file format"}
-            
-        if not text:
+
+        cache = get_parse_cache() if use_cache and not debug else None
+        if cache:
+            with stage("cache_lookup"):
+                cache_key = _cache_key(content_digest(source), summarize, summarizer, fields)
+                cached = cache_get(cache, cache_key)
+            if cached is not None:
+                return cached
+
+        # Open the file once; every extractor below works off this document.
+        # When sections are wanted, long PDFs stop being read once all of
+        # them have been passed.
+        should_stop = SectionTracker().feed if "extract_sections" in plan else None
+        with stage("extract_text"):
+            document = load_document(source, file_name, should_stop=should_stop)
+        if not document or not document.text:
             return {"error": "No readable text found"}
-            
-        text = clean_text(text)
-        
-        # Parse all sections
-        parsed_data = {
-            "email": extract_email(text),
-            "phone": extract_phone(text),
-            "linkedin": social_links.get('linkedin', 'Not Found'),
-            "github": social_links.get('github', 'Not Found'),
-            "skills": extract_skills(text),
-            "work_experience": extract_work_experience(text),
-            "education": extract_education(text),
-            "summary": generate_resume_summary(text),
-            "text": text
-        }
-        
+
+        if debug:
+            debug_social_links(document)
+
+        text = clean_text(document.text)
+        # truncated tells callers that a page or text budget (or the early
+        # stop after the last section) left part of the document unread
+        parsed_data = {"text": text, "truncated": document.truncated, "summary": SUMMARY_NOT_AVAILABLE}
+        for update in _run_extractors(plan, document, text, summarizer).values():
+            parsed_data.update(update)
+
+        parsed_data = {field: parsed_data[field] for field in FIELDS if field in fields}
+        if cache and _cacheable(summarize, summarizer, fields):
+            cache_put(cache, cache_key, parsed_data)
         return parsed_data
         
     except Exception as e:
+        logger.exception("Error parsing resume")
         return {"error": f"Error parsing resume: {str(e)}"}
 
+def parse_resumes(file_paths: List[str], summarizer: Optional[str] = None) -> List[Dict[str, str]]:
+    """Parse several resumes, summarizing all of them in shared model batches"""
+    cache = get_parse_cache()
+    cache_keys: List[Optional[str]] = [None] * len(file_paths)
+    results: List[Optional[Dict[str, str]]] = [None] * len(file_paths)
+    if cache:
+        for i, path in enumerate(file_paths):
+            try:
+                cache_keys[i] = _cache_key(content_digest(path), True, summarizer)
+            except OSError:
+                continue
+            results[i] = cache_get(cache, cache_keys[i])
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    for i in missing:
+        results[i] = parse_resume(file_paths[i], summarize=False, use_cache=False)
+
+    parsed = [i for i in missing if "error" not in results[i]]
+    with stage("summarize"):
+        summaries = summarize_texts(
+            [results[i]["text"] for i in parsed],
+            [{name: results[i][name] for name in SUMMARY_SECTIONS} for i in parsed],
+            backend=summarizer,
+        )
+    cacheable = _cacheable(True, summarizer)
+    for i, summary in zip(parsed, summaries):
+        results[i]["summary"] = summary
+        if cache and cache_keys[i] and cacheable:
+            cache_put(cache, cache_keys[i], results[i])
+    return results
+
 # Example usage
 if __name__ == "__main__":
-    result = parse_resume("sample_resume.pdf")
+    result = parse_resume("sample_resume.pdf", debug=True)
     print(json.dumps(result, indent=2))
\ No newline at end of file
@@ -0,0 +1,195 @@
+import re
+import statistics
+from typing import Dict, Iterable, List, Optional, Union
+
+from fuzzywuzzy import fuzz
+
+from backend.document import TextLine
+
+# Section Keywords
+WORK_KEYWORDS = [
+    "work experience", "professional experience", "employment history",
+    "work history", "experience", "career", "employment",
+    "professional background", "positions held", "jobs"
+]
+
+EDUCATION_KEYWORDS = [
+    "education", "academic background", "qualifications",
+    "degrees", "university", "college", "schooling",
+    "academics", "educational qualifications", "studies"
+]
+
+PROJECT_KEYWORDS = [
+    "projects", "personal projects", "academic projects", "key projects",
+    "project experience", "project work"
+]
+
+CERTIFICATION_KEYWORDS = [
+    "certifications", "certificates", "licenses", "licenses and certifications",
+    "courses", "training", "online courses"
+]
+
+SKILL_SECTION_KEYWORDS = [
+    "skills", "technical skills", "key skills", "core competencies",
+    "technologies", "tools", "skills and tools", "technical proficiency"
+]
+
+# Headers that end a section but are not returned themselves
+OTHER_KEYWORDS = [
+    "summary", "profile", "objective", "career objective", "about me",
+    "achievements", "awards", "honors", "publications", "interests", "hobbies",
+    "languages", "references", "contact", "extracurricular activities",
+    "volunteering", "leadership", "positions of responsibility"
+]
+
+SECTION_KEYWORDS = {
+    "work_experience": WORK_KEYWORDS,
+    "education": EDUCATION_KEYWORDS,
+    "projects": PROJECT_KEYWORDS,
+    "certifications": CERTIFICATION_KEYWORDS,
+    "skills": SKILL_SECTION_KEYWORDS,
+    "other": OTHER_KEYWORDS,
+}
+
+# Words that may surround a keyword in a header ("Relevant Work Experience")
+_HEADER_FILLER = {
+    "and", "my", "of", "relevant", "key", "technical", "professional", "academic",
+    "personal", "other", "selected", "details", "summary", "history", "additional",
+}
+
+MAX_HEADER_WORDS = 5
+MAX_HEADER_CHARS = 60
+FUZZY_HEADER_THRESHOLD = 85
+
+# A line this much larger than the body text is treated as header-styled
+HEADER_FONT_RATIO = 1.15
+
+def clean_line(line: str) -> str:
+    """Strip PDF artifacts and collapse whitespace within a single line"""
+    return " ".join(re.sub(r"\(cid:\d+\)", "", line).split())
+
+def _normalize(line: str) -> str:
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", line.lower()).split())
+
+def _build_header_index():
+    lookup: Dict[str, str] = {}
+    token_index: Dict[str, List[str]] = {}
+    for section, keywords in SECTION_KEYWORDS.items():
+        for keyword in keywords:
+            normalized = _normalize(keyword)
+            lookup.setdefault(normalized, section)
+            for token in normalized.split():
+                token_index.setdefault(token, []).append(normalized)
+    return lookup, token_index
+
+# Precomputed once: exact header lookup, and a token index for candidates
+_HEADER_LOOKUP, _TOKEN_INDEX = _build_header_index()
+
+def _looks_like_header(line: str) -> bool:
+    """Cheap shape filter run before any keyword or fuzzy comparison"""
+    if len(line) > MAX_HEADER_CHARS or len(line.split()) > MAX_HEADER_WORDS:
+        return False
+    if "@" in line or "http" in line.lower() or sum(c.isdigit() for c in line) > 2:
+        return False
+    return not line.endswith((".", ",", ";"))
+
+def classify_header(line: str, emphasized: bool = False) -> Optional[str]:
+    """Return the section a line introduces, or None for ordinary content.
+
+    emphasized marks lines rendered larger or bold than the body text; they
+    get fuzzy matching for misspelt headers like Title/UPPER case lines do.
+    """
+    line = line.strip()
+    if not line or not _looks_like_header(line):
+        return None
+
+    normalized = _normalize(line)
+    if not normalized:
+        return None
+    if normalized in _HEADER_LOOKUP:
+        return _HEADER_LOOKUP[normalized]
+
+    # A keyword plus only filler words ("Relevant Work Experience:")
+    tokens = normalized.split()
+    token_set = set(tokens)
+    candidates = {kw for token in tokens for kw in _TOKEN_INDEX.get(token, ())}
+    for keyword in sorted(candidates, key=len, reverse=True):
+        keyword_tokens = set(keyword.split())
+        if keyword_tokens <= token_set and token_set - keyword_tokens <= _HEADER_FILLER:
+            return _HEADER_LOOKUP[keyword]
+
+    # Misspelt headers are only considered when the line is styled like one
+    stripped = line.rstrip(":")
+    if emphasized or line.endswith(":") or stripped.isupper() or stripped.istitle():
+        best_score, best_keyword = 0, None
+        for keyword in _HEADER_LOOKUP:
+            score = fuzz.ratio(normalized, keyword)
+            if score > best_score:
+                best_score, best_keyword = score, keyword
+        if best_keyword and best_score >= FUZZY_HEADER_THRESHOLD:
+            return _HEADER_LOOKUP[best_keyword]
+
+    return None
+
+class SectionTracker:
+    """Follows headers as lines stream in, to tell when the wanted sections are complete.
+
+    A section is complete once another header follows it. Used to stop
+    reading long PDFs early; no font statistics are available mid-stream,
+    so only bold lines count as emphasized.
+    """
+
+    def __init__(self, wanted: Iterable[str] = ()):
+        self.pending = set(wanted or (s for s in SECTION_KEYWORDS if s != "other"))
+        self.current: Optional[str] = None
+
+    def feed(self, lines: Iterable[Union[str, TextLine]]) -> bool:
+        """Consume more lines; True once every wanted section is complete"""
+        for line in lines:
+            if not isinstance(line, TextLine):
+                line = TextLine(line, 1)
+            text = clean_line(line.text)
+            section = classify_header(text, line.bold) if text else None
+            if section:
+                if self.current:
+                    self.pending.discard(self.current)
+                self.current = section
+        return not self.pending
+
+def _body_font_size(lines: List[TextLine]) -> Optional[float]:
+    sizes = [line.font_size for line in lines if line.font_size]
+    return statistics.median(sizes) if sizes else None
+
+def segment_sections(lines: Union[str, Iterable[Union[str, TextLine]]]) -> Dict[str, str]:
+    """Split a resume into sections in one pass, classifying each line once.
+
+    Accepts raw text, plain line strings or TextLine objects; with TextLines
+    the font size and weight of a line help recognise headers.
+    """
+    if isinstance(lines, str):
+        lines = lines.split("\n")
+    lines = [line if isinstance(line, TextLine) else TextLine(line, 1) for line in lines]
+    body_size = _body_font_size(lines)
+
+    collected: Dict[str, List[str]] = {section: [] for section in SECTION_KEYWORDS}
+    current = None
+    for line in lines:
+        text = clean_line(line.text)
+        if not text:
+            continue
+
+        emphasized = line.bold or bool(
+            body_size and line.font_size and line.font_size >= body_size * HEADER_FONT_RATIO
+        )
+        section = classify_header(text, emphasized)
+        if section:
+            current = section
+            continue
+        if current:
+            collected[current].append(text)
+
+    return {
+        section: "\n".join(section_lines) if section_lines else "No Data"
+        for section, section_lines in collected.items()
+        if section != "other"
+    }
@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from backend.skills import canonical_skill
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+_INITIAL_CAPACITY = 16
+
+def _canonical(skills: Iterable[str]) -> Set[str]:
+    return {canonical_skill(skill) or skill for skill in skills}
+
+class SkillIndex:
+    """Inverted index from canonical skill to the sorted ids of resumes having it.
+
+    Each posting list is an int32 buffer that doubles when full, so adding a
+    resume is amortized O(1) per skill and queries get zero-copy views. Ids
+    are expected in increasing order (as resume index row ids are); an
+    out-of-order id marks the list for one re-sort on its next query.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._sizes: Dict[str, int] = {}
+        self._unsorted: Set[str] = set()
+
+    def add(self, resume_id: int, skills: Iterable[str]):
+        """Record the skills of one resume (names or aliases, any case)"""
+        for skill in _canonical(skills):
+            buffer = self._buffers.get(skill)
+            size = self._sizes.get(skill, 0)
+            if buffer is None or size == len(buffer):
+                # Grow into a new buffer; views handed out earlier stay valid
+                grown = np.empty(max(_INITIAL_CAPACITY, 2 * size), dtype=np.int32)
+                if size:
+                    grown[:size] = buffer[:size]
+                self._buffers[skill] = buffer = grown
+            if size and buffer[size - 1] >= resume_id:
+                self._unsorted.add(skill)
+            buffer[size] = resume_id
+            self._sizes[skill] = size + 1
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def skills(self) -> List[str]:
+        return sorted(self._buffers)
+
+    def postings(self, skill: str) -> np.ndarray:
+        """Sorted ids of resumes with a skill (name or alias, any case)"""
+        skill = canonical_skill(skill) or skill
+        if skill not in self._buffers:
+            return _EMPTY
+        if skill in self._unsorted:
+            ids = np.unique(self._buffers[skill][:self._sizes[skill]])
+            self._buffers[skill], self._sizes[skill] = ids, len(ids)
+            self._unsorted.discard(skill)
+        return self._buffers[skill][:self._sizes[skill]]
+
+    def all_of(self, skills: Iterable[str]) -> np.ndarray:
+        """Resumes having every one of the skills"""
+        lists = sorted((self.postings(skill) for skill in _canonical(skills)), key=len)
+        if not lists:
+            return _EMPTY
+        # Intersect from the rarest skill so intermediate results stay small
+        result = lists[0]
+        for postings in lists[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, postings, assume_unique=True)
+        return result
+
+    def any_of(self, skills: Iterable[str]) -> np.ndarray:
+        """Resumes having at least one of the skills"""
+        return self.at_least(skills, 1)
+
+    def at_least(self, skills: Iterable[str], k: int) -> np.ndarray:
+        """Resumes having k or more of the skills"""
+        lists = [self.postings(skill) for skill in _canonical(skills)]
+        lists = [postings for postings in lists if len(postings)]
+        if not lists or k > len(lists):
+            return _EMPTY
+        if len(lists) == 1:
+            return lists[0]
+        # Counting ids is linear, unlike sorting the concatenated lists
+        counts = np.bincount(np.concatenate(lists))
+        return np.flatnonzero(counts >= max(k, 1)).astype(np.int32)
+
+    def query(self, skills: Iterable[str], min_count: Optional[int] = None) -> np.ndarray:
+        """all_of when min_count is None, otherwise at_least(min_count)"""
+        return self.all_of(skills) if min_count is None else self.at_least(skills, min_count)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.config import BASE_DIR, CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_PATH = os.environ.get(
+    "RESUAI_SKILL_TAXONOMY", os.path.join(BASE_DIR, "data", "skills_taxonomy.json")
+)
+INDEX_CACHE_DIR = os.path.join(CACHE_DIR, "skills")
+
+# Bump when the SkillMatcher layout changes so stale pickles are ignored
+INDEX_FORMAT = 1
+
+# How often (seconds) workers check the taxonomy file for changes
+RELOAD_CHECK_SECONDS = float(os.environ.get("RESUAI_TAXONOMY_CHECK_SECONDS", "30"))
+
+# A token is a run of word characters that may carry "+"/"#" (C++, C#) and
+# inner "."/"-" (Node.js, Scikit-learn); trailing punctuation is not included.
+_TOKEN_RE = re.compile(r"\w(?:[\w+#]|[.\-](?=\w))*")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase skill-matching tokens of a text"""
+    return _TOKEN_RE.findall(text.lower())
+
+class SkillMatcher:
+    """Finds every skill and alias in a text with one scan over its tokens.
+
+    Phrases are indexed by their first token, so each text token costs one
+    dict lookup no matter how large the taxonomy is; only phrases starting
+    with that token are compared, longest first.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        phrases: Dict[Tuple[str, ...], Set[str]] = {}
+        for skill in skills:
+            phrases.setdefault(tuple(tokenize(skill)), set()).add(skill)
+        for alias, skill in (aliases or {}).items():
+            phrases.setdefault(tuple(tokenize(alias)), set()).add(skill)
+
+        self._index: Dict[str, List[Tuple[Tuple[str, ...], Tuple[str, ...]]]] = {}
+        for tokens, canonical in phrases.items():
+            if tokens:
+                self._index.setdefault(tokens[0], []).append((tokens, tuple(sorted(canonical))))
+        for candidates in self._index.values():
+            candidates.sort(key=lambda c: len(c[0]), reverse=True)
+
+    def find(self, text: str) -> Set[str]:
+        """Return the canonical names of all skills mentioned in the text"""
+        found = set()
+        tokens = tokenize(text)
+        index = self._index
+        for i, token in enumerate(tokens):
+            candidates = index.get(token)
+            if not candidates:
+                continue
+            for phrase, canonical in candidates:
+                if len(phrase) == 1 or tuple(tokens[i:i + len(phrase)]) == phrase:
+                    found.update(canonical)
+        return found
+
+class SkillTaxonomy:
+    """A versioned skill taxonomy together with its compiled matcher"""
+
+    def __init__(self, version: str, skills: List[Dict], digest: str):
+        self.version = version
+        self.digest = digest
+        self.names = {skill["name"] for skill in skills}
+        self.categories = {skill["name"]: skill.get("category", "") for skill in skills}
+        self.aliases = {
+            alias: skill["name"] for skill in skills for alias in skill.get("aliases", [])
+        }
+        # Case-insensitive name or alias -> canonical name
+        self.lookup = {alias.lower(): name for alias, name in self.aliases.items()}
+        self.lookup.update((name.lower(), name) for name in self.names)
+        self.matcher = _build_or_load_matcher(self)
+
+def _build_or_load_matcher(taxonomy: SkillTaxonomy) -> SkillMatcher:
+    """Load the compiled index for this exact taxonomy, building it if needed"""
+    index_name = f"skills-{taxonomy.version}-{taxonomy.digest[:16]}-v{INDEX_FORMAT}.pkl"
+    index_path = os.path.join(INDEX_CACHE_DIR, index_name)
+    try:
+        with open(index_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    matcher = SkillMatcher(taxonomy.names, taxonomy.aliases)
+    try:
+        os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+        # Write then rename so concurrent workers never read a partial file
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.warning("Could not cache skill index: %s", e)
+    return matcher
+
+def load_taxonomy(path: str = TAXONOMY_PATH) -> SkillTaxonomy:
+    """Read a taxonomy file and return it with its (cached) compiled index"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+    digest = hashlib.sha256(raw).hexdigest()
+    return SkillTaxonomy(str(data.get("version", "0")), data["skills"], digest)
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_path = TAXONOMY_PATH
+_taxonomy_mtime = 0.0
+_last_check = 0.0
+_taxonomy_lock = threading.Lock()
+
+def reload_taxonomy(path: str = TAXONOMY_PATH) -> SkillTaxonomy:
+    """Swap in a freshly loaded taxonomy; in-flight lookups keep the old one"""
+    global _taxonomy, _taxonomy_path, _taxonomy_mtime, _last_check
+    with _taxonomy_lock:
+        mtime = os.path.getmtime(path)
+        _taxonomy = load_taxonomy(path)
+        _taxonomy_path = path
+        _taxonomy_mtime = mtime
+        _last_check = time.monotonic()
+        return _taxonomy
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Current taxonomy, reloaded automatically when the data file changes"""
+    global _last_check
+    if _taxonomy is None:
+        return reload_taxonomy(_taxonomy_path)
+
+    now = time.monotonic()
+    if now - _last_check >= RELOAD_CHECK_SECONDS:
+        _last_check = now
+        try:
+            if os.path.getmtime(_taxonomy_path) != _taxonomy_mtime:
+                return reload_taxonomy(_taxonomy_path)
+        except OSError:
+            pass
+    return _taxonomy
+
+def skill_names() -> Set[str]:
+    """Canonical skill names of the current taxonomy"""
+    return set(get_taxonomy().names)
+
+def canonical_skill(name: str) -> Optional[str]:
+    """Canonical name for a skill name or alias in any case, None if unknown"""
+    return get_taxonomy().lookup.get(name.strip().lower())
+
+def find_skills(text: str) -> Set[str]:
+    """Canonical skills mentioned in a text"""
+    return get_taxonomy().matcher.find(text)
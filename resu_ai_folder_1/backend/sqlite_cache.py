@@ -0,0 +1,130 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Puts between recounts of the table; other processes (batch workers) write
+# to the same file, so the running totals of one process drift
+RECOUNT_EVERY = 1000
+# Eviction trims to this fraction of the limits, so a full cache does not
+# evict (and recount) again on the very next put
+EVICT_TO = 0.9
+
+class SQLiteLRU:
+    """One SQLite table of blobs keyed by hash, with least-recently-used eviction.
+
+    Subclasses set the table name, any extra columns and the blob column;
+    rows are (key, *extra, blob, last_access). Entry count and blob bytes
+    are kept as running totals, so a put does not scan the table; it is
+    only recounted every RECOUNT_EVERY puts or once a limit is crossed.
+    """
+    table = ""
+    extra_columns = ""
+    value_column = "value"
+    index_name = ""
+    label = "Cache"
+
+    _shared: Optional["SQLiteLRU"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str, max_entries: int, max_bytes: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, {self.extra_columns}"
+            f"{self.value_column} BLOB NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self.index_name} ON {self.table}(last_access)")
+        self._conn.commit()
+        self._count, self._bytes = self._totals()
+        self._puts = 0
+
+    @classmethod
+    def shared(cls) -> Optional["SQLiteLRU"]:
+        """Process-wide instance at the default path, or None when it cannot be opened"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    try:
+                        cls._shared = cls()
+                    except (sqlite3.Error, OSError) as e:
+                        # e.g. a read-only cache folder: callers work without the cache
+                        logger.warning("%s unavailable: %s", cls.label, e)
+                        return None
+        return cls._shared
+
+    def _totals(self) -> Tuple[int, int]:
+        return self._conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH({self.value_column})), 0) FROM {self.table}"
+        ).fetchone()
+
+    def _select(self, columns: str, keys: List[str], touch: bool = True) -> List[tuple]:
+        """Rows of the given keys, marked as used unless touch is False; call with the lock held"""
+        rows = []
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found = self._conn.execute(
+                f"SELECT key, {columns} FROM {self.table} WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            if found and touch:
+                now = time.time()
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET last_access = ? WHERE key = ?", [(now, row[0]) for row in found]
+                )
+            rows.extend(found)
+        if touch:
+            self._conn.commit()
+        return rows
+
+    def _put_rows(self, rows: List[tuple]):
+        """Insert or replace rows, then evict the least recently used if over a limit"""
+        with self._lock:
+            replaced = self._select(f"LENGTH({self.value_column})", [row[0] for row in rows], touch=False)
+            placeholders = ",".join("?" * len(rows[0]))
+            self._conn.executemany(f"INSERT OR REPLACE INTO {self.table} VALUES ({placeholders})", rows)
+            self._count += len(rows) - len(replaced)
+            self._bytes += sum(len(row[-2]) for row in rows) - sum(size for _, size in replaced)
+
+            self._puts += 1
+            over = self._count > self.max_entries or self._bytes > self.max_bytes
+            if over or self._puts % RECOUNT_EVERY == 0:
+                self._count, self._bytes = self._totals()
+            if self._count > self.max_entries or self._bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        excess = self._count - int(self.max_entries * EVICT_TO)
+        if self._bytes > self.max_bytes * EVICT_TO and self._count:
+            bytes_per_entry = self._bytes / self._count
+            excess = max(excess, int((self._bytes - self.max_bytes * EVICT_TO) / bytes_per_entry) + 1)
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN "
+            f"(SELECT key FROM {self.table} ORDER BY last_access LIMIT ?)", (excess,)
+        )
+        self._count, self._bytes = self._totals()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, total_bytes = self._totals()
+        return {"entries": count, "bytes": total_bytes}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+            self._count, self._bytes = 0, 0
@@ -0,0 +1,103 @@
+import contextvars
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from backend.instrumentation import stage
+
+# Threads shared by every parse in the process for running independent
+# stages of one document side by side; 1 runs stages inline, in order
+STAGE_THREADS = int(os.environ.get("RESUAI_STAGE_THREADS", str(min(4, os.cpu_count() or 1))))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_stage_executor() -> Optional[ThreadPoolExecutor]:
+    """Process-wide stage thread pool, or None when stages run inline"""
+    global _executor
+    if STAGE_THREADS <= 1:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=STAGE_THREADS, thread_name_prefix="resume-stage")
+    return _executor
+
+def set_stage_threads(threads: int):
+    """Resize the shared pool, e.g. to 1 in batch workers that already run one process per core"""
+    global STAGE_THREADS, _executor
+    with _executor_lock:
+        STAGE_THREADS = threads
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+def run_stages(stages: Mapping[str, Callable[[], Any]],
+               dependencies: Mapping[str, Iterable[str]]) -> Dict[str, Any]:
+    """Run stages as soon as the ones they depend on have finished; returns their results.
+
+    stages maps a stage name to a zero-argument function and dependencies a
+    name to the stages it needs (names outside stages count as done). Each
+    stage is timed under its name; the calling thread runs stages too. The
+    first exception raised by a stage is re-raised once the stages already
+    started have finished.
+    """
+    waiting = {name: {dep for dep in dependencies.get(name, ()) if dep in stages} for name in stages}
+    results: Dict[str, Any] = {}
+
+    executor = get_stage_executor()
+    if executor is None:
+        # Dependency order is insertion order for acyclic plans built from it
+        while waiting:
+            name = next(name for name, deps in waiting.items() if deps <= results.keys())
+            del waiting[name]
+            with stage(name):
+                results[name] = stages[name]()
+        return results
+
+    def timed(name):
+        with stage(name):
+            return stages[name]()
+
+    running: Dict[Future, str] = {}
+    error: Optional[BaseException] = None
+
+    def run_here(name):
+        nonlocal error
+        try:
+            results[name] = timed(name)
+        except BaseException as e:
+            error = error or e
+
+    while waiting or running:
+        ready = [name for name, deps in waiting.items() if deps <= results.keys()] if error is None else []
+        for name in ready:
+            del waiting[name]
+        # All but one ready stage go to the pool; the caller runs the last
+        # itself rather than sitting idle
+        for name in ready[1:]:
+            # A context copy per task keeps collect_timings() working in pool threads
+            running[executor.submit(contextvars.copy_context().run, timed, name)] = name
+        if ready:
+            run_here(ready[0])
+            done = [future for future in running if future.done()]
+        else:
+            # Take back a stage no pool thread has started yet, so callers
+            # that are themselves pool tasks can never deadlock the pool
+            stolen = next((future for future in running if future.cancel()), None)
+            if stolen is not None:
+                run_here(running.pop(stolen))
+                continue
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            try:
+                results[name] = future.result()
+            except BaseException as e:
+                error = error or e
+    if error is not None:
+        raise error
+    return results
@@ -0,0 +1,236 @@
+import logging
+import os
+import re
+from typing import Dict, List, Optional
+
+from backend.models import get_model, inference_slot
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_NOT_AVAILABLE = "Summary not available"
+
+# Deployment-wide default backend; callers may still pick one per request
+DEFAULT_SUMMARIZER = os.environ.get("RESUAI_SUMMARIZER", "bart")
+
+# Extractive summaries keep this many of the most central sentences
+EXTRACTIVE_SENTENCES = 3
+MIN_SENTENCE_WORDS = 5
+
+# BART-large-CNN accepts 1024 tokens; leave room for special tokens
+MAX_CHUNK_TOKENS = 900
+# Chunks shorter than this are passed through instead of being summarized
+MIN_SUMMARIZE_TOKENS = 60
+SUMMARY_MAX_LENGTH = 100
+SUMMARY_MIN_LENGTH = 30
+BATCH_SIZE = 8
+# Reduce passes over the joined chunk summaries before they are kept as they are
+MAX_REDUCE_ROUNDS = 4
+
+SECTION_TITLES = {
+    "work_experience": "Work experience",
+    "education": "Education",
+    "projects": "Projects",
+    "certifications": "Certifications",
+    "skills": "Skills",
+}
+
+def strip_contact_details(text: str) -> str:
+    """Remove emails and phone numbers before summarization"""
+    text = re.sub(r"\S+@\S+", "", text)  # Remove emails
+    text = re.sub(r"\(?\+?\d{1,3}[-.\s]?\d{2,4}[-.\s]?\d{2,4}[-.\s]?\d{4}\)?", "", text)  # Remove phones
+    return text
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences and bullet points of a resume text"""
+    # PDF lines wrap mid-sentence; only a bullet starts a new item
+    text = re.sub(r"\s*\n(?!\s*•)\s*", " ", text)
+    return [s for s in re.split(r"(?<=[.!?])\s+|\s*•\s*", text) if s.strip()]
+
+def _split_units(text: str, sections: Optional[Dict[str, str]]) -> List[str]:
+    """Pieces of a resume that chunking never splits unless they are too long"""
+    if sections:
+        units = [
+            f"{SECTION_TITLES.get(name, name)}: {content}"
+            for name, content in sections.items()
+            if content and content != "No Data"
+        ]
+        if units:
+            return units
+    return split_sentences(text)
+
+def chunk_text(text: str, tokenizer, sections: Optional[Dict[str, str]] = None,
+               max_tokens: int = MAX_CHUNK_TOKENS) -> List[str]:
+    """Pack sections (or sentences) greedily into chunks of at most max_tokens"""
+    units = _split_units(strip_contact_details(text), sections)
+    if not units:
+        return []
+
+    token_ids = tokenizer(units, add_special_tokens=False)["input_ids"]
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for unit, ids in zip(units, token_ids):
+        if len(ids) > max_tokens:
+            # A single oversized unit is cut into token windows of its own
+            if current:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            for start in range(0, len(ids), max_tokens):
+                chunks.append(tokenizer.decode(ids[start:start + max_tokens], skip_special_tokens=True))
+            continue
+        if current_tokens + len(ids) > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += len(ids)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+def _summarize_chunks(summarizer, chunks: List[str], batch_size: int) -> List[str]:
+    """Run every chunk of every resume through the model in shared batches"""
+    if not chunks:
+        return []
+    lengths = [len(ids) for ids in summarizer.tokenizer(chunks, add_special_tokens=False)["input_ids"]]
+    results = list(chunks)
+    to_run = [i for i, n in enumerate(lengths) if n >= MIN_SUMMARIZE_TOKENS]
+    if to_run:
+        with inference_slot():
+            outputs = summarizer(
+                [chunks[i] for i in to_run],
+                max_length=SUMMARY_MAX_LENGTH, min_length=SUMMARY_MIN_LENGTH,
+                do_sample=False, truncation=True, batch_size=batch_size,
+            )
+        for i, output in zip(to_run, outputs):
+            results[i] = output["summary_text"]
+    return results
+
+class Summarizer:
+    """A summarization backend; subclasses implement summarize_batch"""
+    name = ""
+    # Model registry entry the backend needs, if any
+    model_name: Optional[str] = None
+
+    def is_available(self) -> bool:
+        return True
+
+    def summarize_batch(self, texts: List[str], sections: List[Optional[Dict[str, str]]],
+                        batch_size: int = BATCH_SIZE) -> List[str]:
+        raise NotImplementedError
+
+class ExtractiveSummarizer(Summarizer):
+    """Picks the most central sentences by TF-IDF similarity; no model needed"""
+    name = "extractive"
+
+    def _summarize(self, text: str, sections: Optional[Dict[str, str]]) -> str:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        sentences = [
+            sentence.strip()
+            for unit in _split_units(strip_contact_details(text), sections)
+            for sentence in split_sentences(unit)
+            if len(sentence.split()) >= MIN_SENTENCE_WORDS
+        ]
+        if not sentences:
+            return SUMMARY_NOT_AVAILABLE
+        if len(sentences) <= EXTRACTIVE_SENTENCES:
+            return " ".join(sentences)
+
+        try:
+            vectors = TfidfVectorizer(stop_words="english").fit_transform(sentences)
+        except ValueError:
+            # Only stop words left; nothing meaningful to rank
+            return " ".join(sentences[:EXTRACTIVE_SENTENCES])
+        # Rows are L2-normalized, so X.X^T holds cosine similarities and a
+        # row sum is the sentence's degree centrality within the resume
+        centrality = (vectors @ vectors.T).sum(axis=1).A1
+        top = sorted(sorted(range(len(sentences)), key=lambda i: -centrality[i])[:EXTRACTIVE_SENTENCES])
+        return " ".join(sentences[i] for i in top)
+
+    def summarize_batch(self, texts, sections, batch_size=BATCH_SIZE):
+        return [self._summarize(text or "", text_sections) for text, text_sections in zip(texts, sections)]
+
+class AbstractiveSummarizer(Summarizer):
+    """Chunked map-reduce over a Hugging Face summarization pipeline"""
+
+    def __init__(self, name: str, model_name: str):
+        self.name = name
+        self.model_name = model_name
+
+    def is_available(self) -> bool:
+        return get_model(self.model_name) is not None
+
+    def summarize_batch(self, texts, sections, batch_size=BATCH_SIZE):
+        """Map: every resume is split into token-bounded chunks (by section
+        when sections are given) and all chunks of all resumes are
+        summarized in batches. Reduce: each resume's chunk summaries are
+        joined and summarized again until one summary per resume remains,
+        for at most MAX_REDUCE_ROUNDS rounds.
+        """
+        summarizer = get_model(self.model_name)
+        final: List[str] = [SUMMARY_NOT_AVAILABLE] * len(texts)
+        pending = {}
+        for i, (text, text_sections) in enumerate(zip(texts, sections)):
+            chunks = chunk_text(text or "", summarizer.tokenizer, text_sections)
+            if chunks:
+                pending[i] = chunks
+
+        for reduce_round in range(MAX_REDUCE_ROUNDS + 1):
+            if not pending:
+                break
+            items = list(pending.items())
+            flat = [chunk for _, chunks in items for chunk in chunks]
+            summaries = iter(_summarize_chunks(summarizer, flat, batch_size))
+            next_pending = {}
+            for i, chunks in items:
+                chunk_summaries = [next(summaries) for _ in chunks]
+                if len(chunk_summaries) == 1 or reduce_round == MAX_REDUCE_ROUNDS:
+                    final[i] = " ".join(chunk_summaries).strip() or SUMMARY_NOT_AVAILABLE
+                    continue
+                # Reduce: the joined partial summaries go round again. Blank
+                # summaries leave nothing to chunk; the resume keeps
+                # SUMMARY_NOT_AVAILABLE
+                chunks = chunk_text(" ".join(chunk_summaries), summarizer.tokenizer)
+                if chunks:
+                    next_pending[i] = chunks
+            pending = next_pending
+        return final
+
+SUMMARIZERS: Dict[str, Summarizer] = {
+    "extractive": ExtractiveSummarizer(),
+    "distilbart": AbstractiveSummarizer("distilbart", "distilled_summarizer"),
+    "bart": AbstractiveSummarizer("bart", "summarizer"),
+}
+
+def get_summarizer(name: Optional[str] = None) -> Summarizer:
+    """Backend by name (default: RESUAI_SUMMARIZER), falling back to extractive.
+
+    A model that is disabled or fails to load is reported once by the model
+    registry; summaries then come from the extractive backend instead of
+    silently being "not available".
+    """
+    name = name or DEFAULT_SUMMARIZER
+    if name not in SUMMARIZERS:
+        raise ValueError(f"Unknown summarizer '{name}', expected one of {sorted(SUMMARIZERS)}")
+    summarizer = SUMMARIZERS[name]
+    return summarizer if summarizer.is_available() else SUMMARIZERS["extractive"]
+
+def summary_backend(name: Optional[str] = None) -> str:
+    """Name of the backend that actually summarizes when name is requested"""
+    return get_summarizer(name).name
+
+def summarize_texts(texts: List[str], sections: Optional[List[Optional[Dict[str, str]]]] = None,
+                    batch_size: int = BATCH_SIZE, backend: Optional[str] = None) -> List[str]:
+    """Summarize whole resumes with the selected backend, in batches"""
+    sections = sections or [None] * len(texts)
+    summarizer = get_summarizer(backend)
+    try:
+        return summarizer.summarize_batch(texts, sections, batch_size)
+    except Exception as e:
+        logger.error("Summary generation error (%s): %s", summarizer.name, e)
+        return [SUMMARY_NOT_AVAILABLE] * len(texts)
+
+def summarize_text(text: str, sections: Optional[Dict[str, str]] = None,
+                   backend: Optional[str] = None) -> str:
+    """Summarize a single resume"""
+    return summarize_texts([text], [sections], backend=backend)[0]
@@ -0,0 +1,287 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.config import CACHE_DIR
+from backend.skill_index import SkillIndex
+
+INDEX_DIR = os.environ.get("RESUAI_INDEX_DIR", os.path.join(CACHE_DIR, "resume_index"))
+INDEX_FORMAT = 1
+
+# IVF: rows are bucketed by their nearest centroid and a query only scans
+# the nprobe buckets closest to it. Small indexes are scanned exactly.
+MIN_TRAIN_SIZE = 2048
+# Buckets are re-learned once the index has grown this much since training
+RETRAIN_GROWTH = 4
+DEFAULT_NPROBE = 32
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+# Rows scored per step, so exact scans never copy the whole memmap at once
+SCAN_CHUNK = 16384
+
+HEADER_FILE = "header.json"
+VECTORS_FILE = "vectors.f32"
+LISTS_FILE = "lists.i32"
+CENTROIDS_FILE = "centroids.npy"
+META_FILE = "meta.jsonl"
+
+def default_nlist(count: int) -> int:
+    """Number of IVF buckets for an index of count rows (about sqrt(count))"""
+    return int(min(4096, max(16, np.sqrt(count))))
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+def _top_k(ids: np.ndarray, scores: np.ndarray, k: int):
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        ids, scores = ids[keep], scores[keep]
+    order = np.argsort(-scores, kind="stable")
+    return ids[order], scores[order]
+
+def train_centroids(sample: np.ndarray, nlist: int, iterations: int = KMEANS_ITERATIONS,
+                    seed: int = 0) -> np.ndarray:
+    """Spherical k-means: unit-length centroids maximizing cosine to their rows"""
+    from scipy.sparse import csr_matrix
+
+    rng = np.random.default_rng(seed)
+    nlist = min(nlist, len(sample))
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        # One sparse product sums the rows of every bucket at once
+        membership = csr_matrix(
+            (np.ones(len(sample), dtype=np.float32), (labels, np.arange(len(sample)))),
+            shape=(nlist, len(sample)),
+        )
+        sums = np.asarray(membership @ sample)
+        empty = np.bincount(labels, minlength=nlist) == 0
+        if empty.any():
+            # Re-seed empty buckets with random rows
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize(sums).astype(np.float32)
+    return centroids
+
+class ResumeIndex:
+    """Approximate nearest-neighbour index of resume embeddings on disk.
+
+    Rows are unit-length float32 vectors appended to vectors.f32 and read
+    through a memory map, so the index does not need to fit in RAM. Once it
+    holds MIN_TRAIN_SIZE rows it is split into IVF buckets by k-means and
+    queries scan only the closest buckets. Adding a key that is already in
+    the index supersedes its older row. One process should write at a time.
+    """
+
+    def __init__(self, path: str = INDEX_DIR):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+        header = {}
+        if os.path.exists(self._file(HEADER_FILE)):
+            with open(self._file(HEADER_FILE), encoding="utf-8") as f:
+                header = json.load(f)
+            if header.get("format") != INDEX_FORMAT:
+                raise ValueError(f"Unsupported index format in {path}: {header.get('format')}")
+        self.dim: Optional[int] = header.get("dim")
+        self.count: int = header.get("count", 0)
+        self.trained_count: int = header.get("trained_count", 0)
+        self.centroids: Optional[np.ndarray] = (
+            np.load(self._file(CENTROIDS_FILE)) if self.trained_count else None
+        )
+
+        self.meta: List[Dict] = []
+        if self.count:
+            meta_bytes = 0
+            with open(self._file(META_FILE), "rb") as f:
+                for line in f:
+                    if len(self.meta) == self.count:
+                        break
+                    self.meta.append(json.loads(line))
+                    meta_bytes += len(line)
+            # Drop anything a crashed writer appended after the last header update
+            self._truncate(VECTORS_FILE, self.count * self.dim * 4)
+            self._truncate(LISTS_FILE, self.count * 4)
+            self._truncate(META_FILE, meta_bytes)
+        self._reload()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _truncate(self, name: str, size: int):
+        path = self._file(name)
+        if os.path.getsize(path) > size:
+            os.truncate(path, size)
+
+    def _write_header(self):
+        header = {
+            "format": INDEX_FORMAT, "dim": self.dim, "count": self.count,
+            "trained_count": self.trained_count,
+        }
+        tmp_path = self._file(HEADER_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(header, f)
+        os.replace(tmp_path, self._file(HEADER_FILE))
+
+    def _map_vectors(self):
+        self._vectors = (
+            np.memmap(self._file(VECTORS_FILE), dtype=np.float32, mode="r", shape=(self.count, self.dim))
+            if self.count else None
+        )
+
+    def _reload(self):
+        """Re-map the vector file and rebuild the in-memory bucket lists"""
+        self._map_vectors()
+        self._latest = {m["key"]: i for i, m in enumerate(self.meta)}
+        self._live = np.zeros(self.count, dtype=bool)
+        self._live[list(self._latest.values())] = True
+        self.skill_index = SkillIndex()
+        for i, m in enumerate(self.meta):
+            self.skill_index.add(i, m["skills"])
+
+        assignments = (
+            np.fromfile(self._file(LISTS_FILE), dtype=np.int32, count=self.count)
+            if self.count else np.zeros(0, dtype=np.int32)
+        )
+        self._lists: List[np.ndarray] = []
+        if self.centroids is not None:
+            order = np.argsort(assignments, kind="stable").astype(np.int64)
+            bounds = np.searchsorted(assignments[order], np.arange(len(self.centroids) + 1))
+            self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self.centroids))]
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if self.centroids is None:
+            return np.full(len(vectors), -1, dtype=np.int32)
+        return np.concatenate([
+            np.argmax(vectors[start:start + SCAN_CHUNK] @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), SCAN_CHUNK)
+        ]).astype(np.int32)
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray, skills: Optional[Sequence[List[str]]] = None):
+        """Append resumes (e.g. file names) with their embeddings and skills"""
+        vectors = _normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        if len(keys) != len(vectors):
+            raise ValueError("keys and vectors must have the same length")
+        if not len(keys):
+            return
+        skills = skills or [[] for _ in keys]
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+
+            assignments = self._assign(vectors)
+            with open(self._file(VECTORS_FILE), "ab") as f:
+                vectors.tofile(f)
+            with open(self._file(LISTS_FILE), "ab") as f:
+                assignments.tofile(f)
+            new_meta = [{"key": key, "skills": list(row_skills)} for key, row_skills in zip(keys, skills)]
+            with open(self._file(META_FILE), "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(m) + "\n" for m in new_meta)
+            first_id = self.count
+            self.meta.extend(new_meta)
+            self.count += len(new_meta)
+            self._write_header()
+
+            if self.count >= MIN_TRAIN_SIZE and (
+                not self.trained_count or self.count >= self.trained_count * RETRAIN_GROWTH
+            ):
+                self._train()
+                self._reload()
+                return
+
+            # Cheap in-memory update instead of rebuilding every bucket list
+            self._map_vectors()
+            live = np.zeros(self.count, dtype=bool)
+            live[:first_id] = self._live
+            for offset, m in enumerate(new_meta):
+                previous = self._latest.get(m["key"])
+                if previous is not None:
+                    live[previous] = False
+                self._latest[m["key"]] = first_id + offset
+                live[first_id + offset] = True
+                self.skill_index.add(first_id + offset, m["skills"])
+            self._live = live
+            if self.centroids is not None:
+                # A new list object, so concurrent searches keep a consistent snapshot
+                lists = list(self._lists)
+                new_ids = np.arange(first_id, self.count, dtype=np.int64)
+                for c in np.unique(assignments):
+                    lists[c] = np.concatenate([lists[c], new_ids[assignments == c]])
+                self._lists = lists
+
+    def _train(self):
+        """Learn bucket centroids from a sample and re-bucket every row"""
+        vectors = np.memmap(self._file(VECTORS_FILE), dtype=np.float32, mode="r", shape=(self.count, self.dim))
+        nlist = default_nlist(self.count)
+        rng = np.random.default_rng(0)
+        sample_size = min(self.count, nlist * KMEANS_SAMPLE_PER_LIST)
+        sample = np.asarray(vectors[np.sort(rng.choice(self.count, sample_size, replace=False))])
+        self.centroids = train_centroids(sample, nlist)
+
+        assignments = np.concatenate([
+            self._assign(np.asarray(vectors[start:start + SCAN_CHUNK]))
+            for start in range(0, self.count, SCAN_CHUNK)
+        ])
+        # Like the header, each file is replaced whole so a crash never leaves it half written
+        tmp_path = self._file(CENTROIDS_FILE + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, self.centroids)
+        os.replace(tmp_path, self._file(CENTROIDS_FILE))
+        tmp_path = self._file(LISTS_FILE + ".tmp")
+        assignments.tofile(tmp_path)
+        os.replace(tmp_path, self._file(LISTS_FILE))
+        self.trained_count = self.count
+        self._write_header()
+
+    def _score(self, vectors: np.ndarray, ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+        # Sorted ids keep memmap reads sequential
+        return np.concatenate([
+            np.asarray(vectors[ids[start:start + SCAN_CHUNK]]) @ query
+            for start in range(0, len(ids), SCAN_CHUNK)
+        ]) if len(ids) else np.zeros(0, dtype=np.float32)
+
+    def filter(self, skills: Sequence[str], min_count: Optional[int] = None) -> np.ndarray:
+        """Current row ids of resumes with all (or at least min_count) of the skills"""
+        with self._lock:
+            ids = self.skill_index.query(skills, min_count)
+            return ids[self._live[ids]]
+
+    def search(self, query: np.ndarray, top_k: int = 10, nprobe: int = DEFAULT_NPROBE,
+               exact: bool = False, candidates: Optional[np.ndarray] = None) -> List[Dict]:
+        """The top_k rows most similar to query, best first.
+
+        Each hit has the row id, key, cosine score and stored skills.
+        exact=True (or an untrained index) scans every row. candidates (e.g.
+        from filter()) restricts the search to those rows, scored exactly.
+        """
+        query = _normalize(np.asarray(query, dtype=np.float32).ravel())
+        with self._lock:
+            vectors, live, lists, centroids, meta = self._vectors, self._live, self._lists, self.centroids, self.meta
+        if vectors is None or top_k <= 0:
+            return []
+
+        if candidates is not None:
+            candidates = np.sort(np.asarray(candidates, dtype=np.int64))
+            candidates = candidates[live[candidates]]
+        elif exact or centroids is None or nprobe >= len(centroids):
+            candidates = np.flatnonzero(live)
+        else:
+            probe = np.argpartition(-(centroids @ query), nprobe - 1)[:nprobe]
+            candidates = np.sort(np.concatenate([lists[c] for c in probe]))
+            candidates = candidates[live[candidates]]
+
+        ids, scores = _top_k(candidates, self._score(vectors, candidates, query), top_k)
+        return [
+            {"id": int(i), "key": meta[i]["key"], "score": float(s), "skills": meta[i]["skills"]}
+            for i, s in zip(ids, scores)
+        ]
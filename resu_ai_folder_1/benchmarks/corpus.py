@@ -0,0 +1,295 @@
+"""Generate a reproducible synthetic corpus of PDF and DOCX resumes.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.corpus --out bench_corpus [--count 200] [--pages 1-3]
+                                [--layouts single two_column table] [--formats pdf docx] [--seed 0]
+
+The same arguments always produce the same documents. Resumes have a contact
+header with LinkedIn/GitHub links, then experience, projects, education,
+certifications and skills sections, filled to roughly the requested number of
+pages. Layouts:
+
+    single      one column, bold section headings
+    two_column  skills/education in a narrow left column beside experience
+    table       contact details and skills in tables (DOCX) / grid rows (PDF)
+
+A manifest.json lists every file with its format, layout and page target,
+and job_description.txt holds a matching job description.
+"""
+import argparse
+import datetime
+import io
+import json
+import os
+import random
+import zipfile
+from typing import Dict, List, Tuple
+
+FIRST_NAMES = ["Aarav", "Maya", "Liam", "Sofia", "Kenji", "Amara", "Noah", "Priya", "Lucas", "Zara"]
+LAST_NAMES = ["Sharma", "Okafor", "Nguyen", "Garcia", "Tanaka", "Müller", "Cohen", "Silva", "Khan", "Smith"]
+COMPANIES = ["Acme Analytics", "Northwind Labs", "Globex Systems", "Initech", "Umbrella Health",
+             "Stark Robotics", "Wayne Fintech", "Hooli Cloud", "Vandelay Logistics", "Soylent AI"]
+TITLES = ["Software Engineer", "Data Scientist", "Machine Learning Engineer", "Backend Developer",
+          "DevOps Engineer", "Full Stack Developer", "Data Engineer", "Research Intern"]
+SKILLS = ["Python", "Java", "JavaScript", "TypeScript", "SQL", "Docker", "Kubernetes", "AWS", "Google Cloud",
+          "React", "Node.js", "Flask", "Django", "TensorFlow", "PyTorch", "Pandas", "NumPy", "Spark",
+          "Machine Learning", "Deep Learning", "NLP", "Git", "Linux", "MongoDB", "PostgreSQL", "Redis"]
+VERBS = ["Built", "Designed", "Scaled", "Migrated", "Automated", "Optimized", "Led", "Shipped"]
+THINGS = ["a recommendation service", "the billing pipeline", "an ETL platform", "a real-time dashboard",
+          "the search backend", "a fraud detection model", "CI/CD workflows", "a chatbot for support"]
+DEGREES = ["B.Tech in Computer Science", "B.Sc. in Statistics", "M.Sc. in Data Science", "MBA in Analytics"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "National University"]
+CERTIFICATIONS = ["AWS Certified Developer", "Google Data Analytics", "CKA: Kubernetes Administrator",
+                  "TensorFlow Developer Certificate", "Azure Fundamentals"]
+
+LAYOUTS = ("single", "two_column", "table")
+FORMATS = ("pdf", "docx")
+# Experience entries (title line + bullets) that fill about one page
+JOBS_PER_PAGE = 5
+# Fixed timestamps so the same arguments give byte-identical files
+FIXED_DATE = (2024, 1, 1, 0, 0, 0)
+
+def parse_page_range(value: str) -> Tuple[int, int]:
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+def make_resume(rng: random.Random, pages: int) -> Dict:
+    """Content of one resume, independent of format and layout"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first}{last}".lower()
+    skills = rng.sample(SKILLS, rng.randint(6, 14))
+    jobs = []
+    for year in range(max(1, pages * JOBS_PER_PAGE - 1)):
+        bullets = [
+            f"{rng.choice(VERBS)} {rng.choice(THINGS)} with {rng.choice(skills)} and {rng.choice(skills)}, "
+            f"cutting latency by {rng.randint(10, 80)}% for {rng.randint(1, 900)}k users"
+            for _ in range(rng.randint(3, 5))
+        ]
+        jobs.append({
+            "title": f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}",
+            "dates": f"{2024 - year - 1} – {2024 - year}",
+            "bullets": bullets,
+        })
+    return {
+        "name": f"{first} {last}",
+        "email": f"{handle}@example.com",
+        "phone": f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        "linkedin": f"https://www.linkedin.com/in/{handle}",
+        "github": f"https://github.com/{handle}",
+        "skills": skills,
+        "jobs": jobs,
+        "projects": [f"{rng.choice(THINGS).capitalize()} using {', '.join(rng.sample(skills, 3))}"
+                     for _ in range(rng.randint(2, 4))],
+        "education": [f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)} ({rng.randint(2012, 2022)})"],
+        "certifications": rng.sample(CERTIFICATIONS, rng.randint(1, 3)),
+    }
+
+def job_description(rng: random.Random) -> str:
+    skills = rng.sample(SKILLS, 6)
+    return (
+        f"We are hiring a {rng.choice(TITLES)} to join {rng.choice(COMPANIES)}. "
+        f"You will work with {', '.join(skills[:-1])} and {skills[-1]} to build reliable data products. "
+        f"Requirements: {rng.randint(2, 6)}+ years of experience, strong {skills[0]} skills, "
+        f"experience with {skills[1]} in production, and good communication."
+    )
+
+def _sections(resume: Dict) -> List[Tuple[str, List[str]]]:
+    experience = []
+    for job in resume["jobs"]:
+        experience.append(f"{job['title']}    {job['dates']}")
+        experience.extend(f"• {bullet}" for bullet in job["bullets"])
+    return [
+        ("Work Experience", experience),
+        ("Projects", [f"• {project}" for project in resume["projects"]]),
+        ("Education", resume["education"]),
+        ("Certifications", resume["certifications"]),
+        ("Skills", [", ".join(resume["skills"])]),
+    ]
+
+# --- PDF (PyMuPDF) ---
+
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 595, 842, 48
+
+class _PdfWriter:
+    """Flows lines down a page column, starting new pages as needed"""
+
+    def __init__(self, doc, left: float, right: float, page=None):
+        self.doc, self.left, self.right = doc, left, right
+        self.page = page or doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        self.y = MARGIN
+
+    def line(self, text: str, size: float = 10, bold: bool = False):
+        import pymupdf
+
+        max_chars = int((self.right - self.left) / (size * 0.5))
+        chunks = [text[i:i + max_chars] for i in range(0, len(text), max_chars)] or [""]
+        for chunk in chunks:
+            if self.y + size > PAGE_HEIGHT - MARGIN:
+                self.page = self.doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+                self.y = MARGIN
+            self.y += size * 1.4
+            self.page.insert_text(pymupdf.Point(self.left, self.y), chunk, fontsize=size,
+                                  fontname="hebo" if bold else "helv")
+
+    def link(self, text: str, uri: str):
+        import pymupdf
+
+        self.line(text)
+        rect = pymupdf.Rect(self.left, self.y - 10, self.left + 6 * len(text), self.y + 2)
+        self.page.insert_link({"kind": pymupdf.LINK_URI, "from": rect, "uri": uri})
+
+def _pdf_header(writer: _PdfWriter, resume: Dict):
+    writer.line(resume["name"], size=18, bold=True)
+    writer.line(f"{resume['email']} | {resume['phone']}")
+    writer.link("LinkedIn", resume["linkedin"])
+    writer.link("GitHub", resume["github"])
+
+def render_pdf(resume: Dict, layout: str) -> bytes:
+    import pymupdf
+
+    doc = pymupdf.open()
+    sections = _sections(resume)
+    if layout == "two_column":
+        # Narrow sections on the left of the first page, experience on the right
+        side = _PdfWriter(doc, MARGIN, 200)
+        _pdf_header(side, resume)
+        for title, lines in sections[2:]:
+            side.line(title.upper(), size=12, bold=True)
+            for text in lines:
+                side.line(text, size=9)
+        main = _PdfWriter(doc, 215, PAGE_WIDTH - MARGIN, page=doc[0])
+        for title, lines in sections[:2]:
+            main.line(title.upper(), size=12, bold=True)
+            for text in lines:
+                main.line(text, size=9)
+    else:
+        writer = _PdfWriter(doc, MARGIN, PAGE_WIDTH - MARGIN)
+        _pdf_header(writer, resume)
+        for title, lines in sections:
+            writer.line(title.upper(), size=12, bold=True)
+            if layout == "table" and title == "Skills":
+                # A grid of skills, three per row
+                skills = resume["skills"]
+                for i in range(0, len(skills), 3):
+                    writer.line("    ".join(skills[i:i + 3]))
+                continue
+            for text in lines:
+                writer.line(text)
+    doc.set_metadata({"title": resume["name"], "creationDate": "D:20240101000000", "modDate": "D:20240101000000"})
+    data = doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return data
+
+# --- DOCX (python-docx) ---
+
+def _docx_hyperlink(paragraph, url: str, text: str):
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    rel_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    link = OxmlElement("w:hyperlink")
+    link.set(qn("r:id"), rel_id)
+    run = OxmlElement("w:r")
+    run_text = OxmlElement("w:t")
+    run_text.text = text
+    run.append(run_text)
+    link.append(run)
+    paragraph._p.append(link)
+
+def render_docx(resume: Dict, layout: str) -> bytes:
+    import docx
+
+    doc = docx.Document()
+    contact = f"{resume['email']} | {resume['phone']}"
+    if layout == "table":
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = resume["name"]
+        table.cell(0, 1).text = contact
+        _docx_hyperlink(table.cell(1, 0).paragraphs[0], resume["linkedin"], "LinkedIn")
+        _docx_hyperlink(table.cell(1, 1).paragraphs[0], resume["github"], "GitHub")
+    else:
+        # Contact details in the page header, as many templates do
+        header = doc.sections[0].header
+        header.paragraphs[0].text = f"{resume['name']} | {contact}"
+        _docx_hyperlink(header.add_paragraph(), resume["linkedin"], "LinkedIn")
+        _docx_hyperlink(header.add_paragraph(), resume["github"], "GitHub")
+
+    sections = _sections(resume)
+    if layout == "two_column":
+        grid = doc.add_table(rows=1, cols=2)
+        targets = [(grid.cell(0, 1), sections[:2]), (grid.cell(0, 0), sections[2:])]
+    else:
+        targets = [(doc, sections)]
+    for container, container_sections in targets:
+        for title, lines in container_sections:
+            container.add_paragraph().add_run(title).bold = True
+            if layout == "table" and title == "Skills":
+                skills = resume["skills"]
+                table = container.add_table(rows=(len(skills) + 2) // 3, cols=3)
+                for i, skill in enumerate(skills):
+                    table.cell(i // 3, i % 3).text = skill
+                continue
+            for text in lines:
+                container.add_paragraph(text)
+
+    doc.core_properties.created = doc.core_properties.modified = datetime.datetime(*FIXED_DATE)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return _fixed_zip_dates(buffer.getvalue())
+
+def _fixed_zip_dates(data: bytes) -> bytes:
+    # zipfile stamps every member with the current time
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            target.writestr(zipfile.ZipInfo(info.filename, FIXED_DATE), source.read(info),
+                            zipfile.ZIP_DEFLATED)
+    return out.getvalue()
+
+RENDERERS = {"pdf": render_pdf, "docx": render_docx}
+
+def generate_corpus(out_dir: str, count: int = 200, pages: Tuple[int, int] = (1, 3),
+                    layouts=LAYOUTS, formats=FORMATS, seed: int = 0) -> Dict:
+    """Write count resumes and a job description to out_dir; returns the manifest"""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    files = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        layout = layouts[(i // len(formats)) % len(layouts)]
+        page_count = rng.randint(*pages)
+        # Each document has its own generator, so one file never depends on another
+        resume = make_resume(random.Random(rng.getrandbits(64)), page_count)
+        name = f"resume_{i:05d}_{layout}.{fmt}"
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(RENDERERS[fmt](resume, layout))
+        files.append({"file": name, "format": fmt, "layout": layout, "pages": page_count})
+
+    with open(os.path.join(out_dir, "job_description.txt"), "w", encoding="utf-8") as f:
+        f.write(job_description(rng))
+    manifest = {
+        "count": count, "pages": list(pages), "layouts": list(layouts), "formats": list(formats),
+        "seed": seed, "job_description": "job_description.txt", "files": files,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus")
+    parser.add_argument("--out", default="bench_corpus")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--pages", type=parse_page_range, default=(1, 3), help="Pages per resume, e.g. 2 or 1-4")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    manifest = generate_corpus(args.out, args.count, args.pages, args.layouts, args.formats, args.seed)
+    print(json.dumps({key: value for key, value in manifest.items() if key != "files"}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Compare the streaming DOCX extractor with the python-docx object model.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.docx_extraction [--input 'resumes/*.docx'] [--docs 50] [--repeat 5]
+
+Without --input a synthetic corpus of resumes of growing length is written
+with python-docx: headers, footers, tables and hyperlinks included. For
+each extractor it reports per-document latency (p50/p95), peak traced
+memory, and how many lines and links each one recovers.
+"""
+import argparse
+import glob
+import io
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+import docx
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from backend import document
+from backend.document import load_document
+
+SKILLS = ["Python", "SQL", "Docker", "Kubernetes", "React", "AWS", "Java", "Go", "Spark", "TensorFlow"]
+
+def _add_hyperlink(paragraph, url, text):
+    rel_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    link = OxmlElement("w:hyperlink")
+    link.set(qn("r:id"), rel_id)
+    run = OxmlElement("w:r")
+    run_text = OxmlElement("w:t")
+    run_text.text = text
+    run.append(run_text)
+    link.append(run)
+    paragraph._p.append(link)
+
+def synthetic_docx(jobs, seed=0) -> bytes:
+    """A resume with a contact header, jobs * 4 bullet points and a skills table"""
+    rng = random.Random(seed)
+    doc = docx.Document()
+    section = doc.sections[0]
+    section.header.paragraphs[0].text = f"Candidate {seed} | candidate{seed}@example.com | +1 555 010 {seed:04d}"
+    _add_hyperlink(section.header.add_paragraph(), f"https://www.linkedin.com/in/candidate{seed}", "LinkedIn")
+    section.footer.paragraphs[0].text = f"github.com/candidate{seed}"
+
+    doc.add_heading("Work Experience", level=1)
+    for job in range(jobs):
+        title = doc.add_paragraph()
+        title.add_run(f"Software Engineer {job}, Company {rng.randint(1, 999)}").bold = True
+        for _ in range(4):
+            doc.add_paragraph(
+                f"Built {rng.choice(SKILLS)} and {rng.choice(SKILLS)} services handling "
+                f"{rng.randint(1, 900)}k requests a day", style="List Bullet",
+            )
+    doc.add_heading("Skills", level=1)
+    table = doc.add_table(rows=3, cols=2)
+    for row in table.rows:
+        row.cells[0].text = rng.choice(["Languages", "Cloud", "Data"])
+        row.cells[1].text = ", ".join(rng.sample(SKILLS, 4))
+    doc.add_heading("Projects", level=1)
+    _add_hyperlink(doc.add_paragraph("Portfolio: "), f"https://candidate{seed}.github.io", "site")
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def python_docx_extract(data: bytes):
+    """The previous extractor: the full object model, body paragraphs only"""
+    doc = docx.Document(io.BytesIO(data))
+    lines = [para.text for para in doc.paragraphs if para.text.strip()]
+    links = [rel.target_ref for rel in doc.part.rels.values() if rel.reltype == RT.HYPERLINK and rel.is_external]
+    return lines, links
+
+def streaming_extract(data: bytes):
+    parsed = load_document(data, "resume.docx")
+    return [line.text for line in parsed.lines], parsed.links
+
+def streaming_extract_cold(data: bytes):
+    # As if every resume came from a different template
+    document._styles_cache.clear()
+    return streaming_extract(data)
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def benchmark(name, extract, corpus, repeat):
+    latencies = []
+    for _ in range(repeat):
+        for data in corpus:
+            start = time.perf_counter()
+            extract(data)
+            latencies.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate pass so it does not skew the timings
+    peaks, lines, links = [], 0, 0
+    for data in corpus:
+        tracemalloc.start()
+        doc_lines, doc_links = extract(data)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        lines += len(doc_lines)
+        links += len(doc_links)
+
+    return {
+        "extractor": name,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+        "peak_kb_mean": round(statistics.mean(peaks) / 1024, 1),
+        "peak_kb_max": round(max(peaks) / 1024, 1),
+        "lines": lines,
+        "links": links,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DOCX text extraction")
+    parser.add_argument("--input", help="Glob of .docx files to use instead of the synthetic corpus")
+    parser.add_argument("--docs", type=int, default=50, help="Synthetic documents to generate")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.input:
+        corpus = []
+        for path in sorted(glob.glob(args.input)):
+            with open(path, "rb") as f:
+                corpus.append(f.read())
+    else:
+        # From one-page resumes up to very long CVs
+        corpus = [synthetic_docx(jobs=1 + i % 40, seed=i) for i in range(args.docs)]
+    print(json.dumps({"documents": len(corpus), "mean_kb": round(statistics.mean(map(len, corpus)) / 1024, 1)}))
+
+    extractors = [
+        ("python-docx", python_docx_extract),
+        ("streaming", streaming_extract),
+        ("streaming_cold_styles", streaming_extract_cold),
+    ]
+    for name, extract in extractors:
+        print(json.dumps(benchmark(name, extract, corpus, args.repeat)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare the PyTorch and ONNX embedding backends on the sample resumes.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.embeddings [--backends embedder onnx_embedder] [--repeat 20]
+
+For every backend it reports model load time and resident memory, single
+text latency (p50/p95), batch throughput, and, when both are loaded, the
+parity of the ONNX embeddings and match scores against PyTorch. Set
+RESUAI_ONNX_QUANTIZE=0 to measure the float32 ONNX export instead of int8.
+The embedding cache is bypassed: models are called directly.
+"""
+import argparse
+import glob
+import json
+import statistics
+import time
+
+from backend.models import get_model, model_stats
+from backend.onnx_embedder import parity_check
+from backend.resume_matcher import preprocess_text
+from backend.resume_parser import parse_resume
+from backend.summarization import split_sentences
+
+DEFAULT_RESUMES = ["data/sample_resume.pdf"] + sorted(glob.glob("test_resumes/*.pdf"))
+DEFAULT_JD = "data/sample_jd.txt"
+
+def _load_texts(paths, jd_path):
+    documents = []
+    for path in paths:
+        parsed = parse_resume(path, summarize=False)
+        if "error" not in parsed:
+            documents.append(preprocess_text(parsed["text"]))
+    with open(jd_path, encoding="utf-8") as f:
+        documents.append(preprocess_text(f.read()))
+    # Sentences give a realistic mix of short inputs for the batch numbers
+    sentences = [preprocess_text(s) for text in documents for s in split_sentences(text)]
+    return documents, [s for s in sentences if s]
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def benchmark_backend(name, documents, sentences, repeat, batch_size):
+    """Latency, throughput and memory of one registered embedder"""
+    model = get_model(name)
+    if model is None:
+        return {"backend": name, "error": "model unavailable"}
+
+    model.encode(documents[:1], normalize_embeddings=True)  # warm-up
+    latencies = []
+    for _ in range(repeat):
+        for text in documents:
+            start = time.perf_counter()
+            model.encode([text], normalize_embeddings=True, convert_to_numpy=True)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    model.encode(sentences, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True)
+    batch_seconds = time.perf_counter() - start
+
+    stats = model_stats()["models"][name]
+    return {
+        "backend": name,
+        "load_seconds": stats["load_seconds"],
+        "model_rss_mb": stats["rss_mb"],
+        "single_p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "single_p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+        "batch_texts": len(sentences),
+        "batch_texts_per_second": round(len(sentences) / batch_seconds, 1) if batch_seconds else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends")
+    parser.add_argument("--backends", nargs="+", default=["embedder", "onnx_embedder"],
+                        choices=["embedder", "onnx_embedder"])
+    parser.add_argument("--resumes", nargs="+", default=DEFAULT_RESUMES)
+    parser.add_argument("--jd", default=DEFAULT_JD)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    documents, sentences = _load_texts(args.resumes, args.jd)
+    for name in args.backends:
+        print(json.dumps(benchmark_backend(name, documents, sentences, args.repeat, args.batch_size)))
+
+    if set(args.backends) != {"embedder", "onnx_embedder"}:
+        return
+    reference, candidate = get_model("embedder"), get_model("onnx_embedder")
+    if reference and candidate:
+        parity = parity_check(reference, candidate, documents + sentences)
+        print(json.dumps({"parity": parity, "process_rss_mb": model_stats()["process_rss_mb"]}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""End-to-end performance baseline of parsing, matching and batch processing.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.harness [--corpus bench_corpus] [--count 100] [--repeat 1]
+                                 [--batch-workers 2] [--trace-memory] [--compare OLD.json]
+
+The corpus is generated with benchmarks.corpus when the folder has no
+manifest.json yet (--count/--pages/--seed are passed through). Parse and
+embedding caches are turned off so every run does the real work.
+
+Phases:
+
+    parse   parse_resume on every file, serially
+    match   match_resume_to_job of every parsed resume against the corpus JD
+            (skipped when the embedding model is unavailable)
+    batch   run_batch over the corpus folder with --batch-workers processes
+
+For each phase the p50/p95/p99 latency per document, throughput per core
+and peak RSS are reported, plus the same percentiles for every pipeline
+stage (see backend.instrumentation). --trace-memory adds a separate pass
+that records per-stage peak traced memory. Results are written as JSON
+(default benchmarks/results/<time>_<commit>.json); --compare prints the
+change against an earlier results file and flags regressions.
+"""
+import os
+
+# Measure the real work, not cache hits. Set before the backend is imported.
+os.environ.setdefault("RESUAI_PARSE_CACHE", "0")
+os.environ.setdefault("RESUAI_EMBEDDING_CACHE", "0")
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend import instrumentation
+from backend.batch import run_batch
+from backend.instrumentation import collect_timings
+from backend.models import EMBEDDER_MODEL, get_model, model_stats
+from backend.resume_matcher import match_resume_to_job, resume_sections, split_windows
+from backend.resume_parser import PARSER_VERSION, parse_resume
+from benchmarks.corpus import parse_page_range, generate_corpus
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+# Latency metrics compared by --compare; higher is worse
+COMPARED_PERCENTILES = ("p50_ms", "p95_ms", "p99_ms")
+
+def latency_stats(seconds):
+    """p50/p95/p99 and mean of a list of durations, in milliseconds"""
+    if not seconds:
+        return {}
+    values = np.asarray(seconds) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": len(values), "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(p50), 3), "p95_ms": round(float(p95), 3), "p99_ms": round(float(p99), 3),
+    }
+
+def peak_rss_mb(children: bool = False) -> float:
+    """High-water resident memory of this process (or its finished children)"""
+    try:
+        import resource
+    except ImportError:
+        # Windows: only the current RSS is available without psutil
+        return 0.0 if children else model_stats()["process_rss_mb"]
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return round(usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+def _load_corpus(args):
+    manifest_path = os.path.join(args.corpus, "manifest.json")
+    if not os.path.exists(manifest_path):
+        print(f"Generating {args.count} resumes in {args.corpus}", file=sys.stderr)
+        generate_corpus(args.corpus, args.count, args.pages, seed=args.seed)
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    with open(os.path.join(args.corpus, manifest["job_description"]), encoding="utf-8") as f:
+        job_description = f.read()
+    paths = [os.path.join(args.corpus, entry["file"]) for entry in manifest["files"]]
+    return manifest, paths, job_description
+
+class PhaseRecorder:
+    """Per-document latency and per-stage timings of one benchmark phase"""
+
+    def __init__(self):
+        self.latencies = []
+        self.stage_walls = {}
+        self.stage_cpus = {}
+        self.stage_peaks = {}
+        self.errors = 0
+        self.cpu_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def run(self, func, *args, **kwargs):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with collect_timings() as stages:
+            result = func(*args, **kwargs)
+        wall = time.perf_counter() - wall_start
+        self.wall_seconds += wall
+        self.cpu_seconds += time.process_time() - cpu_start
+        self.latencies.append(wall)
+        self.errors += isinstance(result, dict) and "error" in result
+        for name, entry in stages.items():
+            self.stage_walls.setdefault(name, []).append(entry["wall_ms"] / 1000)
+            self.stage_cpus.setdefault(name, []).append(entry["cpu_ms"] / 1000)
+            if "peak_kb" in entry:
+                self.stage_peaks.setdefault(name, []).append(entry["peak_kb"])
+        return result
+
+    def report(self):
+        documents = len(self.latencies)
+        return {
+            "documents": documents,
+            "errors": self.errors,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            # Serial phases run on one core, so this is the per-core rate
+            "docs_per_second": round(documents / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "docs_per_cpu_second": round(documents / self.cpu_seconds, 2) if self.cpu_seconds else 0.0,
+            "latency": latency_stats(self.latencies),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": {
+                name: {
+                    "wall": latency_stats(walls),
+                    "cpu_mean_ms": round(float(np.mean(self.stage_cpus[name])) * 1000, 3),
+                }
+                for name, walls in sorted(self.stage_walls.items())
+            },
+        }
+
+def bench_parse(paths, repeat, summarizer):
+    recorder = PhaseRecorder()
+    parsed = []
+    for iteration in range(repeat):
+        for path in paths:
+            result = recorder.run(parse_resume, path, summarizer=summarizer, use_cache=False)
+            if iteration == 0 and "error" not in result:
+                parsed.append(result)
+    return recorder.report(), parsed
+
+def bench_match(parsed, job_description, repeat):
+    recorder = PhaseRecorder()
+    for _ in range(repeat):
+        # Every resume is new to the service; only the JD is reused
+        split_windows.cache_clear()
+        for result in parsed:
+            recorder.run(match_resume_to_job, result["text"], job_description, resume_sections(result))
+    return recorder.report()
+
+def bench_batch(corpus, workers, summarizer, job_description):
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = run_batch(corpus, os.path.join(tmp, "results.jsonl"), workers=workers,
+                          job_description=job_description, summarizer=summarizer, progress_every=0)
+    elapsed = stats["elapsed_seconds"]
+    return {
+        "workers": workers,
+        "documents": stats["processed"],
+        "errors": stats["errors"],
+        "wall_seconds": elapsed,
+        "docs_per_second": round(stats["processed"] / elapsed, 2) if elapsed else 0.0,
+        "docs_per_second_per_worker": round(stats["processed"] / elapsed / workers, 2) if elapsed else 0.0,
+        "mean_worker_seconds_per_doc": round(stats["worker_seconds"] / max(stats["processed"], 1), 4),
+        "worker_peak_rss_mb": peak_rss_mb(children=True),
+    }
+
+def bench_memory(paths, parsed, job_description, summarizer, match):
+    """Per-stage peak traced memory, in a pass of its own (tracing slows everything)"""
+    instrumentation.TRACE_MEMORY = True
+    try:
+        recorder = PhaseRecorder()
+        for path in paths:
+            recorder.run(parse_resume, path, summarizer=summarizer, use_cache=False)
+        if match:
+            split_windows.cache_clear()
+            for result in parsed:
+                recorder.run(match_resume_to_job, result["text"], job_description, resume_sections(result))
+    finally:
+        instrumentation.TRACE_MEMORY = False
+    return {
+        name: {"peak_kb_p95": round(float(np.percentile(peaks, 95)), 1), "peak_kb_max": max(peaks)}
+        for name, peaks in sorted(recorder.stage_peaks.items())
+    }
+
+def _compared_metrics(results):
+    """Flatten a results file into {metric path: (value, higher_is_worse)}"""
+    metrics = {}
+    for phase, data in results.get("phases", {}).items():
+        for key in COMPARED_PERCENTILES:
+            if key in data.get("latency", {}):
+                metrics[f"{phase}.latency.{key}"] = (data["latency"][key], True)
+        for name, stage_data in data.get("stages", {}).items():
+            for key in COMPARED_PERCENTILES:
+                if key in stage_data["wall"]:
+                    metrics[f"{phase}.stages.{name}.{key}"] = (stage_data["wall"][key], True)
+        for key in ("docs_per_second", "docs_per_cpu_second", "docs_per_second_per_worker"):
+            if key in data:
+                metrics[f"{phase}.{key}"] = (data[key], False)
+        for key in ("peak_rss_mb", "worker_peak_rss_mb"):
+            if key in data:
+                metrics[f"{phase}.{key}"] = (data[key], True)
+    return metrics
+
+def compare(baseline, current, threshold, min_delta_ms=0.5):
+    """Rows of (metric, old, new, relative change, regressed) present in both runs.
+
+    Latencies must also move by min_delta_ms to count, so sub-millisecond
+    stages do not flag timer noise.
+    """
+    old_metrics, new_metrics = _compared_metrics(baseline), _compared_metrics(current)
+    rows = []
+    for metric, (new, higher_is_worse) in new_metrics.items():
+        if metric not in old_metrics or not old_metrics[metric][0]:
+            continue
+        old = old_metrics[metric][0]
+        change = (new - old) / old
+        regressed = change > threshold if higher_is_worse else change < -threshold
+        if metric.endswith("_ms") and abs(new - old) < min_delta_ms:
+            regressed = False
+        rows.append((metric, old, new, change, regressed))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the parse/match pipeline on a synthetic corpus")
+    parser.add_argument("--corpus", default="bench_corpus", help="Corpus folder (generated if it has no manifest)")
+    parser.add_argument("--count", type=int, default=100, help="Resumes to generate for a new corpus")
+    parser.add_argument("--pages", type=parse_page_range, default=(1, 3), help="Pages per generated resume, e.g. 1-3")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the corpus per phase")
+    parser.add_argument("--summarizer", choices=["extractive", "distilbart", "bart"], default="extractive")
+    parser.add_argument("--skip-match", action="store_true")
+    parser.add_argument("--batch-workers", type=int, default=0, help="Also time run_batch with this many workers")
+    parser.add_argument("--trace-memory", action="store_true", help="Add a per-stage peak memory pass")
+    parser.add_argument("--output", default=None, help="Results file (default benchmarks/results/<time>_<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="Smallest latency change (ms) counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on any regression")
+    args = parser.parse_args(argv)
+
+    manifest, paths, job_description = _load_corpus(args)
+    commit, dirty = git_commit()
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit, "dirty": dirty, "parser_version": PARSER_VERSION,
+            "python": platform.python_version(), "platform": platform.platform(),
+            "cpu_count": os.cpu_count(), "summarizer": args.summarizer, "repeat": args.repeat,
+            "corpus": {key: value for key, value in manifest.items() if key != "files"},
+        },
+        "phases": {},
+    }
+
+    # Load models up front so their one-off cost is not in the first document
+    parse_resume(paths[0], summarizer=args.summarizer, use_cache=False)
+    results["phases"]["parse"], parsed = bench_parse(paths, args.repeat, args.summarizer)
+    print(json.dumps({"phase": "parse", **results["phases"]["parse"]["latency"]}), file=sys.stderr)
+
+    match = not args.skip_match and get_model(EMBEDDER_MODEL) is not None
+    if not args.skip_match and not match:
+        print("Embedding model unavailable, skipping the match phase", file=sys.stderr)
+    if match and parsed:
+        results["phases"]["match"] = bench_match(parsed, job_description, args.repeat)
+        print(json.dumps({"phase": "match", **results["phases"]["match"]["latency"]}), file=sys.stderr)
+
+    if args.batch_workers:
+        results["phases"]["batch"] = bench_batch(args.corpus, args.batch_workers, args.summarizer,
+                                                 job_description if match else None)
+        print(json.dumps({"phase": "batch", "docs_per_second": results["phases"]["batch"]["docs_per_second"]}),
+              file=sys.stderr)
+
+    if args.trace_memory:
+        results["stage_memory"] = bench_memory(paths, parsed, job_description, args.summarizer, match)
+    results["models"] = model_stats()
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}_{commit or 'nogit'}.json"
+    )
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(baseline, results, args.threshold, args.min_delta_ms)
+        for metric, old, new, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{metric:<50} {old:>10} -> {new:<10} {change:+7.1%}{flag}")
+        if args.fail_on_regression and any(row[4] for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Compare summarizer backends on the sample resumes.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.summarizers [--backends extractive distilbart bart] [--repeat 3]
+
+Reports model load time and resident memory (from the model registry) and
+per-resume summary latency for every backend.
+"""
+import argparse
+import glob
+import json
+import statistics
+import time
+
+from backend.models import model_stats
+from backend.resume_parser import SUMMARY_SECTIONS, parse_resume
+from backend.summarization import SUMMARIZERS, get_summarizer
+
+DEFAULT_RESUMES = ["data/sample_resume.pdf"] + sorted(glob.glob("test_resumes/*.pdf"))
+
+def _load_resumes(paths):
+    resumes = []
+    for path in paths:
+        parsed = parse_resume(path, summarize=False)
+        if "error" in parsed:
+            print(f"Skipping {path}: {parsed['error']}")
+            continue
+        resumes.append((parsed["text"], {name: parsed[name] for name in SUMMARY_SECTIONS}))
+    return resumes
+
+def benchmark_backend(name, resumes, repeat):
+    """Latency and memory of one backend over the given resumes"""
+    summarizer = get_summarizer(name)
+    if summarizer.name != name:
+        return {"backend": name, "error": f"model unavailable, falls back to {summarizer.name}"}
+
+    latencies = []
+    for _ in range(repeat):
+        for text, sections in resumes:
+            start = time.perf_counter()
+            summarizer.summarize_batch([text], [sections])
+            latencies.append(time.perf_counter() - start)
+
+    stats = model_stats()
+    result = {
+        "backend": name,
+        "runs": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1),
+        "process_rss_mb": stats["process_rss_mb"],
+    }
+    model = stats["models"].get(summarizer.model_name or "")
+    if model:
+        result["load_seconds"] = model.get("load_seconds")
+        result["model_rss_mb"] = model.get("rss_mb")
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark summarizer backends")
+    parser.add_argument("--backends", nargs="+", default=list(SUMMARIZERS), choices=list(SUMMARIZERS))
+    parser.add_argument("--resumes", nargs="+", default=DEFAULT_RESUMES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    resumes = _load_resumes(args.resumes)
+    # Backends run in registry order: extractive, then distilbart, then bart
+    for name in args.backends:
+        print(json.dumps(benchmark_backend(name, resumes, args.repeat)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Recall and latency of the IVF resume index against brute force.
+
+Run from resu_ai_folder_1/:
+
+    python -m benchmarks.vector_index [--rows 200000] [--dim 384] [--queries 200]
+
+Builds an index of synthetic clustered unit vectors (resume embeddings form
+topical clusters too) in a temporary folder, then for several nprobe values
+reports recall@k against an exact scan and query latency percentiles.
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from backend.vector_index import ResumeIndex
+
+def synthetic_vectors(rows, dim, clusters, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, rows)
+    vectors = centers[labels] + rng.normal(scale=0.6, size=(rows, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def _run_queries(index, queries, top_k, **kwargs):
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search(query, top_k, **kwargs)
+        latencies.append(time.perf_counter() - start)
+        results.append({hit["id"] for hit in hits})
+    return results, latencies
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume vector index")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    parser.add_argument("--add-batch", type=int, default=10_000, help="Rows per incremental add() call")
+    args = parser.parse_args(argv)
+
+    vectors = synthetic_vectors(args.rows, args.dim, args.clusters)
+    queries = synthetic_vectors(args.queries, args.dim, args.clusters, seed=1)
+
+    with tempfile.TemporaryDirectory() as path:
+        index = ResumeIndex(path)
+        start = time.perf_counter()
+        for offset in range(0, args.rows, args.add_batch):
+            chunk = vectors[offset:offset + args.add_batch]
+            index.add([f"resume-{offset + i}" for i in range(len(chunk))], chunk)
+        build_seconds = time.perf_counter() - start
+        print(json.dumps({
+            "rows": args.rows, "dim": args.dim, "build_seconds": round(build_seconds, 2),
+            "nlist": len(index.centroids) if index.centroids is not None else 0,
+        }))
+
+        # Re-open from disk, as a search service would
+        index = ResumeIndex(path)
+        exact, exact_latencies = _run_queries(index, queries, args.top_k, exact=True)
+        print(json.dumps({
+            "mode": "brute_force",
+            "p50_ms": round(statistics.median(exact_latencies) * 1000, 2),
+            "p95_ms": round(_percentile(exact_latencies, 95) * 1000, 2),
+        }))
+        for nprobe in args.nprobe:
+            approx, latencies = _run_queries(index, queries, args.top_k, nprobe=nprobe)
+            recall = statistics.mean(len(a & e) / len(e) for a, e in zip(approx, exact) if e)
+            print(json.dumps({
+                "mode": "ivf",
+                "nprobe": nprobe,
+                f"recall@{args.top_k}": round(recall, 4),
+                "p50_ms": round(statistics.median(latencies) * 1000, 2),
+                "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+            }))
+
+if __name__ == "__main__":
+    main()
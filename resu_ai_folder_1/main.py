@@ -0,0 +1,70 @@
+import argparse
+import json
+import sys
+
+def _read_job_description(path):
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse resumes and match them against a job description")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--resume", help="Parse a single PDF/DOCX resume and print the result")
+    source.add_argument("--input", help="Directory or ZIP archive of resumes to parse in bulk")
+    source.add_argument("--search", metavar="INDEX_DIR",
+                        help="Rank the resumes in a resume index against --jd instead of parsing")
+    parser.add_argument("--jd", help="Text file with the job description to match against")
+    parser.add_argument("--output", default="results.jsonl",
+                        help="Bulk output file; .csv writes CSV, anything else JSON Lines")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="File of finished resumes; re-running with it resumes an interrupted batch")
+    parser.add_argument("--batch-size", type=int, default=4,
+                        help="Resumes per worker task; summaries within a task run as one model batch")
+    parser.add_argument("--summarizer", choices=["extractive", "distilbart", "bart"], default=None,
+                        help="Summary backend (default: RESUAI_SUMMARIZER or bart)")
+    parser.add_argument("--include-text", action="store_true", help="Keep the full resume text in bulk output")
+    parser.add_argument("--index", metavar="INDEX_DIR", default=None,
+                        help="Also add bulk-parsed resumes to the resume index in this folder")
+    parser.add_argument("--top-k", type=int, default=10, help="Number of resumes --search returns")
+    parser.add_argument("--require-skills", default=None,
+                        help="Comma-separated skills a --search hit must have, e.g. 'Python,Docker'")
+    parser.add_argument("--min-skills", type=int, default=None,
+                        help="With --require-skills: hits need only this many of them")
+    args = parser.parse_args(argv)
+
+    from backend.instrumentation import configure_logging
+    # Logs go to stderr (and logs/parser.log) so stdout stays pure JSON
+    configure_logging()
+
+    job_description = _read_job_description(args.jd)
+
+    if args.search:
+        if not job_description:
+            parser.error("--search needs --jd")
+        from backend.resume_matcher import search_resumes
+        from backend.vector_index import ResumeIndex
+        required = [s for s in (args.require_skills or "").split(",") if s.strip()]
+        hits = search_resumes(job_description, ResumeIndex(args.search), top_k=args.top_k,
+                              required_skills=required, min_skills=args.min_skills)
+        print(json.dumps(hits, indent=2, ensure_ascii=False))
+        return 0
+
+    if args.resume:
+        from backend.batch import process_file
+        result = process_file(args.resume, args.resume, job_description,
+                              include_text=args.include_text, summarizer=args.summarizer)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 1 if "error" in result else 0
+
+    from backend.batch import run_batch
+    stats = run_batch(args.input, args.output, workers=args.workers, job_description=job_description,
+                      checkpoint=args.checkpoint, include_text=args.include_text,
+                      batch_size=args.batch_size, summarizer=args.summarizer, index_dir=args.index)
+    print(json.dumps(stats, indent=2), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import glob
 import os
 from backend.resume_parser import parse_resume
 
@@ -29,14 +30,14 @@ def test_parser(file_path):
     return result
 
 if __name__ == "__main__":
-    # Test with different resume formats
-    test_files = [
-        "test_resumes/madhur_resume",  # Your resume
-        "test_resumes/minimal_resume"   # A minimal test case
-    ]
-    
+    # Test with every sample resume, wherever the script is run from
+    here = os.path.dirname(os.path.abspath(__file__))
+    test_files = sorted(
+        glob.glob(os.path.join(here, "test_resumes", "*.pdf"))
+        + glob.glob(os.path.join(here, "test_resumes", "*.docx"))
+    )
+
+    if not test_files:
+        print("No resumes found in test_resumes/")
     for file_path in test_files:
-        if os.path.exists(file_path):
-            test_parser(file_path)
-        else:
-            print(f"File not found: {file_path}")
\ No newline at end of file
+        test_parser(file_path)
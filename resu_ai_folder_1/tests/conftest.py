@@ -0,0 +1,46 @@
+import hashlib
+import os
+import re
+import sys
+import tempfile
+
+import numpy as np
+import pytest
+
+# Tests never read or write the on-disk caches of a real install
+os.environ.setdefault("RESUAI_PARSE_CACHE", "0")
+os.environ.setdefault("RESUAI_EMBEDDING_CACHE", "0")
+os.environ.setdefault("RESUAI_SUMMARIZER", "extractive")
+os.environ.setdefault("RESUAI_CACHE_DIR", tempfile.mkdtemp(prefix="resuai-test-cache-"))
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+SAMPLE_RESUME = os.path.join(APP_DIR, "test_resumes", "madhur_resume.pdf")
+
+class _WordTokenizer:
+    def __call__(self, text, **kwargs):
+        return {"offset_mapping": [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]}
+
+class HashingEmbedder:
+    """Deterministic bag-of-words vectors with the SentenceTransformer interface"""
+    max_seq_length = 128
+    tokenizer = _WordTokenizer()
+
+    def encode(self, texts, **kwargs):
+        vectors = np.zeros((len(texts), 64), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+@pytest.fixture
+def embedder(monkeypatch):
+    from backend import models
+    from backend.resume_matcher import split_windows
+
+    model = HashingEmbedder()
+    monkeypatch.setitem(models._MODELS, models.EMBEDDER_MODEL, model)
+    split_windows.cache_clear()
+    yield model
+    split_windows.cache_clear()
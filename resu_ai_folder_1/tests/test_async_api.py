@@ -0,0 +1,40 @@
+import asyncio
+
+from backend import async_api
+from backend.async_api import analyze_resume_async
+from backend.resume_matcher import match_resume_to_job, resume_sections
+from backend.resume_parser import parse_resume
+
+from conftest import SAMPLE_RESUME
+
+JOB = "Software engineer with Python, machine learning and SQL experience to build data pipelines."
+
+def test_async_analysis_matches_the_sync_one(embedder, monkeypatch):
+    # Extract in threads: spawned parse workers would not see the test embedder
+    monkeypatch.setattr(async_api, "PARSE_WORKERS", 0)
+    with open(SAMPLE_RESUME, "rb") as f:
+        data = f.read()
+
+    async def analyze_concurrently():
+        try:
+            return await asyncio.gather(*(analyze_resume_async(data, "resume.pdf", JOB, include_stages=True)
+                                          for _ in range(3)))
+        finally:
+            async_api.shutdown()
+
+    results = asyncio.run(analyze_concurrently())
+    expected = parse_resume(data, file_name="resume.pdf")
+    expected.update(match_resume_to_job(expected["text"], JOB, resume_sections(expected)))
+    for result in results:
+        timings = result.pop("timings")
+        assert set(timings) == {"parse_seconds", "match_seconds", "stages"}
+        assert "extract_text" in timings["stages"]
+        assert result.keys() == expected.keys()
+        assert abs(result.pop("score") - expected["score"]) < 1e-5
+        assert result == {key: value for key, value in expected.items() if key != "score"}
+
+def test_async_analysis_returns_parse_errors(monkeypatch):
+    monkeypatch.setattr(async_api, "PARSE_WORKERS", 0)
+    result = asyncio.run(analyze_resume_async(b"hello", "resume.txt", JOB))
+    async_api.shutdown()
+    assert result == {"error": "Unsupported file format"}
@@ -0,0 +1,50 @@
+import json
+import os
+import shutil
+
+from backend.batch import process_files, run_batch
+
+from conftest import SAMPLE_RESUME
+
+def crash_on_marked_files(items, *args, **kwargs):
+    # Runs in a spawned worker, which imports this module by name: kill the
+    # whole process, as an OOM kill would
+    if any("crash" in name for name, _ in items):
+        os._exit(1)
+    return process_files(items, *args, **kwargs)
+
+def _resume_folder(tmp_path, names):
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    for name in names:
+        shutil.copy(SAMPLE_RESUME, folder / name)
+    return str(folder)
+
+def _results(path):
+    with open(path, encoding="utf-8") as f:
+        return {result["file"]: result for result in map(json.loads, f)}
+
+def test_failed_files_are_retried_from_the_checkpoint(tmp_path):
+    source = _resume_folder(tmp_path, ["a.pdf", "b.pdf", "crash.pdf", "d.pdf", "e.pdf"])
+    output, checkpoint = str(tmp_path / "out.jsonl"), str(tmp_path / "done.txt")
+    (tmp_path / "resumes" / "broken.pdf").write_bytes(b"%PDF-1.4 not really")
+
+    stats = run_batch(source, output, workers=1, checkpoint=checkpoint, batch_size=1,
+                      summarizer="extractive", progress_every=0, process_fn=crash_on_marked_files)
+    results = _results(output)
+    assert stats["processed"] == 6
+    assert "error" in results["crash.pdf"] and "error" in results["broken.pdf"]
+    # The pool was rebuilt after the crash, so later files still parsed
+    assert "error" not in results["e.pdf"]
+
+    with open(checkpoint, encoding="utf-8") as f:
+        done = {line.strip() for line in f}
+    assert done == {name for name, result in results.items() if "error" not in result}
+
+    os.remove(output)
+    run_batch(source, output, workers=1, checkpoint=checkpoint, batch_size=1,
+              summarizer="extractive", progress_every=0)
+    retried = _results(output)
+    assert "crash.pdf" in retried and "broken.pdf" in retried
+    assert "error" not in retried["crash.pdf"]
+    assert not done & set(retried)
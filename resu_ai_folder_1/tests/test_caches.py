@@ -0,0 +1,115 @@
+import asyncio
+import sqlite3
+
+import numpy as np
+
+from backend import async_api, models, resume_matcher, resume_parser
+from backend.embedding_cache import EmbeddingCache
+from backend.parse_cache import ParseCache
+
+from conftest import SAMPLE_RESUME
+
+class LockedCache:
+    """A cache whose database another process holds locked"""
+
+    def get(self, key):
+        raise sqlite3.OperationalError("database is locked")
+
+    def put(self, key, result):
+        raise sqlite3.OperationalError("database is locked")
+
+    def get_many(self, texts, model_name):
+        raise sqlite3.OperationalError("database is locked")
+
+    def put_many(self, texts, vectors, model_name):
+        raise sqlite3.OperationalError("database is locked")
+
+def test_parse_cache_round_trip(tmp_path):
+    cache = ParseCache(str(tmp_path / "parses.sqlite3"))
+    assert cache.get("missing") is None
+    cache.put("a", {"text": "hello", "skills": ["Python"]})
+    assert cache.get("a") == {"text": "hello", "skills": ["Python"]}
+
+def test_running_totals_match_the_table(tmp_path):
+    cache = ParseCache(str(tmp_path / "parses.sqlite3"))
+    for i in range(20):
+        cache.put(f"k{i % 7}", {"text": "x" * i})
+    assert (cache._count, cache._bytes) == tuple(cache._totals())
+    assert cache.stats()["entries"] == 7
+
+    reopened = ParseCache(str(tmp_path / "parses.sqlite3"))
+    assert (reopened._count, reopened._bytes) == (cache._count, cache._bytes)
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / "parses.sqlite3"), max_entries=10)
+    for i in range(10):
+        cache.put(f"k{i}", {"i": i})
+    cache.get("k0")  # now the most recently used
+    cache.put("k10", {"i": 10})
+
+    assert cache.stats()["entries"] <= 10
+    assert cache.get("k0") == {"i": 0}
+    assert cache.get("k10") == {"i": 10}
+    assert cache.get("k1") is None
+
+def test_embedding_cache_by_model(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    vectors = np.eye(3, dtype=np.float32)
+    cache.put_many(["a", "b", "c"], vectors, "model-1")
+
+    found = cache.get_many(["a", "c", "d"], "model-1")
+    assert sorted(found) == ["a", "c"]
+    np.testing.assert_array_equal(found["c"], vectors[2])
+    assert cache.get_many(["a"], "model-2") == {}
+
+def test_unwritable_folder_disables_the_cache(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(ParseCache.__init__, "__defaults__", (str(blocker / "sub" / "parses.sqlite3"), 10, 1000))
+    monkeypatch.setattr(ParseCache, "_shared", None)
+    assert ParseCache.shared() is None
+
+def test_a_failing_parse_cache_does_not_fail_the_parse(monkeypatch):
+    monkeypatch.setattr(resume_parser, "get_parse_cache", LockedCache)
+    monkeypatch.setattr(async_api, "get_parse_cache", LockedCache)
+    monkeypatch.setattr(async_api, "PARSE_WORKERS", 0)
+
+    parsed = resume_parser.parse_resume(SAMPLE_RESUME, fields="fast")
+    assert "error" not in parsed and parsed["skills"]
+    assert resume_parser.parse_resumes([SAMPLE_RESUME], summarizer="extractive")[0]["text"] == parsed["text"]
+
+    with open(SAMPLE_RESUME, "rb") as f:
+        data = f.read()
+    assert asyncio.run(async_api.parse_resume_async(data, "resume.pdf", fields="fast")) == parsed
+
+def test_a_failing_embedding_cache_does_not_zero_the_score(embedder, monkeypatch):
+    resume = "Python developer building SQL data pipelines and machine learning models."
+    job = "Software engineer with Python, machine learning and SQL experience."
+    expected = resume_matcher.match_resume_to_job(resume, job)["score"]
+    assert expected > 0
+
+    monkeypatch.setattr(resume_matcher, "get_embedding_cache", LockedCache)
+    resume_matcher.split_windows.cache_clear()
+    assert resume_matcher.match_resume_to_job(resume, job)["score"] == expected
+
+def test_fallback_summaries_are_not_cached(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path / "parses.sqlite3"))
+    monkeypatch.setattr(resume_parser, "get_parse_cache", lambda: cache)
+    # BART failed to load: summaries come from the extractive backend
+    monkeypatch.setitem(models._MODELS, "summarizer", None)
+
+    parsed = resume_parser.parse_resume(SAMPLE_RESUME, summarizer="bart")
+    assert "error" not in parsed and parsed["summary"]
+    resume_parser.parse_resumes([SAMPLE_RESUME], summarizer="bart")
+    assert cache.stats()["entries"] == 0
+
+    resume_parser.parse_resume(SAMPLE_RESUME, summarizer="extractive")
+    assert cache.stats()["entries"] == 1
+
+def test_cache_key_covers_the_text_budgets(monkeypatch):
+    key = resume_parser._cache_key("digest", True, "extractive")
+    monkeypatch.setattr(resume_parser, "MAX_PDF_PAGES", resume_parser.MAX_PDF_PAGES + 1)
+    pages_key = resume_parser._cache_key("digest", True, "extractive")
+    monkeypatch.setattr(resume_parser, "MAX_TEXT_CHARS", resume_parser.MAX_TEXT_CHARS + 1)
+    chars_key = resume_parser._cache_key("digest", True, "extractive")
+    assert len({key, pages_key, chars_key}) == 3
@@ -0,0 +1,146 @@
+import io
+import random
+import sys
+import zipfile
+
+import pytest
+
+from backend.document import MAX_PDF_PAGES, detect_file_type, load_document
+from backend.resume_parser import parse_resume
+
+def _resume(pages, seed=0):
+    from benchmarks.corpus import make_resume
+    return make_resume(random.Random(seed), pages)
+
+def _pdf(pages, layout="single"):
+    pytest.importorskip("pymupdf")
+    from benchmarks.corpus import render_pdf
+    return render_pdf(_resume(pages), layout)
+
+def _docx(layout):
+    pytest.importorskip("docx")
+    from benchmarks.corpus import render_docx
+    return render_docx(_resume(1), layout)
+
+def _docx_from_body(body):
+    """A minimal DOCX whose document.xml holds the given body XML"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+            'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+            f'<w:body>{body}</w:body></w:document>'
+        ))
+    return buffer.getvalue()
+
+def _page_count(data):
+    import pymupdf
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return doc.page_count
+
+def test_sniffs_docx_and_rejects_other_zips():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", "<document/>")
+    assert detect_file_type(buffer.getvalue()) == ".docx"
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("notes.txt", "hello")
+    assert detect_file_type(buffer.getvalue()) is None
+
+def test_zip_signature_without_an_archive_is_unsupported():
+    data = b"PK\x03\x04" + b"\x00" * 64
+    assert detect_file_type(data) is None
+    assert parse_resume(data) == {"error": "Unsupported file format"}
+
+def test_parse_result_reports_truncation():
+    assert parse_resume(_pdf(1), fields="fast")["truncated"] is False
+
+    long_pdf = _pdf(2 * MAX_PDF_PAGES)
+    assert _page_count(long_pdf) > MAX_PDF_PAGES
+    parsed = parse_resume(long_pdf, fields="fast")
+    assert parsed["truncated"] is True
+    assert "error" not in parsed and parsed["text"]
+
+def test_pdf_page_budget():
+    data = _pdf(6)
+    page_count = _page_count(data)
+    assert page_count >= 3
+
+    document = load_document(data, "resume.pdf", max_pages=2)
+    assert len(document.pages) == 2 and document.truncated
+    assert {line.page for line in document.lines} == {1, 2}
+
+    whole = load_document(data, "resume.pdf", max_pages=page_count)
+    assert len(whole.pages) == page_count and not whole.truncated
+    assert whole.text.startswith(document.text)
+
+def test_pdf_text_budget_stops_after_the_page_that_crosses_it():
+    data = _pdf(6)
+    first_page = load_document(data, "resume.pdf", max_pages=1).text
+    document = load_document(data, "resume.pdf", max_chars=len(first_page) + 1)
+    assert len(document.pages) == 2 and document.truncated
+
+def test_pdf_early_stop():
+    seen = []
+
+    def stop_after_two_pages(lines):
+        seen.append(lines[0].page)
+        return len(seen) == 2
+
+    document = load_document(_pdf(6), "resume.pdf", should_stop=stop_after_two_pages)
+    assert seen == [1, 2]
+    assert len(document.pages) == 2 and document.truncated
+
+def test_pdf_without_pymupdf_reads_the_same_pages(monkeypatch):
+    data = _pdf(3)
+    fast = load_document(data, "resume.pdf", max_pages=2)
+    monkeypatch.setitem(sys.modules, "pymupdf", None)
+    plumber = load_document(data, "resume.pdf", max_pages=2)
+    assert len(plumber.pages) == 2 and plumber.truncated == fast.truncated
+    assert plumber.text.split() == fast.text.split()
+    assert plumber.links == fast.links
+
+def test_docx_header_comes_first_with_its_links():
+    resume = _resume(1)
+    document = load_document(_docx("single"), "resume.docx")
+    assert document.file_type == ".docx"
+    assert document.lines[0].text == f"{resume['name']} | {resume['email']} | {resume['phone']}"
+    assert document.links == [resume["linkedin"], resume["github"]]
+    assert [line.text for line in document.lines[1:4]] == ["LinkedIn", "GitHub", "Work Experience"]
+    assert document.lines[3].bold
+
+    parsed = parse_resume(_docx("single"), fields="fast")
+    assert (parsed["email"], parsed["linkedin"], parsed["github"]) == (
+        resume["email"], resume["linkedin"], resume["github"])
+
+def test_docx_table_cells_are_read_in_place():
+    resume = _resume(1)
+    document = load_document(_docx("table"), "resume.docx")
+    texts = [line.text for line in document.lines]
+    assert texts[:2] == [resume["name"], f"{resume['email']} | {resume['phone']}"]
+    assert document.links == [resume["linkedin"], resume["github"]]
+    # The skills grid comes right after its heading, one cell per line
+    start = texts.index("Skills") + 1
+    assert texts[start:start + len(resume["skills"])] == resume["skills"]
+
+def test_docx_field_links_and_fallback_content():
+    data = _docx_from_body(
+        '<w:p><w:fldSimple w:instr=\' HYPERLINK "https://github.com/jane" \'>'
+        '<w:r><w:t>GitHub</w:t></w:r></w:fldSimple></w:p>'
+        '<w:p><w:r><w:instrText> HYPERLINK "https://www.linkedin.com/in/jane" </w:instrText></w:r>'
+        '<w:r><w:t>LinkedIn</w:t></w:r></w:p>'
+        '<mc:AlternateContent><mc:Choice><w:p><w:r><w:t>Text box</w:t></w:r></w:p></mc:Choice>'
+        '<mc:Fallback><w:p><w:r><w:t>Text box</w:t></w:r></w:p></mc:Fallback></mc:AlternateContent>'
+    )
+    document = load_document(data)
+    assert [line.text for line in document.lines] == ["GitHub", "LinkedIn", "Text box"]
+    assert document.links == ["https://github.com/jane", "https://www.linkedin.com/in/jane"]
+
+def test_docx_text_budget():
+    body = "".join(f"<w:p><w:r><w:t>Paragraph number {i}</w:t></w:r></w:p>" for i in range(100))
+    document = load_document(_docx_from_body(body), max_chars=100)
+    assert document.truncated
+    assert 100 <= len(document.text) + 1 < 130
+    assert not load_document(_docx_from_body(body)).truncated
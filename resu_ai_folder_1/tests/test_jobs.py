@@ -0,0 +1,52 @@
+import threading
+import time
+
+import pytest
+
+from backend.jobs import JobQueue, QueueFull
+
+def _blocked(release):
+    def run(value):
+        release.wait(5)
+        return {"value": value}
+    return run
+
+def test_full_queue_pushes_back():
+    release = threading.Event()
+    jobs = JobQueue(workers=1, max_pending=2)
+    work = _blocked(release)
+
+    running = jobs.submit(work, 0)
+    # Wait until the worker has taken the first job, so the queue is empty
+    while jobs.get(running).status != "running":
+        time.sleep(0.01)
+    waiting = [jobs.submit(work, i) for i in (1, 2)]
+    assert jobs.pending() == 2
+
+    with pytest.raises(QueueFull):
+        jobs.submit(work, 3)
+    # The rejected job is not kept around to be polled
+    assert len(jobs._jobs) == 3
+
+    release.set()
+    for job_id in [running] + waiting:
+        assert jobs.get(job_id).done.wait(5)
+    assert [jobs.get(job_id).to_dict()["result"] for job_id in waiting] == [{"value": 1}, {"value": 2}]
+    # Capacity is back once the backlog drains
+    assert jobs.get(jobs.submit(work, 4)).done.wait(5)
+
+def test_failed_jobs_report_their_error():
+    jobs = JobQueue(workers=1)
+    job = jobs.get(jobs.submit(lambda: 1 / 0))
+    assert job.done.wait(5)
+    data = job.to_dict()
+    assert data["status"] == "failed" and data["error"] == "division by zero"
+    assert "run_seconds" in data["timings"] and "result" not in data
+
+def test_finished_jobs_expire():
+    jobs = JobQueue(workers=1, result_ttl=0.0)
+    first = jobs.submit(dict, value=1)
+    assert jobs.get(first).done.wait(5)
+    time.sleep(0.01)
+    jobs.submit(dict, value=2)
+    assert jobs.get(first) is None
@@ -0,0 +1,30 @@
+import os
+
+from backend.onnx_embedder import INT8_FILE, _install_export
+
+def _export(tmp_path, name, tag):
+    path = tmp_path / name
+    path.mkdir()
+    (path / INT8_FILE).write_text(tag)
+    return str(path)
+
+def test_first_finished_export_wins(tmp_path):
+    model_dir = str(tmp_path / "model")
+    first, second = _export(tmp_path, "a.tmp", "first"), _export(tmp_path, "b.tmp", "second")
+
+    _install_export(first, model_dir, INT8_FILE)
+    _install_export(second, model_dir, INT8_FILE)
+
+    with open(os.path.join(model_dir, INT8_FILE)) as f:
+        assert f.read() == "first"
+    assert not os.path.exists(first)
+
+def test_replaces_an_export_missing_the_model_file(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    (model_dir / "model.onnx").write_text("fp32 only")
+
+    _install_export(_export(tmp_path, "a.tmp", "int8"), str(model_dir), INT8_FILE)
+
+    assert (model_dir / INT8_FILE).read_text() == "int8"
+    assert sorted(os.listdir(tmp_path)) == ["model"]
@@ -0,0 +1,73 @@
+from backend import resume_matcher
+from backend.resume_matcher import encode_long_texts, match_many, match_resume_to_job, resume_sections
+from backend.resume_parser import parse_resume
+
+from conftest import SAMPLE_RESUME
+
+JOB = "Software engineer with Python, machine learning and SQL experience to build data pipelines."
+
+def test_resume_sections_are_text():
+    sections = resume_sections({"skills": ["Python", "SQL"], "education": "BSc", "projects": None})
+    assert sections["skills"] == "Python, SQL"
+    assert sections["projects"] == ""
+    assert all(isinstance(content, str) for content in sections.values())
+    assert resume_sections({"skills": ["No Skills Found"]})["skills"] == ""
+
+def test_section_pooling_scores_a_parsed_resume(embedder, monkeypatch):
+    parsed = parse_resume(SAMPLE_RESUME, fields="fast")
+    assert "error" not in parsed
+    sections = resume_sections(parsed)
+
+    vector = encode_long_texts([parsed["text"]], [sections], pooling="section")[0]
+    assert vector.any()
+
+    monkeypatch.setattr(resume_matcher, "POOLING", "section")
+    result = match_resume_to_job(parsed["text"], JOB, sections)
+    assert 0.0 < result["score"] <= 1.0
+
+RESUMES = [
+    "Python developer building SQL data pipelines and machine learning models.",
+    "Java backend engineer working with Docker and Kubernetes.",
+    "Data scientist using Python, SQL, Pandas and machine learning.",
+    "Graphic designer skilled in Photoshop and branding.",
+    "",
+]
+JOBS = [JOB, "Backend engineer with Java, Docker and Kubernetes experience."]
+
+def test_match_many_scores_every_pair_in_one_encode(embedder, monkeypatch):
+    calls = []
+    encode = embedder.encode
+    monkeypatch.setattr(embedder, "encode", lambda texts, **kwargs: calls.append(len(texts)) or encode(texts))
+
+    ranked = match_many(RESUMES, JOBS)
+    assert len(calls) == 1
+    assert [entry["job_index"] for entry in ranked] == [0, 1]
+    for entry in ranked:
+        assert sorted(hit["resume_index"] for hit in entry["results"]) == list(range(len(RESUMES)))
+        scores = [hit["score"] for hit in entry["results"]]
+        assert scores == sorted(scores, reverse=True)
+        for hit in entry["results"]:
+            single = match_resume_to_job(RESUMES[hit["resume_index"]], JOBS[entry["job_index"]])
+            assert abs(hit["score"] - single["score"]) < 1e-5
+            assert sorted(hit["matched_skills"]) == sorted(single["matched_skills"])
+    assert ranked[1]["results"][0]["resume_index"] == 1
+
+def test_match_many_top_k(embedder):
+    full = match_many(RESUMES, JOBS)
+    top = match_many(RESUMES, JOBS, top_k=2)
+    for full_entry, top_entry in zip(full, top):
+        assert top_entry["results"] == full_entry["results"][:2]
+
+def test_match_many_required_skills_prefilter(embedder, monkeypatch):
+    calls = []
+    encode = embedder.encode
+    monkeypatch.setattr(embedder, "encode", lambda texts, **kwargs: calls.append(list(texts)) or encode(texts))
+
+    ranked = match_many(RESUMES, JOBS, required_skills=["Python", "SQL"])
+    for entry in ranked:
+        assert sorted(hit["resume_index"] for hit in entry["results"]) == [0, 2]
+    # Filtered-out resumes are never encoded
+    assert not any("designer" in text or "java backend" in text for text in calls[0])
+
+    ranked = match_many(RESUMES, JOBS, required_skills=["Python", "Docker"], min_skills=1)
+    assert sorted(hit["resume_index"] for hit in ranked[0]["results"]) == [0, 1, 2]
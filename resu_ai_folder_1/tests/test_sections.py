@@ -0,0 +1,56 @@
+from backend.document import TextLine
+from backend.sections import SectionTracker, classify_header, segment_sections
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 123 4567
+Relevant Work Experience:
+Data Engineer, Acme (2020 - 2024)
+Led education outreach at the university.
+Educaton
+B.Sc. in Statistics, State University
+Achievements
+Won the regional hackathon
+TECHNICAL SKILLS
+Python, SQL, Docker
+"""
+
+def test_segments_every_section_in_one_pass():
+    sections = segment_sections(RESUME)
+    assert sections == {
+        "work_experience": "Data Engineer, Acme (2020 - 2024)\nLed education outreach at the university.",
+        "education": "B.Sc. in Statistics, State University",
+        "projects": "No Data",
+        "certifications": "No Data",
+        "skills": "Python, SQL, Docker",
+    }
+
+def test_header_shapes():
+    assert classify_header("Relevant Work Experience:") == "work_experience"
+    assert classify_header("Projects") == "projects"
+    # Misspelt headers need header styling: title case, upper case, a colon or emphasis
+    assert classify_header("Educaton") == "education"
+    assert classify_header("educaton") is None
+    assert classify_header("educaton", emphasized=True) == "education"
+    # Content lines mentioning a keyword are not headers
+    assert classify_header("Led education outreach at the university.") is None
+    assert classify_header("skills@example.com") is None
+
+def test_font_size_marks_headers():
+    lines = [
+        TextLine("experiance", 1, font_size=14.0),
+        TextLine("Built an ETL platform", 1, font_size=10.0),
+        TextLine("certifcations", 1, font_size=10.0),
+        TextLine("Shipped CI/CD workflows", 1, font_size=10.0),
+    ]
+    sections = segment_sections(lines)
+    # The small misspelt line is body text, not a header
+    assert sections["work_experience"] == "Built an ETL platform\ncertifcations\nShipped CI/CD workflows"
+    assert sections["certifications"] == "No Data"
+
+def test_tracker_completes_once_every_wanted_section_is_followed():
+    tracker = SectionTracker(["work_experience", "education"])
+    assert not tracker.feed(["Experience", "Data Engineer", "Education", "B.Sc."])
+    assert tracker.feed(["Skills", "Python"])
+
+    everything = SectionTracker()
+    assert not everything.feed(RESUME.split("\n"))
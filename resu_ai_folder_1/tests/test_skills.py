@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from backend import skills
+from backend.resume_matcher import get_matched_skills
+from backend.skill_index import SkillIndex
+
+@pytest.fixture
+def taxonomy_file(tmp_path):
+    path = tmp_path / "taxonomy.json"
+
+    def write(version, names):
+        path.write_text(json.dumps({
+            "version": version,
+            "skills": [{"name": name, "category": "Test", "aliases": []} for name in names],
+        }))
+        return str(path)
+
+    yield write
+    skills.reload_taxonomy(skills.TAXONOMY_PATH)
+
+def test_job_skills_follow_a_reloaded_taxonomy(taxonomy_file):
+    job = "We need Python and Rust engineers."
+    skills.reload_taxonomy(taxonomy_file("1", ["Python"]))
+    assert get_matched_skills("Python and Rust", job) == ["Python"]
+
+    skills.reload_taxonomy(taxonomy_file("2", ["Python", "Rust"]))
+    assert get_matched_skills("Python and Rust", job) == ["Python", "Rust"]
+
+def test_skill_index_canonicalizes_added_skills():
+    index = SkillIndex()
+    index.add(0, ["NLP", "python"])
+    index.add(1, ["Natural Language Processing"])
+
+    assert list(index.postings("NLP")) == [0, 1]
+    assert list(index.query(["natural language processing", "Python"])) == [0]
+    assert list(index.query(["nlp", "Python"], min_count=1)) == [0, 1]
+    assert "Natural Language Processing" in index.skills()
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from backend import stage_pool
+from backend.instrumentation import collect_timings
+from backend.resume_parser import STAGE_DEPENDENCIES, parse_resume, plan_stages, resolve_fields
+from backend.stage_pool import run_stages
+
+from conftest import SAMPLE_RESUME
+
+CONFIGURED_THREADS = stage_pool.STAGE_THREADS
+
+@pytest.fixture(params=[1, 4], ids=["inline", "pool"])
+def stage_threads(request):
+    original = stage_pool.STAGE_THREADS
+    stage_pool.set_stage_threads(request.param)
+    yield request.param
+    stage_pool.set_stage_threads(original)
+
+def _recording_stages(names, log, delay=0.0):
+    lock = threading.Lock()
+
+    def make(name):
+        def run():
+            with lock:
+                log.append(("start", name))
+            time.sleep(delay)
+            with lock:
+                log.append(("end", name))
+            return name.upper()
+        return run
+    return {name: make(name) for name in names}
+
+def test_stages_start_after_their_dependencies(stage_threads):
+    log = []
+    dependencies = {"b": ("a",), "c": ("a",), "d": ("b", "c"), "e": ()}
+    results = run_stages(_recording_stages("abcde", log, delay=0.01), dependencies)
+
+    assert results == {name: name.upper() for name in "abcde"}
+    position = {event: i for i, event in enumerate(log)}
+    for name, deps in dependencies.items():
+        for dep in deps:
+            assert position[("end", dep)] < position[("start", name)]
+
+def test_dependencies_outside_the_plan_count_as_done(stage_threads):
+    log = []
+    assert run_stages(_recording_stages("b", log), {"b": ("a",)}) == {"b": "B"}
+
+def test_a_failing_stage_is_raised_and_its_dependents_never_run(stage_threads):
+    log = []
+    stages = _recording_stages("acd", log)
+
+    def fail():
+        raise RuntimeError("stage b failed")
+    stages["b"] = fail
+
+    with pytest.raises(RuntimeError, match="stage b failed"):
+        run_stages(stages, {"b": ("a",), "c": ("b",), "d": ()})
+    assert ("start", "c") not in log
+
+def test_nested_runs_inside_pool_threads_finish(stage_threads):
+    def inner():
+        return run_stages({"x": lambda: 1, "y": lambda: 2, "z": lambda: 3}, {"z": ("x", "y")})
+    outer = run_stages({f"outer{i}": inner for i in range(8)}, {})
+    assert all(result == {"x": 1, "y": 2, "z": 3} for result in outer.values())
+
+@pytest.mark.parametrize("fields, expected", [
+    ({"text"}, ("extract_text",)),
+    ("match", ("extract_text", "extract_skills")),
+    ({"email", "github"}, ("extract_text", "extract_links", "extract_contacts")),
+    ({"summary"}, ("extract_text", "extract_sections", "summarize")),
+    ("full", tuple(STAGE_DEPENDENCIES)),
+])
+def test_plan_stages(fields, expected):
+    assert plan_stages(resolve_fields(fields)) == expected
+
+@pytest.mark.parametrize("fields", ["match", "fast", {"email", "projects"}, {"summary"}])
+def test_only_planned_stages_run(fields, stage_threads):
+    with collect_timings() as timings:
+        parsed = parse_resume(SAMPLE_RESUME, summarizer="extractive", fields=fields)
+
+    assert set(parsed) == set(resolve_fields(fields))
+    ran = {name for name in timings if name in STAGE_DEPENDENCIES}
+    assert ran == set(plan_stages(resolve_fields(fields)))
+
+def test_stage_threads_fixture_restores_the_setting():
+    # Runs after the parametrized tests above, in file order
+    assert stage_pool.STAGE_THREADS == CONFIGURED_THREADS
@@ -0,0 +1,82 @@
+import pytest
+
+from backend import models, summarization
+from backend.summarization import SUMMARY_NOT_AVAILABLE, SUMMARIZERS, chunk_text
+
+class WordTokenizer:
+    """One token id per whitespace-separated word"""
+
+    def __init__(self):
+        self.vocab = {}
+
+    def _ids(self, text):
+        return [self.vocab.setdefault(word, len(self.vocab)) for word in text.split()]
+
+    def __call__(self, texts, add_special_tokens=False):
+        return {"input_ids": [self._ids(text) for text in texts]}
+
+    def decode(self, ids, skip_special_tokens=True):
+        words = {i: word for word, i in self.vocab.items()}
+        return " ".join(words[i] for i in ids)
+
+class StubPipeline:
+    """A summarization pipeline answering every chunk with the same text"""
+
+    def __init__(self, summary):
+        self.summary = summary
+        self.tokenizer = WordTokenizer()
+        self.calls = 0
+
+    def __call__(self, chunks, **kwargs):
+        self.calls += 1
+        return [{"summary_text": self.summary} for _ in chunks]
+
+def _section(word, count):
+    return " ".join(f"{word}{i}" for i in range(count))
+
+@pytest.fixture
+def stub_bart(monkeypatch):
+    def install(summary):
+        pipeline = StubPipeline(summary)
+        monkeypatch.setitem(models._MODELS, "summarizer", pipeline)
+        return pipeline
+    return install
+
+def test_chunk_text_packs_whole_sections():
+    tokenizer = WordTokenizer()
+    sections = {"work_experience": _section("w", 40), "education": _section("e", 40),
+                "projects": _section("p", 40), "certifications": "No Data"}
+    chunks = chunk_text("ignored", tokenizer, sections, max_tokens=100)
+    assert chunks == [
+        f"Work experience: {sections['work_experience']} Education: {sections['education']}",
+        f"Projects: {sections['projects']}",
+    ]
+
+def test_chunk_text_cuts_an_oversized_section_into_windows():
+    tokenizer = WordTokenizer()
+    chunks = chunk_text("ignored", tokenizer, {"projects": _section("p", 250)}, max_tokens=100)
+    assert [len(chunk.split()) for chunk in chunks] == [100, 100, 51]
+    assert chunks[0].startswith("Projects: p0")
+
+def test_chunk_text_falls_back_to_sentences_without_contact_details():
+    text = "Reach me at jane@example.com or +1 555 123 4567. Built pipelines in Python. Led a team of four."
+    chunks = chunk_text(text, WordTokenizer(), max_tokens=8)
+    assert [chunk.split() for chunk in chunks] == [
+        ["Reach", "me", "at", "or", "."], ["Built", "pipelines", "in", "Python."], ["Led", "a", "team", "of", "four."],
+    ]
+    assert chunk_text("  ", WordTokenizer()) == []
+
+def test_blank_chunk_summaries_end_the_reduce(stub_bart):
+    stub_bart("   ")
+    sections = {"work_experience": _section("w", 600), "projects": _section("p", 600)}
+    summary = SUMMARIZERS["bart"].summarize_batch(["text"], [sections])
+    assert summary == [SUMMARY_NOT_AVAILABLE]
+
+def test_reduce_rounds_are_capped(stub_bart, monkeypatch):
+    # Every summary is as long as a chunk, so the reduce never converges
+    pipeline = stub_bart(_section("s", 500))
+    monkeypatch.setattr(summarization, "MAX_REDUCE_ROUNDS", 2)
+    sections = {"work_experience": _section("w", 600), "projects": _section("p", 600)}
+    summary = SUMMARIZERS["bart"].summarize_batch(["text"], [sections])[0]
+    assert pipeline.calls == 3
+    assert summary.split() == _section("s", 500).split() * 2
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+from backend import vector_index
+from backend.vector_index import CENTROIDS_FILE, LISTS_FILE, META_FILE, VECTORS_FILE, ResumeIndex
+
+def _clustered(count, dim=32, clusters=64, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    vectors = centers[rng.integers(clusters, size=count)] + 0.3 * rng.normal(size=(count, dim))
+    return vectors.astype(np.float32)
+
+def test_round_trip(tmp_path):
+    vectors = _clustered(50)
+    index = ResumeIndex(str(tmp_path))
+    index.add([f"r{i}" for i in range(50)], vectors, [["Python"] if i % 2 else ["SQL"] for i in range(50)])
+
+    reopened = ResumeIndex(str(tmp_path))
+    assert len(reopened) == 50 and reopened.dim == 32
+    hit = reopened.search(vectors[7], top_k=1)[0]
+    assert (hit["key"], hit["skills"]) == ("r7", ["Python"])
+    assert hit["score"] > 0.999
+    assert list(reopened.filter(["SQL"]))[:3] == [0, 2, 4]
+
+def test_newer_row_supersedes_a_key(tmp_path):
+    vectors = _clustered(3)
+    index = ResumeIndex(str(tmp_path))
+    index.add(["a", "b"], vectors[:2])
+    index.add(["a"], vectors[2:])
+
+    assert len(index) == 2
+    keys = [hit["key"] for hit in ResumeIndex(str(tmp_path)).search(vectors[0], top_k=5)]
+    assert sorted(keys) == ["a", "b"]
+
+def test_reopen_drops_a_partial_write(tmp_path):
+    vectors = _clustered(20)
+    index = ResumeIndex(str(tmp_path))
+    index.add([f"r{i}" for i in range(10)], vectors[:10])
+    sizes = {name: os.path.getsize(tmp_path / name) for name in (VECTORS_FILE, LISTS_FILE, META_FILE)}
+
+    # A writer that died after appending rows but before updating the header
+    with open(tmp_path / VECTORS_FILE, "ab") as f:
+        vectors[10:13].tofile(f)
+        f.write(b"\x00\x01")
+    with open(tmp_path / LISTS_FILE, "ab") as f:
+        f.write(b"\xff" * 6)
+    with open(tmp_path / META_FILE, "a", encoding="utf-8") as f:
+        f.write('{"key": "r10", "skills": []}\n{"key": "r1')
+
+    reopened = ResumeIndex(str(tmp_path))
+    assert len(reopened) == 10
+    assert {name: os.path.getsize(tmp_path / name) for name in sizes} == sizes
+
+    reopened.add([f"r{i}" for i in range(10, 20)], vectors[10:])
+    again = ResumeIndex(str(tmp_path))
+    assert len(again) == 20
+    assert again.search(vectors[15], top_k=1)[0]["key"] == "r15"
+
+def test_ivf_recall_against_brute_force(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_index, "MIN_TRAIN_SIZE", 1000)
+    vectors = _clustered(3000)
+    index = ResumeIndex(str(tmp_path))
+    for start in range(0, 3000, 500):
+        index.add([f"r{i}" for i in range(start, start + 500)], vectors[start:start + 500])
+    assert index.centroids is not None
+    assert os.path.exists(tmp_path / CENTROIDS_FILE)
+
+    index = ResumeIndex(str(tmp_path))
+    queries = _clustered(50, seed=1)
+    recalls = []
+    for query in queries:
+        exact = {hit["id"] for hit in index.search(query, top_k=10, exact=True)}
+        approximate = {hit["id"] for hit in index.search(query, top_k=10, nprobe=8)}
+        recalls.append(len(exact & approximate) / 10)
+    assert np.mean(recalls) >= 0.9
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    brute = np.argsort(-(normalized @ (queries[0] / np.linalg.norm(queries[0]))))[:10]
+    assert [hit["id"] for hit in index.search(queries[0], top_k=10, exact=True)] == list(brute)